@@ -2,7 +2,7 @@ import os
 import sys
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 from alembic import context
 
@@ -47,6 +47,15 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _include_object_excluding(partitions: set[str]):
+    """Skip table partitions, which migrations and tasks create outside the models."""
+
+    def include_object(obj, name, type_, reflected, compare_to):
+        return not (type_ == "table" and reflected and name in partitions)
+
+    return include_object
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
@@ -61,7 +70,16 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        partitions = set(
+            connection.execute(text("SELECT relname FROM pg_class WHERE relispartition")).scalars()
+        )
+        # End the implicit transaction so Alembic starts and owns its own.
+        connection.rollback()
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=_include_object_excluding(partitions),
+        )
 
         with context.begin_transaction():
             context.run_migrations()
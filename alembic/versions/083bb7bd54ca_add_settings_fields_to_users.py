@@ -10,6 +10,12 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    run_with_lock_timeout,
+)
+
 
 # revision identifiers, used by Alembic.
 revision: str = '083bb7bd54ca'
@@ -19,20 +25,30 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column('users', sa.Column('avatar_url', sa.String(), nullable=True))
-    op.add_column('users', sa.Column('password_changed_at', sa.DateTime(), nullable=True))
-    op.add_column('users', sa.Column('totp_secret', sa.String(), nullable=True))
-    op.add_column('users', sa.Column('totp_enabled', sa.Boolean(), nullable=False, server_default=sa.text('false')))
-    op.add_column('users', sa.Column('stripe_customer_id', sa.String(), nullable=True))
-    op.add_column('users', sa.Column('notification_preferences', sa.JSON(), nullable=True))
-    op.create_index(op.f('ix_users_stripe_customer_id'), 'users', ['stripe_customer_id'], unique=False)
+    # Single ALTER TABLE so the users table is locked and touched only once.
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE users "
+            "ADD COLUMN avatar_url VARCHAR, "
+            "ADD COLUMN password_changed_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN totp_secret VARCHAR, "
+            "ADD COLUMN totp_enabled BOOLEAN NOT NULL DEFAULT false, "
+            "ADD COLUMN stripe_customer_id VARCHAR, "
+            "ADD COLUMN notification_preferences JSON"
+        )
+    )
+    op.execute("ANALYZE users")
+    create_index_concurrently('ix_users_stripe_customer_id', 'users', ['stripe_customer_id'])
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_users_stripe_customer_id'), table_name='users')
-    op.drop_column('users', 'notification_preferences')
-    op.drop_column('users', 'stripe_customer_id')
-    op.drop_column('users', 'totp_enabled')
-    op.drop_column('users', 'totp_secret')
-    op.drop_column('users', 'password_changed_at')
-    op.drop_column('users', 'avatar_url')
+    drop_index_concurrently('ix_users_stripe_customer_id')
+    op.execute(
+        "ALTER TABLE users "
+        "DROP COLUMN notification_preferences, "
+        "DROP COLUMN stripe_customer_id, "
+        "DROP COLUMN totp_enabled, "
+        "DROP COLUMN totp_secret, "
+        "DROP COLUMN password_changed_at, "
+        "DROP COLUMN avatar_url"
+    )
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import run_with_lock_timeout
+
 
 # revision identifiers, used by Alembic.
 revision: str = '3b5d647aeaf0'
@@ -20,20 +22,24 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Make mux_playback_id nullable in lessons table
-    op.alter_column(
-        'lessons',
-        'mux_playback_id',
-        existing_type=sa.String(),
-        nullable=True
+    run_with_lock_timeout(
+        lambda: op.alter_column(
+            'lessons',
+            'mux_playback_id',
+            existing_type=sa.String(),
+            nullable=True
+        )
     )
 
 
 def downgrade() -> None:
     # Revert mux_playback_id to not nullable
     # Note: This might fail if there are lessons without mux_playback_id
-    op.alter_column(
-        'lessons',
-        'mux_playback_id',
-        existing_type=sa.String(),
-        nullable=False
+    run_with_lock_timeout(
+        lambda: op.alter_column(
+            'lessons',
+            'mux_playback_id',
+            existing_type=sa.String(),
+            nullable=False
+        )
     )
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import batched_update, run_with_lock_timeout, vacuum_analyze
+
 
 # revision identifiers, used by Alembic.
 revision: str = '49f335edbf16'
@@ -29,11 +31,23 @@ def upgrade() -> None:
     )
     lesson_status_enum.create(op.get_bind(), checkfirst=True)
 
-    # Add status column to lessons table with default value 'available'
-    op.add_column(
-        'lessons',
-        sa.Column('status', lesson_status_enum, nullable=False, server_default='available')
-    )
+    # Add status column to lessons table with default value 'available'.
+    # The column is added nullable, existing rows are backfilled in small
+    # batches and NOT NULL is set afterwards, so lessons is never held under
+    # an exclusive lock for a full-table rewrite.
+    def add_status_column() -> None:
+        op.add_column('lessons', sa.Column('status', lesson_status_enum, nullable=True))
+        op.alter_column('lessons', 'status', server_default='available')
+
+    run_with_lock_timeout(add_status_column)
+
+    batched_update('lessons', "status = 'available'", where_sql='status IS NULL')
+
+    run_with_lock_timeout(lambda: op.alter_column('lessons', 'status', nullable=False))
+
+    # The backfill left a dead version of every lesson row and no statistics
+    # for the new column.
+    vacuum_analyze('lessons')
 
 
 def downgrade() -> None:
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import batched_update, run_with_lock_timeout, vacuum_analyze
+
 
 # revision identifiers, used by Alembic.
 revision: str = '630ba6f0f48a'
@@ -19,8 +21,19 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.drop_column('lessons', 'is_preview')
+    run_with_lock_timeout(lambda: op.drop_column('lessons', 'is_preview'))
 
 
 def downgrade() -> None:
-    op.add_column('lessons', sa.Column('is_preview', sa.BOOLEAN(), nullable=False, server_default='false'))
+    # Add nullable, backfill in batches, then enforce NOT NULL to avoid
+    # rewriting lessons under an exclusive lock.
+    def add_is_preview_column() -> None:
+        op.add_column('lessons', sa.Column('is_preview', sa.BOOLEAN(), nullable=True))
+        op.alter_column('lessons', 'is_preview', server_default='false')
+
+    run_with_lock_timeout(add_is_preview_column)
+
+    batched_update('lessons', "is_preview = false", where_sql='is_preview IS NULL')
+
+    run_with_lock_timeout(lambda: op.alter_column('lessons', 'is_preview', nullable=False))
+    vacuum_analyze('lessons')
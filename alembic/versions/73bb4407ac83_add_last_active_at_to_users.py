@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = '73bb4407ac83'
@@ -20,9 +22,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     op.add_column('users', sa.Column('last_active_at', sa.DateTime(), nullable=True))
-    op.create_index(op.f('ix_users_last_active_at'), 'users', ['last_active_at'], unique=False)
+    create_index_concurrently('ix_users_last_active_at', 'users', ['last_active_at'])
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_users_last_active_at'), table_name='users')
+    drop_index_concurrently('ix_users_last_active_at')
     op.drop_column('users', 'last_active_at')
@@ -0,0 +1,48 @@
+"""Store community thread status and category as native enums
+
+Revision ID: a6b7c8d9e0f1
+Revises: z5a6b7c8d9e0
+Create Date: 2026-02-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import run_with_lock_timeout
+
+# revision identifiers, used by Alembic.
+revision: str = "a6b7c8d9e0f1"
+down_revision: str = "z5a6b7c8d9e0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TYPE thread_status AS ENUM ('open', 'resolved', 'closed')")
+    op.execute("CREATE TYPE thread_category AS ENUM ('pomoc', 'showcase', 'pomysly', 'ogolne')")
+
+    run_with_lock_timeout(lambda: _convert_columns("thread_status", "thread_category"))
+
+
+def downgrade() -> None:
+    run_with_lock_timeout(lambda: _convert_columns("VARCHAR(20)", "VARCHAR(20)"))
+
+    op.execute("DROP TYPE thread_category")
+    op.execute("DROP TYPE thread_status")
+
+
+def _convert_columns(status_type: str, category_type: str) -> None:
+    # Both columns are rewritten in a single ALTER so the table is scanned once.
+    # The partial index predicate has to be rebuilt against the new type: the
+    # text cast it carries for VARCHAR is not immutable for an enum.
+    op.execute("DROP INDEX ix_community_threads_open")
+    op.execute(
+        "ALTER TABLE community_threads "
+        f"ALTER COLUMN status TYPE {status_type} USING status::text::{status_type}, "
+        f"ALTER COLUMN category TYPE {category_type} USING category::text::{category_type}"
+    )
+    op.execute(
+        "CREATE INDEX ix_community_threads_open "
+        "ON community_threads (created_at) WHERE status = 'open'"
+    )
@@ -0,0 +1,59 @@
+"""Extend the statistics list indexes with id for keyset pagination
+
+Revision ID: a7b8c9d0e1f2
+Revises: f1a2b3c4d5e6
+Create Date: 2026-02-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import (
+    ConcurrentIndex,
+    create_indexes_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: str = "f1a2b3c4d5e6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The list endpoints page by (timestamp, id) < (:position, :id) in descending
+# order; with id as the second key column the whole comparison is an index
+# bound and ties on the timestamp need no sort.
+KEYSET_INDEXES = [
+    ConcurrentIndex(
+        "ix_enrollments_completed_at_id",
+        "enrollments",
+        ["completed_at", "id"],
+        where="completed_at IS NOT NULL",
+    ),
+    ConcurrentIndex("ix_certificates_issued_at_id", "certificates", ["issued_at", "id"]),
+    ConcurrentIndex("ix_users_created_at_id", "users", ["created_at", "id"]),
+]
+
+TIMESTAMP_INDEXES = [
+    ConcurrentIndex(
+        "ix_enrollments_completed_at",
+        "enrollments",
+        ["completed_at"],
+        where="completed_at IS NOT NULL",
+    ),
+    ConcurrentIndex("ix_certificates_issued_at", "certificates", ["issued_at"]),
+    ConcurrentIndex("ix_users_created_at", "users", ["created_at"]),
+]
+
+
+def upgrade() -> None:
+    create_indexes_concurrently(KEYSET_INDEXES)
+    for index in TIMESTAMP_INDEXES:
+        drop_index_concurrently(index.index_name)
+
+
+def downgrade() -> None:
+    create_indexes_concurrently(TIMESTAMP_INDEXES)
+    for index in KEYSET_INDEXES:
+        drop_index_concurrently(index.index_name)
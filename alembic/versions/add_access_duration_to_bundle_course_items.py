@@ -1,7 +1,7 @@
 """Add access_duration_days to bundle_course_items
 
 Revision ID: d4e5f6g7h8i9
-Revises: b5a4773e1df5
+Revises: c3d4e5f6g7h8
 Create Date: 2026-01-27
 
 """
@@ -11,6 +11,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "e5f6g7h8i9j0"
@@ -24,9 +26,9 @@ def upgrade() -> None:
         "courses",
         sa.Column("content_type", sa.String(), nullable=False, server_default="course"),
     )
-    op.create_index("ix_courses_content_type", "courses", ["content_type"])
+    create_index_concurrently("ix_courses_content_type", "courses", ["content_type"])
 
 
 def downgrade() -> None:
-    op.drop_index("ix_courses_content_type", table_name="courses")
+    drop_index_concurrently("ix_courses_content_type")
     op.drop_column("courses", "content_type")
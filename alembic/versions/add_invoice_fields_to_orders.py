@@ -10,6 +10,12 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    run_with_lock_timeout,
+)
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'a8b9c0d1e2f3'
@@ -19,36 +25,42 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Invoice fields (Fakturownia integration)
-    op.add_column('orders', sa.Column('fakturownia_invoice_id', sa.Integer(), nullable=True))
-    op.add_column('orders', sa.Column('invoice_number', sa.String(), nullable=True))
-    op.add_column('orders', sa.Column('invoice_token', sa.String(), nullable=True))
-    op.add_column('orders', sa.Column('invoice_issued_at', sa.DateTime(), nullable=True))
-
-    # Buyer billing information (for B2B invoices)
-    op.add_column('orders', sa.Column('buyer_tax_no', sa.String(), nullable=True))
-    op.add_column('orders', sa.Column('buyer_company_name', sa.String(), nullable=True))
-    op.add_column('orders', sa.Column('buyer_street', sa.String(), nullable=True))
-    op.add_column('orders', sa.Column('buyer_post_code', sa.String(), nullable=True))
-    op.add_column('orders', sa.Column('buyer_city', sa.String(), nullable=True))
+    # Invoice fields (Fakturownia integration) and buyer billing information
+    # (for B2B invoices), added in a single ALTER TABLE so orders is touched once.
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE orders "
+            "ADD COLUMN fakturownia_invoice_id INTEGER, "
+            "ADD COLUMN invoice_number VARCHAR, "
+            "ADD COLUMN invoice_token VARCHAR, "
+            "ADD COLUMN invoice_issued_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN buyer_tax_no VARCHAR, "
+            "ADD COLUMN buyer_company_name VARCHAR, "
+            "ADD COLUMN buyer_street VARCHAR, "
+            "ADD COLUMN buyer_post_code VARCHAR, "
+            "ADD COLUMN buyer_city VARCHAR"
+        )
+    )
+    # Give the planner statistics for the new columns before the first query.
+    op.execute("ANALYZE orders")
 
     # Index for invoice lookup
-    op.create_index(
-        op.f('ix_orders_fakturownia_invoice_id'),
-        'orders',
-        ['fakturownia_invoice_id'],
-        unique=False
+    create_index_concurrently(
+        'ix_orders_fakturownia_invoice_id', 'orders', ['fakturownia_invoice_id']
     )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_orders_fakturownia_invoice_id'), table_name='orders')
-    op.drop_column('orders', 'buyer_city')
-    op.drop_column('orders', 'buyer_post_code')
-    op.drop_column('orders', 'buyer_street')
-    op.drop_column('orders', 'buyer_company_name')
-    op.drop_column('orders', 'buyer_tax_no')
-    op.drop_column('orders', 'invoice_issued_at')
-    op.drop_column('orders', 'invoice_token')
-    op.drop_column('orders', 'invoice_number')
-    op.drop_column('orders', 'fakturownia_invoice_id')
+    drop_index_concurrently('ix_orders_fakturownia_invoice_id')
+    op.execute(
+        "ALTER TABLE orders "
+        "DROP COLUMN buyer_city, "
+        "DROP COLUMN buyer_post_code, "
+        "DROP COLUMN buyer_street, "
+        "DROP COLUMN buyer_company_name, "
+        "DROP COLUMN buyer_tax_no, "
+        "DROP COLUMN invoice_issued_at, "
+        "DROP COLUMN invoice_token, "
+        "DROP COLUMN invoice_number, "
+        "DROP COLUMN fakturownia_invoice_id"
+    )
@@ -9,7 +9,7 @@ Create Date: 2026-01-26
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
+from app.db.migration_helpers import run_with_lock_timeout
 
 
 # revision identifiers, used by Alembic.
@@ -20,12 +20,23 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("courses", sa.Column("learning_title", sa.String(), nullable=True))
-    op.add_column("courses", sa.Column("learning_description", sa.String(), nullable=True))
-    op.add_column("courses", sa.Column("learning_thumbnail_url", sa.String(), nullable=True))
+    # Single ALTER TABLE so the courses table is locked and touched only once.
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE courses "
+            "ADD COLUMN learning_title VARCHAR, "
+            "ADD COLUMN learning_description VARCHAR, "
+            "ADD COLUMN learning_thumbnail_url VARCHAR"
+        )
+    )
 
 
 def downgrade() -> None:
-    op.drop_column("courses", "learning_thumbnail_url")
-    op.drop_column("courses", "learning_description")
-    op.drop_column("courses", "learning_title")
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE courses "
+            "DROP COLUMN learning_thumbnail_url, "
+            "DROP COLUMN learning_description, "
+            "DROP COLUMN learning_title"
+        )
+    )
@@ -1,7 +1,7 @@
 """Add sales_page_sections JSONB column to courses
 
 Revision ID: b5a4773e1df5
-Revises: c3d4e5f6g7h8
+Revises: e5f6g7h8i9j0
 Create Date: 2026-01-27
 
 """
@@ -10,6 +10,12 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import (
+    add_foreign_key_not_valid,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'b3a1c7e9d402'
@@ -20,18 +26,19 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     op.add_column('notifications', sa.Column('announcement_log_id', sa.Uuid(), nullable=True))
-    op.create_foreign_key(
+    add_foreign_key_not_valid(
         'fk_notifications_announcement_log_id',
         'notifications',
+        'announcement_log_id',
         'announcement_logs',
-        ['announcement_log_id'],
-        ['id'],
         ondelete='SET NULL',
     )
-    op.create_index('ix_notifications_announcement_log_id', 'notifications', ['announcement_log_id'])
+    create_index_concurrently(
+        'ix_notifications_announcement_log_id', 'notifications', ['announcement_log_id']
+    )
 
 
 def downgrade() -> None:
-    op.drop_index('ix_notifications_announcement_log_id', table_name='notifications')
+    drop_index_concurrently('ix_notifications_announcement_log_id')
     op.drop_constraint('fk_notifications_announcement_log_id', 'notifications', type_='foreignkey')
     op.drop_column('notifications', 'announcement_log_id')
@@ -0,0 +1,36 @@
+"""Replace ix_conv_participants_user with a covering (user_id, conversation_id) index
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-02-16 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c8d9e0f1a2"
+down_revision: str = "a6b7c8d9e0f1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The inbox and unread-count queries look up a user's participant rows for
+    # conversation_id and last_read_at; carrying both in the index lets them
+    # be answered by an index-only scan.
+    create_index_concurrently(
+        "ix_conv_participants_user_conv",
+        "conversation_participants",
+        ["user_id", "conversation_id"],
+        include=["last_read_at"],
+    )
+    drop_index_concurrently("ix_conv_participants_user")
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_conv_participants_user", "conversation_participants", ["user_id"])
+    drop_index_concurrently("ix_conv_participants_user_conv")
@@ -0,0 +1,34 @@
+"""Index completed orders by COALESCE(payment_completed_at, created_at)
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-02-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: str = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Revenue totals filter on this expression; ix_orders_completed_payment
+    # stays for the sales-window and KPI queries on payment_completed_at.
+    create_index_concurrently(
+        "ix_orders_completed_paid_at",
+        "orders",
+        ["(COALESCE(payment_completed_at, created_at))"],
+        include=["total"],
+        where="status = 'completed'",
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_orders_completed_paid_at")
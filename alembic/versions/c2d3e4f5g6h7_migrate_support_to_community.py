@@ -19,14 +19,8 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Drop old support tables
-    op.drop_index(op.f('ix_ticket_messages_ticket_id'), table_name='ticket_messages')
-    op.drop_index(op.f('ix_ticket_messages_id'), table_name='ticket_messages')
-    op.drop_table('ticket_messages')
-    op.drop_index('ix_support_tickets_user_status', table_name='support_tickets')
-    op.drop_index('ix_support_tickets_status_priority', table_name='support_tickets')
-    op.drop_index(op.f('ix_support_tickets_id'), table_name='support_tickets')
-    op.drop_table('support_tickets')
+    # Drop old support tables; their indexes go with them
+    op.execute('DROP TABLE ticket_messages, support_tickets')
 
     # Create community_threads table
     op.create_table(
@@ -74,17 +68,8 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    # Drop community tables
-    op.drop_index('ix_thread_replies_author', table_name='thread_replies')
-    op.drop_index('ix_thread_replies_thread', table_name='thread_replies')
-    op.drop_index(op.f('ix_thread_replies_id'), table_name='thread_replies')
-    op.drop_table('thread_replies')
-    op.drop_index('ix_community_threads_pinned', table_name='community_threads')
-    op.drop_index('ix_community_threads_status', table_name='community_threads')
-    op.drop_index('ix_community_threads_author', table_name='community_threads')
-    op.drop_index('ix_community_threads_category_created', table_name='community_threads')
-    op.drop_index(op.f('ix_community_threads_id'), table_name='community_threads')
-    op.drop_table('community_threads')
+    # Drop community tables; their indexes go with them
+    op.execute('DROP TABLE thread_replies, community_threads')
 
     # Recreate support tables
     op.create_table(
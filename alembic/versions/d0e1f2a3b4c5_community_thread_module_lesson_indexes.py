@@ -0,0 +1,34 @@
+"""Index community_threads.module_id and lesson_id
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-02-17 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: str = "c9d0e1f2a3b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # ON DELETE SET NULL from modules and lessons looks threads up by these
+    # columns; only course_id had an index. Databases migrated while the
+    # indexes were declared in d3e4f5g6h7i8 or c2d3e4f5g6h7 already have them.
+    create_index_concurrently(
+        "ix_community_threads_module", "community_threads", ["module_id"], if_not_exists=True
+    )
+    create_index_concurrently(
+        "ix_community_threads_lesson", "community_threads", ["lesson_id"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_community_threads_lesson")
+    drop_index_concurrently("ix_community_threads_module")
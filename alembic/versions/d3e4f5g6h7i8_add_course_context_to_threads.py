@@ -8,7 +8,14 @@ Create Date: 2026-02-01 14:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
+
+from app.db.migration_helpers import (
+    add_foreign_key_not_valid,
+    batched_update,
+    create_index_concurrently,
+    drop_index_concurrently,
+    run_with_lock_timeout,
+)
 
 
 # revision identifiers, used by Alembic.
@@ -19,64 +26,62 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "community_threads",
-        sa.Column("course_id", sa.Uuid(), nullable=True),
-    )
-    op.add_column(
-        "community_threads",
-        sa.Column("module_id", sa.Uuid(), nullable=True),
-    )
-    op.add_column(
-        "community_threads",
-        sa.Column("lesson_id", sa.Uuid(), nullable=True),
+    # Single ALTER TABLE so community_threads is locked and touched only once.
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE community_threads "
+            "ADD COLUMN course_id UUID, "
+            "ADD COLUMN module_id UUID, "
+            "ADD COLUMN lesson_id UUID"
+        )
     )
-    op.create_foreign_key(
+    add_foreign_key_not_valid(
         "fk_community_threads_course_id",
         "community_threads",
+        "course_id",
         "courses",
-        ["course_id"],
-        ["id"],
         ondelete="SET NULL",
     )
-    op.create_foreign_key(
+    add_foreign_key_not_valid(
         "fk_community_threads_module_id",
         "community_threads",
+        "module_id",
         "modules",
-        ["module_id"],
-        ["id"],
         ondelete="SET NULL",
     )
-    op.create_foreign_key(
+    add_foreign_key_not_valid(
         "fk_community_threads_lesson_id",
         "community_threads",
+        "lesson_id",
         "lessons",
-        ["lesson_id"],
-        ["id"],
         ondelete="SET NULL",
     )
-    op.create_index(
-        "ix_community_threads_course",
-        "community_threads",
-        ["course_id"],
-    )
+    create_index_concurrently("ix_community_threads_course", "community_threads", ["course_id"])
 
     # Migrate legacy categories to new values
-    op.execute(
-        "UPDATE community_threads SET category = 'ogolne' WHERE category IN ('general', 'pakiety')"
+    batched_update(
+        "community_threads",
+        "category = 'ogolne'",
+        where_sql="category IN ('general', 'pakiety')",
     )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_community_threads_course", table_name="community_threads")
-    op.drop_constraint("fk_community_threads_lesson_id", "community_threads", type_="foreignkey")
-    op.drop_constraint("fk_community_threads_module_id", "community_threads", type_="foreignkey")
-    op.drop_constraint("fk_community_threads_course_id", "community_threads", type_="foreignkey")
-    op.drop_column("community_threads", "lesson_id")
-    op.drop_column("community_threads", "module_id")
-    op.drop_column("community_threads", "course_id")
+    drop_index_concurrently("ix_community_threads_course")
+    # Single ALTER TABLE, as in upgrade, so the table is locked only once.
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE community_threads "
+            "DROP CONSTRAINT fk_community_threads_lesson_id, "
+            "DROP CONSTRAINT fk_community_threads_module_id, "
+            "DROP CONSTRAINT fk_community_threads_course_id, "
+            "DROP COLUMN lesson_id, "
+            "DROP COLUMN module_id, "
+            "DROP COLUMN course_id"
+        )
+    )
 
     # Revert legacy category migration
-    op.execute(
-        "UPDATE community_threads SET category = 'general' WHERE category = 'ogolne'"
+    batched_update(
+        "community_threads", "category = 'general'", where_sql="category = 'ogolne'"
     )
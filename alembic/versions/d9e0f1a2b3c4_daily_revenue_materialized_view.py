@@ -0,0 +1,32 @@
+"""Add mv_daily_revenue rollup of completed orders per day
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-02-17 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9e0f1a2b3c4"
+down_revision: str = "c8d9e0f1a2b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE MATERIALIZED VIEW mv_daily_revenue AS "
+        "SELECT (COALESCE(payment_completed_at, created_at) AT TIME ZONE 'UTC')::date AS day, "
+        "SUM(total)::bigint AS revenue, COUNT(*) AS orders_count "
+        "FROM orders WHERE status = 'completed' GROUP BY 1"
+    )
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY needs a unique index.
+    op.execute("CREATE UNIQUE INDEX ix_mv_daily_revenue_day ON mv_daily_revenue (day)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW mv_daily_revenue")
@@ -0,0 +1,60 @@
+"""Add indexes for the admin statistics date-range queries
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-02-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import (
+    ConcurrentIndex,
+    create_indexes_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "e0f1a2b3c4d5"
+down_revision: str = "d9e0f1a2b3c4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = [
+    # Order KPIs, status/provider breakdowns and the details list filter or
+    # sort on created_at and only read these columns.
+    ConcurrentIndex(
+        "ix_orders_created_at",
+        "orders",
+        ["created_at"],
+        include=["status", "total", "payment_provider"],
+    ),
+    # Revenue totals and sales-window sums read completed orders by payment time.
+    ConcurrentIndex(
+        "ix_orders_completed_payment",
+        "orders",
+        ["payment_completed_at"],
+        include=["total"],
+        where="status = 'completed'",
+    ),
+    ConcurrentIndex(
+        "ix_enrollments_completed_at",
+        "enrollments",
+        ["completed_at"],
+        where="completed_at IS NOT NULL",
+    ),
+    ConcurrentIndex("ix_certificates_issued_at", "certificates", ["issued_at"]),
+    ConcurrentIndex("ix_users_created_at", "users", ["created_at"]),
+]
+
+
+def upgrade() -> None:
+    # B-tree rather than BRIN: the detail lists read the newest rows with
+    # ORDER BY ... DESC LIMIT, which a BRIN index cannot serve.
+    create_indexes_concurrently(INDEXES)
+
+
+def downgrade() -> None:
+    for index in reversed(INDEXES):
+        drop_index_concurrently(index.index_name)
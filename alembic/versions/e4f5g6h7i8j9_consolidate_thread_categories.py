@@ -7,7 +7,7 @@ Create Date: 2026-02-01 18:00:00.000000
 """
 from typing import Sequence, Union
 
-from alembic import op
+from app.db.migration_helpers import batched_update
 
 
 # revision identifiers, used by Alembic.
@@ -24,19 +24,16 @@ def upgrade() -> None:
     # showcase -> showcase (unchanged)
     # pomysly -> pomysly (unchanged)
     # ogolne -> ogolne (unchanged)
-    op.execute(
-        "UPDATE community_threads SET category = 'pomoc' "
-        "WHERE category IN ('pytania', 'kursy', 'wdrozenia')"
-    )
-    op.execute(
-        "UPDATE community_threads SET category = 'ogolne' "
-        "WHERE category = 'porady'"
+    # Both remappings share one batched pass over community_threads.
+    batched_update(
+        "community_threads",
+        "category = CASE WHEN category = 'porady' THEN 'ogolne' ELSE 'pomoc' END",
+        where_sql="category IN ('pytania', 'kursy', 'wdrozenia', 'porady')",
     )
 
 
 def downgrade() -> None:
     # Best-effort revert: pomoc -> pytania (original default)
-    op.execute(
-        "UPDATE community_threads SET category = 'pytania' "
-        "WHERE category = 'pomoc'"
+    batched_update(
+        "community_threads", "category = 'pytania'", where_sql="category = 'pomoc'"
     )
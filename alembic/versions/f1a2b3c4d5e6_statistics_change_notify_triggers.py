@@ -0,0 +1,54 @@
+"""Notify statistics_changed when tables behind the admin statistics change
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2026-02-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import run_with_lock_timeout
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a2b3c4d5e6"
+down_revision: str = "e0f1a2b3c4d5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Only the writes that change a cached figure: frequent updates such as
+# enrollments.last_accessed_at or user profile edits do not notify.
+TRIGGER_EVENTS = {
+    "orders": "INSERT OR UPDATE OF status, total, payment_completed_at OR DELETE",
+    "users": "INSERT OR UPDATE OF is_active OR DELETE",
+    "enrollments": "INSERT OR UPDATE OF completed_at OR DELETE",
+    "certificates": "INSERT OR DELETE",
+    "sales_windows": "INSERT OR UPDATE OR DELETE",
+}
+
+
+def upgrade() -> None:
+    # Statement-level, and NOTIFY folds identical payloads within a
+    # transaction, so a bulk write sends a single notification per table.
+    op.execute(
+        "CREATE FUNCTION notify_statistics_changed() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ BEGIN "
+        "PERFORM pg_notify('statistics_changed', TG_TABLE_NAME); RETURN NULL; "
+        "END $$"
+    )
+    for table, events in TRIGGER_EVENTS.items():
+        run_with_lock_timeout(
+            lambda table=table, events=events: op.execute(
+                f"CREATE TRIGGER {table}_statistics_changed AFTER {events} ON {table} "
+                "FOR EACH STATEMENT EXECUTE FUNCTION notify_statistics_changed()"
+            )
+        )
+
+
+def downgrade() -> None:
+    for table in TRIGGER_EVENTS:
+        run_with_lock_timeout(
+            lambda table=table: op.execute(f"DROP TRIGGER {table}_statistics_changed ON {table}")
+        )
+    op.execute("DROP FUNCTION notify_statistics_changed()")
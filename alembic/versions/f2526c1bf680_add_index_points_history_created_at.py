@@ -7,8 +7,7 @@ Create Date: 2026-01-11 22:00:01.691574
 """
 from typing import Sequence, Union
 
-from alembic import op
-import sqlalchemy as sa
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
 
 
 # revision identifiers, used by Alembic.
@@ -19,12 +18,8 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.create_index(op.f('ix_points_history_created_at'), 'points_history', ['created_at'], unique=False)
-    # ### end Alembic commands ###
+    create_index_concurrently('ix_points_history_created_at', 'points_history', ['created_at'])
 
 
 def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_index(op.f('ix_points_history_created_at'), table_name='points_history')
-    # ### end Alembic commands ###
+    drop_index_concurrently('ix_points_history_created_at')
@@ -11,6 +11,11 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 
 from alembic import op
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    run_with_lock_timeout,
+)
 
 # revision identifiers, used by Alembic.
 revision: str = "g6h7i8j9k0l1"
@@ -20,10 +25,10 @@ depends_on: str | Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    op.drop_index(op.f("ix_users_last_active_at"), table_name="users")
-    op.drop_column("users", "last_active_at")
+    drop_index_concurrently("ix_users_last_active_at")
+    run_with_lock_timeout(lambda: op.drop_column("users", "last_active_at"))
 
 
 def downgrade() -> None:
     op.add_column("users", sa.Column("last_active_at", sa.DateTime(), nullable=True))
-    op.create_index(op.f("ix_users_last_active_at"), "users", ["last_active_at"], unique=False)
+    create_index_concurrently("ix_users_last_active_at", "users", ["last_active_at"])
@@ -0,0 +1,37 @@
+"""Switch user_daily_activity primary key to a bigint identity
+
+Revision ID: k0l1m2n3o4p5
+Revises: j9k0l1m2n3o4
+Create Date: 2026-02-14 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "k0l1m2n3o4p5"
+down_revision: str = "j9k0l1m2n3o4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The id is never referenced; rows are addressed by (user_id, date).
+    # A sequential key keeps the once-per-user-per-day inserts on the right
+    # edge of the primary key index.
+    op.execute(
+        "ALTER TABLE user_daily_activity "
+        "DROP COLUMN id, "
+        "ADD COLUMN id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE user_daily_activity "
+        "DROP COLUMN id, "
+        "ADD COLUMN id UUID NOT NULL DEFAULT gen_random_uuid() PRIMARY KEY"
+    )
+    op.execute("ALTER TABLE user_daily_activity ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,36 @@
+"""Store users.notification_preferences as JSONB
+
+Revision ID: l1m2n3o4p5q6
+Revises: k0l1m2n3o4p5
+Create Date: 2026-02-14 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import run_with_lock_timeout
+
+# revision identifiers, used by Alembic.
+revision: str = "l1m2n3o4p5q6"
+down_revision: str = "k0l1m2n3o4p5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE users ALTER COLUMN notification_preferences "
+            "TYPE JSONB USING notification_preferences::jsonb"
+        )
+    )
+
+
+def downgrade() -> None:
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE users ALTER COLUMN notification_preferences "
+            "TYPE JSON USING notification_preferences::json"
+        )
+    )
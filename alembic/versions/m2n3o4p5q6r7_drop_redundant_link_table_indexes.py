@@ -0,0 +1,39 @@
+"""Drop link table indexes covered by unique constraints
+
+Revision ID: m2n3o4p5q6r7
+Revises: l1m2n3o4p5q6
+Create Date: 2026-02-14 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "m2n3o4p5q6r7"
+down_revision: str = "l1m2n3o4p5q6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # uq_bundle_course (bundle_id, course_id) already serves lookups by
+    # bundle_id and by the pair.
+    drop_index_concurrently("ix_bundle_course_items_bundle_id")
+    drop_index_concurrently("ix_bundle_course_items_bundle_course")
+    # uq_lesson_integration (lesson_id, integration_id) leads with lesson_id.
+    drop_index_concurrently("ix_lesson_integrations_lesson_id")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_lesson_integrations_lesson_id", "lesson_integrations", ["lesson_id"]
+    )
+    create_index_concurrently(
+        "ix_bundle_course_items_bundle_course", "bundle_course_items", ["bundle_id", "course_id"]
+    )
+    create_index_concurrently(
+        "ix_bundle_course_items_bundle_id", "bundle_course_items", ["bundle_id"]
+    )
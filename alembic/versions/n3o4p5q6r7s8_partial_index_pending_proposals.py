@@ -0,0 +1,35 @@
+"""Replace integration_proposals status index with a partial pending index
+
+Revision ID: n3o4p5q6r7s8
+Revises: m2n3o4p5q6r7
+Create Date: 2026-02-14 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "n3o4p5q6r7s8"
+down_revision: str = "m2n3o4p5q6r7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_integration_proposals_pending",
+        "integration_proposals",
+        ["created_at"],
+        where="status = 'pending'",
+    )
+    drop_index_concurrently("ix_integration_proposals_status")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_integration_proposals_status", "integration_proposals", ["status"]
+    )
+    drop_index_concurrently("ix_integration_proposals_pending")
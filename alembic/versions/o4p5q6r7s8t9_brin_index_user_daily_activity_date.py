@@ -0,0 +1,34 @@
+"""Replace user_daily_activity date B-tree with a BRIN index
+
+Revision ID: o4p5q6r7s8t9
+Revises: n3o4p5q6r7s8
+Create Date: 2026-02-14 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "o4p5q6r7s8t9"
+down_revision: str = "n3o4p5q6r7s8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_user_daily_activity_date_brin",
+        "user_daily_activity",
+        ["date"],
+        using="brin",
+        with_params={"pages_per_range": 32},
+    )
+    drop_index_concurrently("ix_user_daily_activity_date")
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_user_daily_activity_date", "user_daily_activity", ["date"])
+    drop_index_concurrently("ix_user_daily_activity_date_brin")
@@ -0,0 +1,41 @@
+"""Default created_at/updated_at on the server for newer tables
+
+Revision ID: p5q6r7s8t9u0
+Revises: o4p5q6r7s8t9
+Create Date: 2026-02-14 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p5q6r7s8t9u0"
+down_revision: str = "o4p5q6r7s8t9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Columns store naive UTC, so the default must not depend on the session time zone.
+UTC_NOW = "timezone('utc', now())"
+
+TIMESTAMP_COLUMNS = {
+    "announcement_logs": ["created_at"],
+    "integrations": ["created_at", "updated_at"],
+    "integration_proposals": ["created_at", "updated_at"],
+    "ai_chat_sessions": ["created_at", "updated_at"],
+    "brand_guidelines": ["created_at", "updated_at"],
+    "lesson_integrations": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET DEFAULT {UTC_NOW}" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} DROP DEFAULT" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
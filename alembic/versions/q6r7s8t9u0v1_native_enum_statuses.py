@@ -0,0 +1,62 @@
+"""Store announcement and proposal statuses as native enums
+
+Revision ID: q6r7s8t9u0v1
+Revises: p5q6r7s8t9u0
+Create Date: 2026-02-14 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import run_with_lock_timeout
+
+# revision identifiers, used by Alembic.
+revision: str = "q6r7s8t9u0v1"
+down_revision: str = "p5q6r7s8t9u0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TYPE announcement_status AS ENUM "
+        "('pending', 'in_progress', 'completed', 'failed')"
+    )
+    op.execute("CREATE TYPE proposal_status AS ENUM ('pending', 'approved', 'rejected')")
+
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE announcement_logs "
+            "ALTER COLUMN status TYPE announcement_status USING status::announcement_status"
+        )
+    )
+    run_with_lock_timeout(lambda: _convert_proposal_status("proposal_status"))
+
+
+def downgrade() -> None:
+    run_with_lock_timeout(lambda: _convert_proposal_status("VARCHAR(50)"))
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER TABLE announcement_logs ALTER COLUMN status TYPE VARCHAR(20) USING status::text"
+        )
+    )
+
+    op.execute("DROP TYPE proposal_status")
+    op.execute("DROP TYPE announcement_status")
+
+
+def _convert_proposal_status(column_type: str) -> None:
+    # The partial index predicate has to be rebuilt against the new type: the
+    # text cast it carries for VARCHAR is not immutable for an enum.
+    op.execute("DROP INDEX ix_integration_proposals_pending")
+    op.execute(
+        "ALTER TABLE integration_proposals "
+        "ALTER COLUMN status DROP DEFAULT, "
+        f"ALTER COLUMN status TYPE {column_type} USING status::text::{column_type}, "
+        "ALTER COLUMN status SET DEFAULT 'pending'"
+    )
+    op.execute(
+        "CREATE INDEX ix_integration_proposals_pending "
+        "ON integration_proposals (created_at) WHERE status = 'pending'"
+    )
@@ -0,0 +1,92 @@
+"""Store all timestamps as timestamptz
+
+Revision ID: r7s8t9u0v1w2
+Revises: q6r7s8t9u0v1
+Create Date: 2026-02-14 19:00:00.000000
+
+"""
+
+from collections import defaultdict
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.db.migration_helpers import commit_transaction, run_with_lock_timeout
+
+# revision identifiers, used by Alembic.
+revision: str = "r7s8t9u0v1w2"
+down_revision: str = "q6r7s8t9u0v1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Server defaults added in p5q6r7s8t9u0 as timezone('utc', now()) for naive columns.
+SERVER_DEFAULT_COLUMNS = {
+    "announcement_logs": ["created_at"],
+    "integrations": ["created_at", "updated_at"],
+    "integration_proposals": ["created_at", "updated_at"],
+    "ai_chat_sessions": ["created_at", "updated_at"],
+    "brand_guidelines": ["created_at", "updated_at"],
+    "lesson_integrations": ["created_at"],
+}
+
+# Upper bound for one table's rewrite; the lock wait itself stays at the default.
+REWRITE_STATEMENT_TIMEOUT = "10min"
+
+
+def _columns_of_type(data_type: str) -> dict[str, list[str]]:
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND data_type = :data_type "
+            "ORDER BY table_name, ordinal_position"
+        ),
+        {"data_type": data_type},
+    )
+    columns: dict[str, list[str]] = defaultdict(list)
+    for table_name, column_name in rows:
+        columns[table_name].append(column_name)
+    return columns
+
+
+def _rewrite_table(table: str, clauses: str) -> None:
+    # Each table is rewritten in its own transaction behind a lock timeout, so
+    # only that table is locked while it is rewritten, and a busy one gives up
+    # instead of queueing every query on it. A failed run resumes with the
+    # columns that are still of the old type.
+    run_with_lock_timeout(
+        lambda: op.execute(f"ALTER TABLE {table} {clauses}"),
+        statement_timeout=REWRITE_STATEMENT_TIMEOUT,
+    )
+    commit_transaction()
+
+
+def upgrade() -> None:
+    # Every stored value is UTC, so each column is reinterpreted AT TIME ZONE 'UTC'.
+    # All columns of a table are converted in one ALTER TABLE, a single rewrite.
+    for table, columns in _columns_of_type("timestamp without time zone").items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE TIMESTAMP WITH TIME ZONE USING {column} AT TIME ZONE 'UTC'"
+            for column in columns
+        )
+        _rewrite_table(table, clauses)
+
+    for table, columns in SERVER_DEFAULT_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET DEFAULT now()" for column in columns)
+        run_with_lock_timeout(lambda: op.execute(f"ALTER TABLE {table} {clauses}"))
+
+
+def downgrade() -> None:
+    for table, columns in _columns_of_type("timestamp with time zone").items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE TIMESTAMP WITHOUT TIME ZONE "
+            f"USING {column} AT TIME ZONE 'UTC'"
+            for column in columns
+        )
+        _rewrite_table(table, clauses)
+
+    for table, columns in SERVER_DEFAULT_COLUMNS.items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} SET DEFAULT timezone('utc', now())" for column in columns
+        )
+        run_with_lock_timeout(lambda: op.execute(f"ALTER TABLE {table} {clauses}"))
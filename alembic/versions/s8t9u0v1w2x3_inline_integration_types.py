@@ -0,0 +1,52 @@
+"""Fold integration_types into an array column on integrations
+
+Revision ID: s8t9u0v1w2x3
+Revises: r7s8t9u0v1w2
+Create Date: 2026-02-15 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s8t9u0v1w2x3"
+down_revision: str = "r7s8t9u0v1w2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE integrations ADD COLUMN types VARCHAR(50)[] DEFAULT '{}' NOT NULL")
+    op.execute(
+        """
+        UPDATE integrations SET types = t.types
+        FROM (
+            SELECT integration_id, array_agg(type_name ORDER BY type_name) AS types
+            FROM integration_types
+            GROUP BY integration_id
+        ) AS t
+        WHERE integrations.id = t.integration_id
+        """
+    )
+    op.execute("DROP TABLE integration_types")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE integration_types (
+            id UUID NOT NULL,
+            integration_id UUID NOT NULL,
+            type_name VARCHAR(50) NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (integration_id) REFERENCES integrations (id) ON DELETE CASCADE,
+            CONSTRAINT uq_integration_type UNIQUE (integration_id, type_name)
+        );
+        CREATE INDEX ix_integration_types_integration_id ON integration_types (integration_id);
+        INSERT INTO integration_types (id, integration_id, type_name)
+        SELECT gen_random_uuid(), id, unnest(types) FROM integrations;
+        """
+    )
+    op.execute("ALTER TABLE integrations DROP COLUMN types")
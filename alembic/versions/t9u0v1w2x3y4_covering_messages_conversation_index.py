@@ -0,0 +1,48 @@
+"""Cover sender_id in the messages (conversation_id, created_at) index
+
+Revision ID: t9u0v1w2x3y4
+Revises: s8t9u0v1w2x3
+Create Date: 2026-02-15 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    run_with_lock_timeout,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "t9u0v1w2x3y4"
+down_revision: str = "s8t9u0v1w2x3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _replace_index(include: Sequence[str] | None) -> None:
+    create_index_concurrently(
+        "ix_messages_conversation_created_new",
+        "messages",
+        ["conversation_id", "created_at"],
+        include=include,
+    )
+    drop_index_concurrently("ix_messages_conversation_created")
+    run_with_lock_timeout(
+        lambda: op.execute(
+            "ALTER INDEX ix_messages_conversation_created_new "
+            "RENAME TO ix_messages_conversation_created"
+        )
+    )
+
+
+def upgrade() -> None:
+    # Unread counters filter on sender_id; carrying it in the index lets them
+    # run as index-only scans instead of visiting every message row.
+    _replace_index(["sender_id"])
+
+
+def downgrade() -> None:
+    _replace_index(None)
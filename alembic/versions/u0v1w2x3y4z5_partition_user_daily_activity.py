@@ -0,0 +1,90 @@
+"""Partition user_daily_activity by year on date
+
+Revision ID: u0v1w2x3y4z5
+Revises: t9u0v1w2x3y4
+Create Date: 2026-02-15 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "u0v1w2x3y4z5"
+down_revision: str = "t9u0v1w2x3y4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _swap_in(new_table: str, primary_key: str) -> None:
+    """Copy rows into new_table, replace user_daily_activity with it and re-add keys."""
+    op.execute(
+        f"INSERT INTO {new_table} (id, user_id, date, last_seen_at) "
+        "SELECT id, user_id, date, last_seen_at FROM user_daily_activity"
+    )
+    op.execute(
+        f"SELECT setval(pg_get_serial_sequence('{new_table}', 'id'), "
+        f"coalesce(max(id), 0) + 1, false) FROM {new_table}"
+    )
+    op.execute("DROP TABLE user_daily_activity")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO user_daily_activity")
+    op.execute(f"ALTER SEQUENCE {new_table}_id_seq RENAME TO user_daily_activity_id_seq")
+    # Keys and indexes are built after the bulk copy rather than maintained row by row.
+    op.execute(
+        "ALTER TABLE user_daily_activity "
+        f"ADD CONSTRAINT user_daily_activity_pkey PRIMARY KEY ({primary_key}), "
+        "ADD CONSTRAINT uq_user_daily_activity_user_date UNIQUE (user_id, date), "
+        "ADD CONSTRAINT user_daily_activity_user_id_fkey FOREIGN KEY (user_id) "
+        "REFERENCES users (id) ON DELETE CASCADE"
+    )
+    op.execute("CREATE INDEX ix_user_daily_activity_user_id ON user_daily_activity (user_id)")
+    op.execute(
+        "CREATE INDEX ix_user_daily_activity_date_brin ON user_daily_activity "
+        "USING brin (date) WITH (pages_per_range = 32)"
+    )
+
+
+def upgrade() -> None:
+    # Every activity query filters on date, so yearly partitions let the
+    # planner prune to the years in range, and old years can be detached whole.
+    op.execute(
+        "CREATE TABLE user_daily_activity_partitioned ("
+        "id BIGINT GENERATED BY DEFAULT AS IDENTITY, "
+        "user_id UUID NOT NULL, "
+        "date DATE NOT NULL, "
+        "last_seen_at TIMESTAMPTZ NOT NULL"
+        ") PARTITION BY RANGE (date)"
+    )
+    conn = op.get_bind()
+    first_year, current_year = conn.execute(
+        sa.text(
+            "SELECT coalesce(extract(year FROM min(date)), extract(year FROM current_date)), "
+            "extract(year FROM current_date) FROM user_daily_activity"
+        )
+    ).one()
+    for year in range(int(first_year), int(current_year) + 2):
+        op.execute(
+            f"CREATE TABLE user_daily_activity_y{year} "
+            "PARTITION OF user_daily_activity_partitioned "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    op.execute(
+        "CREATE TABLE user_daily_activity_default "
+        "PARTITION OF user_daily_activity_partitioned DEFAULT"
+    )
+    _swap_in("user_daily_activity_partitioned", "id, date")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE TABLE user_daily_activity_plain ("
+        "id BIGINT GENERATED BY DEFAULT AS IDENTITY, "
+        "user_id UUID NOT NULL, "
+        "date DATE NOT NULL, "
+        "last_seen_at TIMESTAMPTZ NOT NULL"
+        ")"
+    )
+    _swap_in("user_daily_activity_plain", "id")
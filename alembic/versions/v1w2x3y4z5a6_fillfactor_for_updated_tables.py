@@ -0,0 +1,38 @@
+"""Leave free space for HOT updates on frequently updated tables
+
+Revision ID: v1w2x3y4z5a6
+Revises: u0v1w2x3y4z5
+Create Date: 2026-02-15 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import run_with_lock_timeout
+
+# revision identifiers, used by Alembic.
+revision: str = "v1w2x3y4z5a6"
+down_revision: str = "u0v1w2x3y4z5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# ai_chat_sessions rewrites its whole messages JSON on every turn; the others
+# are edited in place and bump updated_at, which no index covers.
+TABLES = ("ai_chat_sessions", "integrations", "integration_proposals", "brand_guidelines")
+
+
+def upgrade() -> None:
+    # Only pages written from now on keep the reserve; existing pages fill up
+    # again as rows are updated, so no table rewrite is needed.
+    for table in TABLES:
+        run_with_lock_timeout(
+            lambda table=table: op.execute(f"ALTER TABLE {table} SET (fillfactor = 80)")
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        run_with_lock_timeout(
+            lambda table=table: op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
+        )
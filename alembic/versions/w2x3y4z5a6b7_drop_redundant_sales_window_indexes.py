@@ -0,0 +1,36 @@
+"""Drop sales_windows indexes covered by the composite indexes
+
+Revision ID: w2x3y4z5a6b7
+Revises: v1w2x3y4z5a6
+Create Date: 2026-02-16 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "w2x3y4z5a6b7"
+down_revision: str = "v1w2x3y4z5a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# status and created_at lead idx_sales_window_active_time and
+# idx_sales_window_created; ends_at is only ever filtered next to status.
+INDEXES = {
+    "ix_sales_windows_status": "status",
+    "ix_sales_windows_created_at": "created_at",
+    "ix_sales_windows_ends_at": "ends_at",
+}
+
+
+def upgrade() -> None:
+    for index_name in INDEXES:
+        drop_index_concurrently(index_name)
+
+
+def downgrade() -> None:
+    for index_name, column in INDEXES.items():
+        create_index_concurrently(index_name, "sales_windows", [column])
@@ -0,0 +1,73 @@
+"""Drop ix_<table>_id indexes that duplicate primary keys
+
+Revision ID: x3y4z5a6b7c8
+Revises: w2x3y4z5a6b7
+Create Date: 2026-02-16 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import (
+    ConcurrentIndex,
+    create_indexes_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "x3y4z5a6b7c8"
+down_revision: str = "w2x3y4z5a6b7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Each of these repeats the unique B-tree behind the table's primary key; they
+# came from index=True on the id columns.
+INDEXES = [
+    ("ix_achievements_id", "achievements"),
+    ("ix_ai_chat_sessions_id", "ai_chat_sessions"),
+    ("ix_announcement_logs_id", "announcement_logs"),
+    ("ix_attachments_id", "attachments"),
+    ("ix_brand_guidelines_id", "brand_guidelines"),
+    ("ix_bundle_course_items_id", "bundle_course_items"),
+    ("ix_certificates_id", "certificates"),
+    ("ix_community_thread_attachments_id", "community_thread_attachments"),
+    ("ix_community_thread_tags_id", "community_thread_tags"),
+    ("ix_community_threads_id", "community_threads"),
+    ("ix_conversation_participants_id", "conversation_participants"),
+    ("ix_conversations_id", "conversations"),
+    ("ix_courses_id", "courses"),
+    ("ix_enrollments_id", "enrollments"),
+    ("ix_integration_proposals_id", "integration_proposals"),
+    ("ix_integrations_id", "integrations"),
+    ("ix_lesson_progress_id", "lesson_progress"),
+    ("ix_lessons_id", "lessons"),
+    ("ix_messages_id", "messages"),
+    ("ix_modules_id", "modules"),
+    ("ix_notifications_id", "notifications"),
+    ("ix_order_items_id", "order_items"),
+    ("ix_orders_id", "orders"),
+    ("ix_package_bundle_items_id", "package_bundle_items"),
+    ("ix_package_enrollments_id", "package_enrollments"),
+    ("ix_package_processes_id", "package_processes"),
+    ("ix_packages_id", "packages"),
+    ("ix_points_history_id", "points_history"),
+    ("ix_sales_windows_id", "sales_windows"),
+    ("ix_thread_replies_id", "thread_replies"),
+    ("ix_user_achievements_id", "user_achievements"),
+    ("ix_user_points_id", "user_points"),
+    ("ix_user_streaks_id", "user_streaks"),
+    ("ix_users_id", "users"),
+]
+
+
+def upgrade() -> None:
+    for index_name, _ in INDEXES:
+        drop_index_concurrently(index_name)
+
+
+def downgrade() -> None:
+    # The indexes are on different tables, so they can be rebuilt in parallel.
+    create_indexes_concurrently(
+        [ConcurrentIndex(index_name, table_name, ["id"]) for index_name, table_name in INDEXES]
+    )
@@ -0,0 +1,39 @@
+"""Replace low-selectivity community_threads indexes
+
+Revision ID: y4z5a6b7c8d9
+Revises: x3y4z5a6b7c8
+Create Date: 2026-02-16 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "y4z5a6b7c8d9"
+down_revision: str = "x3y4z5a6b7c8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # is_pinned and status have two and three values; on their own they match
+    # too many rows to beat a sequential scan. The thread list orders by
+    # (is_pinned, updated_at), and only open threads are looked up by status.
+    create_index_concurrently(
+        "ix_community_threads_pinned_updated", "community_threads", ["is_pinned", "updated_at"]
+    )
+    create_index_concurrently(
+        "ix_community_threads_open", "community_threads", ["created_at"], where="status = 'open'"
+    )
+    drop_index_concurrently("ix_community_threads_pinned")
+    drop_index_concurrently("ix_community_threads_status")
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_community_threads_status", "community_threads", ["status"])
+    create_index_concurrently("ix_community_threads_pinned", "community_threads", ["is_pinned"])
+    drop_index_concurrently("ix_community_threads_open")
+    drop_index_concurrently("ix_community_threads_pinned_updated")
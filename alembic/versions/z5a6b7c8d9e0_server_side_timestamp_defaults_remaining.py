@@ -0,0 +1,42 @@
+"""Default created_at/updated_at on the server for the remaining app tables
+
+Revision ID: z5a6b7c8d9e0
+Revises: y4z5a6b7c8d9
+Create Date: 2026-02-16 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "z5a6b7c8d9e0"
+down_revision: str = "y4z5a6b7c8d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMESTAMP_COLUMNS = {
+    "sales_windows": ["created_at", "updated_at"],
+    "community_threads": ["created_at", "updated_at"],
+    "thread_replies": ["created_at"],
+    "community_thread_tags": ["created_at"],
+    "community_thread_attachments": ["created_at"],
+    "conversations": ["created_at", "updated_at"],
+    "messages": ["created_at"],
+    "notifications": ["created_at"],
+    "process_integrations": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    # SET DEFAULT only touches the catalog; existing rows are not rewritten.
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET DEFAULT now()" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} DROP DEFAULT" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
@@ -0,0 +1,83 @@
+"""Drop cached admin statistics when the tables behind them change.
+
+Statement-level triggers on the source tables send ``NOTIFY
+statistics_changed, '<table>'`` when a transaction commits.
+``listen_for_statistics_changes`` runs for the lifetime of the API process
+and deletes the cached responses built from the changed table. The cache
+TTLs remain as a fallback for missed notifications, e.g. while the listener
+is reconnecting.
+
+The revenue charts read whole past days from the mv_daily_revenue rollup,
+which only changes when ``refresh_daily_revenue_task`` refreshes it, and
+recent days from orders. The refresh task notifies for ``mv_daily_revenue``
+once the new contents are committed, so changes to orders in days already
+rolled up reach the charts at the next refresh.
+"""
+
+import asyncio
+import logging
+from typing import cast
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, connection
+
+from app.core.cache import invalidate_namespace
+from app.core.constants import STATISTICS_LISTENER_RECONNECT_SECONDS
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_CHANNEL = "statistics_changed"
+
+# Cache namespaces (see app.admin.routes.admin_statistics) built from each table
+CACHE_NAMESPACES_BY_TABLE: dict[str, tuple[str, ...]] = {
+    "orders": ("dashboard", "rankings", "sales-windows", "revenue"),
+    "mv_daily_revenue": ("revenue",),
+    "users": ("dashboard", "users"),
+    "enrollments": ("dashboard", "rankings", "education"),
+    "certificates": ("dashboard", "education"),
+    "sales_windows": ("sales-windows",),
+}
+
+
+async def listen_for_statistics_changes() -> None:
+    """Invalidate statistics caches on notifications, reconnecting after errors."""
+    while True:
+        try:
+            await _listen()
+        except (psycopg2.Error, OSError) as exc:
+            logger.warning("Statistics change listener disconnected: %s", exc)
+        await asyncio.sleep(STATISTICS_LISTENER_RECONNECT_SECONDS)
+
+
+async def _listen() -> None:
+    loop = asyncio.get_running_loop()
+    # A dedicated connection: LISTEN is tied to the session, so the
+    # connection is detached from the pool and closed when done.
+    fairy = await loop.run_in_executor(None, engine.raw_connection)
+    fairy.detach()
+    conn = cast(connection, fairy.dbapi_connection)
+    try:
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {STATISTICS_CHANNEL}")
+
+        readable = asyncio.Event()
+        loop.add_reader(conn.fileno(), readable.set)
+        try:
+            while True:
+                await readable.wait()
+                readable.clear()
+                conn.poll()
+                tables = {notify.payload for notify in conn.notifies}
+                conn.notifies.clear()
+                for namespace in {
+                    namespace
+                    for table in tables
+                    for namespace in CACHE_NAMESPACES_BY_TABLE.get(table, ())
+                }:
+                    await invalidate_namespace(namespace)
+        finally:
+            loop.remove_reader(conn.fileno())
+    finally:
+        fairy.close()
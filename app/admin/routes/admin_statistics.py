@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.admin.schemas.admin_statistics import (
@@ -30,16 +30,32 @@ from app.admin.services.statistics import (
 )
 from app.auth.dependencies import require_admin
 from app.auth.models.user import User
-from app.db.session import get_db
+from app.core.cache import cache_key, get_or_set_model
+from app.core.constants import (
+    DASHBOARD_STATS_CACHE_TTL_SECONDS,
+    EDUCATION_STATS_CACHE_TTL_SECONDS,
+    RANKINGS_STATS_CACHE_TTL_SECONDS,
+    REVENUE_STATS_CACHE_TTL_SECONDS,
+    SALES_WINDOWS_STATS_CACHE_TTL_SECONDS,
+    STATISTICS_HTTP_MAX_AGE_SECONDS,
+    USER_STATS_CACHE_TTL_SECONDS,
+)
+from app.core.responses import PydanticJSONResponse, conditional_json_response
+from app.db.session import SessionLocal, get_db
 
-router = APIRouter(prefix="/statistics", tags=["admin-statistics"])
+router = APIRouter(
+    prefix="/statistics",
+    tags=["admin-statistics"],
+    default_response_class=PydanticJSONResponse,
+)
 
 
 @router.get("/dashboard", response_model=DashboardSummaryResponse)
 async def get_dashboard_summary(
+    request: Request,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
-) -> DashboardSummaryResponse:
+) -> Response:
     """
     Get dashboard summary with all KPIs.
 
@@ -50,18 +66,25 @@ async def get_dashboard_summary(
     - Education (enrollments, completions, certificates)
     - Top 5 packages and courses
     """
-    return DashboardService.get_summary(db)
+    stats = await get_or_set_model(
+        cache_key("dashboard"),
+        DashboardSummaryResponse,
+        DASHBOARD_STATS_CACHE_TTL_SECONDS,
+        lambda: DashboardService.get_summary(db, session_factory=SessionLocal),
+    )
+    return conditional_json_response(request, stats, STATISTICS_HTTP_MAX_AGE_SECONDS)
 
 
 @router.get("/revenue", response_model=RevenueStatisticsResponse)
 async def get_revenue_statistics(
+    request: Request,
     start_date: datetime = Query(..., description="Start date for the period (ISO format)"),
     end_date: datetime = Query(..., description="End date for the period (ISO format)"),
     granularity: Granularity = Query(Granularity.DAILY, description="Data point granularity"),
     compare_previous: bool = Query(True, description="Include comparison with previous period"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
-) -> RevenueStatisticsResponse:
+) -> Response:
     """
     Get detailed revenue statistics.
 
@@ -71,11 +94,25 @@ async def get_revenue_statistics(
     - Change percentage
     - Data points for chart visualization
     """
-    return RevenueService.get_statistics(db, start_date, end_date, granularity, compare_previous)
+    stats = await get_or_set_model(
+        cache_key(
+            "revenue",
+            start_date.isoformat(),
+            end_date.isoformat(),
+            granularity.value,
+            compare_previous,
+        ),
+        RevenueStatisticsResponse,
+        REVENUE_STATS_CACHE_TTL_SECONDS,
+        lambda: RevenueService.get_statistics(
+            db, start_date, end_date, granularity, compare_previous
+        ),
+    )
+    return conditional_json_response(request, stats, STATISTICS_HTTP_MAX_AGE_SECONDS)
 
 
 @router.get("/orders", response_model=OrderStatisticsResponse)
-async def get_order_statistics(
+def get_order_statistics(
     start_date: datetime | None = Query(None, description="Filter start date"),
     end_date: datetime | None = Query(None, description="Filter end date"),
     db: Session = Depends(get_db),
@@ -95,10 +132,11 @@ async def get_order_statistics(
 
 @router.get("/rankings", response_model=RankingsResponse)
 async def get_rankings(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Number of items per ranking"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
-) -> RankingsResponse:
+) -> Response:
     """
     Get rankings for packages and courses.
 
@@ -106,14 +144,21 @@ async def get_rankings(
     - Top packages by sales count and revenue
     - Top courses by enrollment count and completion rate
     """
-    return RankingsService.get_rankings(db, limit)
+    stats = await get_or_set_model(
+        cache_key("rankings", limit),
+        RankingsResponse,
+        RANKINGS_STATS_CACHE_TTL_SECONDS,
+        lambda: RankingsService.get_rankings(db, limit),
+    )
+    return conditional_json_response(request, stats, STATISTICS_HTTP_MAX_AGE_SECONDS)
 
 
 @router.get("/sales-windows", response_model=SalesWindowsResponse)
 async def get_sales_windows_stats(
+    request: Request,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
-) -> SalesWindowsResponse:
+) -> Response:
     """
     Get statistics for all sales windows.
 
@@ -122,15 +167,22 @@ async def get_sales_windows_stats(
     - Total revenue
     - Unique customers
     """
-    return RankingsService.get_sales_windows_stats(db)
+    stats = await get_or_set_model(
+        cache_key("sales-windows"),
+        SalesWindowsResponse,
+        SALES_WINDOWS_STATS_CACHE_TTL_SECONDS,
+        lambda: RankingsService.get_sales_windows_stats(db),
+    )
+    return conditional_json_response(request, stats, STATISTICS_HTTP_MAX_AGE_SECONDS)
 
 
 @router.get("/users", response_model=UserStatisticsResponse)
 async def get_user_statistics(
+    request: Request,
     days: int = Query(30, ge=7, le=365, description="Number of days for activity trend"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
-) -> UserStatisticsResponse:
+) -> Response:
     """
     Get user statistics with activity trends.
 
@@ -141,14 +193,21 @@ async def get_user_statistics(
     - DAU/MAU ratio
     - Daily activity data points
     """
-    return UserStatisticsService.get_statistics(db, days)
+    stats = await get_or_set_model(
+        cache_key("users", days),
+        UserStatisticsResponse,
+        USER_STATS_CACHE_TTL_SECONDS,
+        lambda: UserStatisticsService.get_statistics(db, days),
+    )
+    return conditional_json_response(request, stats, STATISTICS_HTTP_MAX_AGE_SECONDS)
 
 
 @router.get("/education", response_model=EducationStatisticsResponse)
 async def get_education_statistics(
+    request: Request,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
-) -> EducationStatisticsResponse:
+) -> Response:
     """
     Get education statistics.
 
@@ -159,16 +218,25 @@ async def get_education_statistics(
     - Certificates issued
     - Per-course statistics with progress metrics
     """
-    return EducationService.get_statistics(db)
+    stats = await get_or_set_model(
+        cache_key("education"),
+        EducationStatisticsResponse,
+        EDUCATION_STATS_CACHE_TTL_SECONDS,
+        lambda: EducationService.get_statistics(db),
+    )
+    return conditional_json_response(request, stats, STATISTICS_HTTP_MAX_AGE_SECONDS)
 
 
 @router.get("/orders/details", response_model=OrderDetailsListResponse)
-async def get_order_details(
+def get_order_details(
     period: str | None = Query(
         None, description="Period: 'today', 'this_month', or omit for all time"
     ),
     status: str | None = Query(None, description="Filter by status (e.g. 'completed', 'pending')"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of orders to return"),
+    with_count: bool = Query(
+        True, description="Include the total count and revenue; skip them when false"
+    ),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ) -> OrderDetailsListResponse:
@@ -180,12 +248,14 @@ async def get_order_details(
     - Total count
     - Total revenue (completed orders only)
     """
-    return OrderStatisticsService.get_order_details(db, period, status, limit)
+    return OrderStatisticsService.get_order_details(db, period, status, limit, with_count)
 
 
 @router.get("/users/monthly", response_model=MonthlyUsersResponse)
-async def get_monthly_new_users(
+def get_monthly_new_users(
     limit: int = Query(50, ge=1, le=100, description="Maximum number of users to return"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of the previous page"),
+    with_count: bool = Query(True, description="Include the total count; skip it when false"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ) -> MonthlyUsersResponse:
@@ -196,12 +266,14 @@ async def get_monthly_new_users(
     - Total count
     - List of users with their details
     """
-    return UserStatisticsService.get_monthly_new_users(db, limit)
+    return UserStatisticsService.get_monthly_new_users(db, limit, cursor, with_count)
 
 
 @router.get("/education/completions", response_model=CompletionsListResponse)
-async def get_completions(
+def get_completions(
     limit: int = Query(50, ge=1, le=100, description="Maximum number of completions to return"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of the previous page"),
+    with_count: bool = Query(True, description="Include the total count; skip it when false"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ) -> CompletionsListResponse:
@@ -212,12 +284,14 @@ async def get_completions(
     - Total count
     - List of completions with user and course details
     """
-    return EducationService.get_completions(db, limit)
+    return EducationService.get_completions(db, limit, cursor, with_count)
 
 
 @router.get("/education/certificates", response_model=CertificatesListResponse)
-async def get_certificates(
+def get_certificates(
     limit: int = Query(50, ge=1, le=100, description="Maximum number of certificates to return"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of the previous page"),
+    with_count: bool = Query(True, description="Include the total count; skip it when false"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ) -> CertificatesListResponse:
@@ -228,14 +302,15 @@ async def get_certificates(
     - Total count
     - List of certificates with user and course details
     """
-    return EducationService.get_certificates(db, limit)
+    return EducationService.get_certificates(db, limit, cursor, with_count)
 
 
 @router.get("/users/daily-details", response_model=DailyUserDetailsResponse)
-async def get_daily_user_details(
+def get_daily_user_details(
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
     user_type: str = Query(..., alias="type", description="User type: 'active' or 'new'"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of users to return"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of the previous page"),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin),
 ) -> DailyUserDetailsResponse:
@@ -248,4 +323,4 @@ async def get_daily_user_details(
     - Total count
     - List of users with their details
     """
-    return UserStatisticsService.get_daily_details(db, date, user_type, limit)
+    return UserStatisticsService.get_daily_details(db, date, user_type, limit, cursor)
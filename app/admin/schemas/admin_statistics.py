@@ -240,6 +240,9 @@ class DailyUserDetailsResponse(BaseModel):
     type: str = Field(description="Type: 'active' or 'new'")
     total: int = Field(description="Total count of users")
     users: list[UserDetail] = Field(description="List of users")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page; null on the last page"
+    )
 
 
 class OrderDetailItem(BaseModel):
@@ -266,15 +269,20 @@ class OrderDetailsListResponse(BaseModel):
     """Response for order details list endpoint."""
 
     orders: list[OrderDetailResponse]
-    total_count: int
-    total_revenue: int = Field(description="Total revenue in grosz")
+    total_count: int | None = Field(description="Null when requested with with_count=false")
+    total_revenue: int | None = Field(
+        description="Total revenue in grosz; null when requested with with_count=false"
+    )
 
 
 class MonthlyUsersResponse(BaseModel):
     """Response for monthly new users endpoint."""
 
-    total: int
+    total: int | None = Field(description="Null when requested with with_count=false")
     users: list[UserDetail]
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page; null on the last page"
+    )
 
 
 class CompletionDetail(BaseModel):
@@ -289,8 +297,11 @@ class CompletionDetail(BaseModel):
 class CompletionsListResponse(BaseModel):
     """Response for monthly completions endpoint."""
 
-    total: int
+    total: int | None = Field(description="Null when requested with with_count=false")
     completions: list[CompletionDetail]
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page; null on the last page"
+    )
 
 
 class CertificateDetail(BaseModel):
@@ -306,5 +317,8 @@ class CertificateDetail(BaseModel):
 class CertificatesListResponse(BaseModel):
     """Response for monthly certificates endpoint."""
 
-    total: int
+    total: int | None = Field(description="Null when requested with with_count=false")
     certificates: list[CertificateDetail]
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page; null on the last page"
+    )
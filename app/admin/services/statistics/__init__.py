@@ -1,7 +1,7 @@
 """Statistics module for aggregating data from various models.
 
 This module is split into domain-specific services for better maintainability:
-- base: Period helpers, calculation utilities
+- base: Period helpers, calculation utilities, keyset pagination
 - dashboard_service: Dashboard summary KPIs
 - revenue_service: Revenue statistics and data points
 - order_service: Order statistics and breakdowns
@@ -11,10 +11,16 @@ This module is split into domain-specific services for better maintainability:
 """
 
 from app.admin.services.statistics.base import (
+    PeriodContext,
+    active_users_since_query,
     calculate_change_percent,
     count_active_users,
+    count_active_users_since,
+    decode_cursor,
+    encode_cursor,
     get_period_boundaries,
     get_previous_period,
+    paginate_keyset,
 )
 from app.admin.services.statistics.dashboard_service import DashboardService
 from app.admin.services.statistics.education_service import EducationService
@@ -25,10 +31,16 @@ from app.admin.services.statistics.user_service import UserStatisticsService
 
 __all__ = [
     # Base utilities
+    "PeriodContext",
     "get_period_boundaries",
     "get_previous_period",
     "calculate_change_percent",
     "count_active_users",
+    "count_active_users_since",
+    "active_users_since_query",
+    "encode_cursor",
+    "decode_cursor",
+    "paginate_keyset",
     # Services
     "DashboardService",
     "RevenueService",
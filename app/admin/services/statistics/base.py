@@ -1,43 +1,74 @@
 """Base utilities and helpers for statistics services."""
 
-from datetime import UTC, datetime, timedelta
+import base64
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import UUID
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, func, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session
 
 from app.auth.models.user_daily_activity import UserDailyActivity
-
-
-def get_period_boundaries(period: str) -> tuple[datetime, datetime]:
+from app.core.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class PeriodContext:
+    """Calendar boundaries in UTC, computed once per statistics request."""
+
+    now: datetime
+    today_start: datetime
+    week_start: datetime
+    month_start: datetime
+    year_start: datetime
+
+    @classmethod
+    def current(cls) -> "PeriodContext":
+        return cls.at(datetime.now(UTC))
+
+    @classmethod
+    def at(cls, now: datetime) -> "PeriodContext":
+        """Boundaries of the day, week, month and year containing ``now``."""
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return cls(
+            now=now,
+            today_start=today_start,
+            week_start=today_start - timedelta(days=today_start.weekday()),
+            month_start=today_start.replace(day=1),
+            year_start=today_start.replace(month=1, day=1),
+        )
+
+
+def get_period_boundaries(
+    period: str, context: PeriodContext | None = None
+) -> tuple[datetime, datetime]:
     """Get start and end datetime for a period.
 
     Args:
         period: One of 'today', 'this_week', 'this_month', 'last_30_days',
                 'last_90_days', 'this_year'. Defaults to 'last_30_days'.
+        context: Boundaries to reuse; computed from the current time if omitted.
 
     Returns:
         Tuple of (start_datetime, end_datetime) in UTC.
     """
-    now = datetime.now(UTC)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    ctx = context or PeriodContext.current()
 
     if period == "today":
-        return today_start, now
+        return ctx.today_start, ctx.now
     elif period == "this_week":
-        week_start = today_start - timedelta(days=today_start.weekday())
-        return week_start, now
+        return ctx.week_start, ctx.now
     elif period == "this_month":
-        month_start = today_start.replace(day=1)
-        return month_start, now
+        return ctx.month_start, ctx.now
     elif period == "last_30_days":
-        return today_start - timedelta(days=30), now
+        return ctx.today_start - timedelta(days=30), ctx.now
     elif period == "last_90_days":
-        return today_start - timedelta(days=90), now
+        return ctx.today_start - timedelta(days=90), ctx.now
     elif period == "this_year":
-        year_start = today_start.replace(month=1, day=1)
-        return year_start, now
+        return ctx.year_start, ctx.now
     else:
-        return today_start - timedelta(days=30), now
+        return ctx.today_start - timedelta(days=30), ctx.now
 
 
 def get_previous_period(start: datetime, end: datetime) -> tuple[datetime, datetime]:
@@ -73,22 +104,104 @@ def calculate_change_percent(current: int | float, previous: int | float) -> flo
 
 def count_active_users(
     db: Session,
-    since: datetime,
-    until: datetime | None = None,
+    since: date,
+    until: date | None = None,
 ) -> int:
     """Count distinct active users from daily activity log.
 
     Args:
         db: Database session.
-        since: Count activity from this datetime.
-        until: Count activity until this datetime (exclusive). If None, no upper bound.
+        since: Count activity from this day.
+        until: Count activity until this day (exclusive). If None, no upper bound.
 
     Returns:
         Number of distinct active users in the period.
     """
     query = db.query(func.count(func.distinct(UserDailyActivity.user_id))).filter(
-        UserDailyActivity.date >= since.date()
+        UserDailyActivity.date >= since
     )
     if until is not None:
-        query = query.filter(UserDailyActivity.date < until.date())
+        query = query.filter(UserDailyActivity.date < until)
     return query.scalar() or 0
+
+
+def count_active_users_since(db: Session, *since: date) -> list[int]:
+    """Count distinct active users from each of several start days.
+
+    All counts come from a single scan of the activity log from the earliest
+    start, with one filtered ``COUNT(DISTINCT)`` per start, instead of one
+    query per period.
+
+    Args:
+        db: Database session.
+        *since: Start days; each count has no upper bound.
+
+    Returns:
+        Number of distinct active users from each start, in argument order.
+    """
+    if not since:
+        return []
+    return [count or 0 for count in active_users_since_query(db, *since).one()]
+
+
+def active_users_since_query(db: Session, *since: date) -> Query[Any]:
+    """Build the one-row query behind ``count_active_users_since``.
+
+    Use it as a subquery to fetch the counts together with other aggregates.
+    At least one start day is required.
+    """
+    return db.query(
+        *(
+            func.count(func.distinct(UserDailyActivity.user_id)).filter(
+                UserDailyActivity.date >= start
+            )
+            for start in since
+        )
+    ).filter(UserDailyActivity.date >= min(since))
+
+
+def encode_cursor(position: datetime, key: UUID) -> str:
+    """Encode a keyset position (sort timestamp, row id) as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{position.isoformat()}|{key}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValidationError: If the cursor is malformed.
+    """
+    try:
+        position, key = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(position), UUID(key)
+    except ValueError as exc:
+        raise ValidationError("Nieprawidłowy kursor", field="cursor") from exc
+
+
+def paginate_keyset(
+    query: Query[Any],
+    position_column: InstrumentedAttribute[Any],
+    key_column: InstrumentedAttribute[Any],
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[Row[Any]], str | None]:
+    """Fetch one page of ``query``, newest first, continuing after ``cursor``.
+
+    Rows are ordered by ``(position_column, key_column)`` descending and the
+    page starts with a row-value comparison against the cursor, so every page
+    is an index range scan no matter how deep it is, unlike OFFSET. Both
+    columns must be selected by ``query``.
+
+    Returns:
+        The rows of the page and the cursor of the next page, or None when
+        this is the last one.
+    """
+    if cursor:
+        position, key = decode_cursor(cursor)
+        query = query.filter(tuple_(position_column, key_column) < (position, key))
+    rows = query.order_by(position_column.desc(), key_column.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, position_column.key), getattr(last, key_column.key))
@@ -1,23 +1,43 @@
 """Dashboard statistics service."""
 
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
 
 from sqlalchemy.orm import Session
 
 from app.admin.schemas.admin_statistics import DashboardSummaryResponse, RevenueKPI
-from app.admin.services.statistics.base import calculate_change_percent
+from app.admin.services.statistics.base import PeriodContext, calculate_change_percent
 from app.admin.services.statistics.education_service import EducationService
 from app.admin.services.statistics.order_service import OrderStatisticsService
 from app.admin.services.statistics.rankings_service import RankingsService
 from app.admin.services.statistics.revenue_service import RevenueService
 from app.admin.services.statistics.user_service import UserStatisticsService
 
+# Upper bound on the database connections all dashboard requests together
+# hold for their KPI queries, on top of each request's own session. The
+# workers are shared, so concurrent requests queue for them rather than
+# each opening connections of its own; the budget stays well inside the
+# engine's pool (see app.db.session).
+DASHBOARD_QUERY_WORKERS = 4
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(
+    max_workers=DASHBOARD_QUERY_WORKERS, thread_name_prefix="dashboard-query"
+)
+
 
 class DashboardService:
     """Service for dashboard summary aggregation."""
 
     @staticmethod
-    def get_summary(db: Session) -> DashboardSummaryResponse:
+    def get_summary(
+        db: Session,
+        session_factory: Callable[[], Session] | None = None,
+        context: PeriodContext | None = None,
+    ) -> DashboardSummaryResponse:
         """Get complete dashboard summary with all KPIs.
 
         This method aggregates data from all specialized services to build
@@ -25,50 +45,90 @@ class DashboardService:
 
         Args:
             db: Database session.
+            session_factory: Sessions to run the KPI groups in concurrently on
+                the shared dashboard workers, one session per group. Without
+                it the groups run one after another in ``db``, within the
+                caller's transaction.
+            context: Boundaries to reuse; computed from the current time if omitted.
 
         Returns:
             DashboardSummaryResponse with all KPIs and top items.
         """
-        now = datetime.now(UTC)
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=today_start.weekday())
-        month_start = today_start.replace(day=1)
+        ctx = context or PeriodContext.current()
+        now, today_start = ctx.now, ctx.today_start
+        week_start, month_start = ctx.week_start, ctx.month_start
         prev_month_start = (month_start - timedelta(days=1)).replace(day=1)
         prev_week_start = week_start - timedelta(days=7)
 
-        # Revenue KPIs
-        today_revenue, _ = RevenueService.get_revenue_for_period(db, today_start, now)
-        week_revenue, _ = RevenueService.get_revenue_for_period(db, week_start, now)
-        month_revenue, _ = RevenueService.get_revenue_for_period(db, month_start, now)
-        prev_week_revenue, _ = RevenueService.get_revenue_for_period(
-            db, prev_week_start, week_start
+        # The KPI groups are independent aggregates, so with a session
+        # factory each runs on its own connection and the summary waits for
+        # the slowest one.
+        def submit(func: Callable[..., T], *args: Any) -> Callable[[], T]:
+            if session_factory is None:
+                result = func(db, *args)
+                return lambda: result
+
+            def run() -> T:
+                with session_factory() as session:
+                    return func(session, *args)
+
+            return _executor.submit(run).result
+
+        revenue = submit(
+            DashboardService._get_revenue_kpi,
+            now,
+            today_start,
+            week_start,
+            month_start,
+            prev_week_start,
+            prev_month_start,
+        )
+        orders = submit(OrderStatisticsService.get_kpis, today_start, month_start)
+        users = submit(UserStatisticsService.get_kpis, today_start, week_start, month_start)
+        education = submit(EducationService.get_kpis, month_start)
+        top_packages = submit(RankingsService.get_top_packages, 5)
+        top_courses = submit(RankingsService.get_top_courses, 5)
+
+        return DashboardSummaryResponse(
+            revenue=revenue(),
+            orders=orders(),
+            users=users(),
+            education=education(),
+            top_packages=top_packages(),
+            top_courses=top_courses(),
         )
-        prev_month_revenue, _ = RevenueService.get_revenue_for_period(
-            db, prev_month_start, month_start
+
+    @staticmethod
+    def _get_revenue_kpi(
+        db: Session,
+        now: datetime,
+        today_start: datetime,
+        week_start: datetime,
+        month_start: datetime,
+        prev_week_start: datetime,
+        prev_month_start: datetime,
+    ) -> RevenueKPI:
+        (
+            (today_revenue, _),
+            (week_revenue, _),
+            (month_revenue, _),
+            (prev_week_revenue, _),
+            (prev_month_revenue, _),
+        ) = RevenueService.get_revenue_for_periods(
+            db,
+            [
+                (today_start, now),
+                (week_start, now),
+                (month_start, now),
+                (prev_week_start, week_start),
+                (prev_month_start, month_start),
+            ],
         )
 
-        revenue_kpi = RevenueKPI(
+        return RevenueKPI(
             today=today_revenue,
             this_week=week_revenue,
             this_month=month_revenue,
             change_percent_week=calculate_change_percent(week_revenue, prev_week_revenue),
             change_percent_month=calculate_change_percent(month_revenue, prev_month_revenue),
         )
-
-        # Other KPIs from specialized services
-        orders_kpi = OrderStatisticsService.get_kpis(db, today_start, month_start)
-        users_kpi = UserStatisticsService.get_kpis(db, today_start, week_start, month_start)
-        education_kpi = EducationService.get_kpis(db, month_start)
-
-        # Top items from rankings service
-        top_packages = RankingsService.get_top_packages(db, limit=5)
-        top_courses = RankingsService.get_top_courses(db, limit=5)
-
-        return DashboardSummaryResponse(
-            revenue=revenue_kpi,
-            orders=orders_kpi,
-            users=users_kpi,
-            education=education_kpi,
-            top_packages=top_packages,
-            top_courses=top_courses,
-        )
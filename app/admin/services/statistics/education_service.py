@@ -1,6 +1,7 @@
 """Education statistics service."""
 
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -14,6 +15,7 @@ from app.admin.schemas.admin_statistics import (
     EducationKPI,
     EducationStatisticsResponse,
 )
+from app.admin.services.statistics.base import paginate_keyset
 from app.auth.models.user import User
 from app.courses.models.certificate import Certificate
 from app.courses.models.course import Course
@@ -35,24 +37,19 @@ class EducationService:
         Returns:
             EducationKPI with enrollment, completion, and certificate counts.
         """
-        total_enrollments = db.query(Enrollment).count()
-        enrollments_month = (
-            db.query(Enrollment).filter(Enrollment.enrolled_at >= month_start).count()
-        )
-        completions_month = (
-            db.query(Enrollment)
-            .filter(
-                Enrollment.completed_at.isnot(None),
-                Enrollment.completed_at >= month_start,
-            )
-            .count()
-        )
+        total_enrollments, enrollments_month, completions_month, total_completed = db.query(
+            func.count(Enrollment.id),
+            func.count(Enrollment.id).filter(Enrollment.enrolled_at >= month_start),
+            func.count(Enrollment.id).filter(Enrollment.completed_at >= month_start),
+            func.count(Enrollment.id).filter(Enrollment.completed_at.isnot(None)),
+        ).one()
         certificates_month = (
-            db.query(Certificate).filter(Certificate.issued_at >= month_start).count()
+            db.query(func.count(Certificate.id))
+            .filter(Certificate.issued_at >= month_start)
+            .scalar()
         )
 
         # Average completion rate
-        total_completed = db.query(Enrollment).filter(Enrollment.completed_at.isnot(None)).count()
         avg_completion = (
             round((total_completed / total_enrollments) * 100, 2) if total_enrollments > 0 else 0.0
         )
@@ -78,57 +75,53 @@ class EducationService:
         now = datetime.now(UTC)
         week_ago = now - timedelta(days=7)
 
-        total_enrollments = db.query(Enrollment).count()
+        # Per-course aggregates come from one grouped query per table rather
+        # than five queries per course; the totals are their sums, as every
+        # enrollment and certificate belongs to a course.
+        enrollment_counts = {
+            course_id: (enrollments, active, completed)
+            for course_id, enrollments, active, completed in db.query(
+                Enrollment.course_id,
+                func.count(Enrollment.id),
+                func.count(Enrollment.id).filter(Enrollment.last_accessed_at >= week_ago),
+                func.count(Enrollment.id).filter(Enrollment.completed_at.isnot(None)),
+            ).group_by(Enrollment.course_id)
+        }
+        certificate_counts: dict[UUID, int] = {
+            row[0]: row[1]
+            for row in db.query(Certificate.course_id, func.count(Certificate.id)).group_by(
+                Certificate.course_id
+            )
+        }
+        # Progress of enrolled users' lessons, averaged per course they are enrolled in
+        average_progress = dict(
+            db.query(Enrollment.course_id, func.avg(LessonProgress.completion_percentage))
+            .join(LessonProgress, LessonProgress.user_id == Enrollment.user_id)
+            .group_by(Enrollment.course_id)
+        )
+
+        total_enrollments = sum(counts[0] for counts in enrollment_counts.values())
+        total_completions = sum(counts[2] for counts in enrollment_counts.values())
+        total_certificates = sum(certificate_counts.values())
         active_learners = (
             db.query(func.count(func.distinct(Enrollment.user_id)))
             .filter(Enrollment.last_accessed_at >= week_ago)
             .scalar()
             or 0
         )
-        total_completions = db.query(Enrollment).filter(Enrollment.completed_at.isnot(None)).count()
-        total_certificates = db.query(Certificate).count()
         avg_completion_rate = (
             round((total_completions / total_enrollments) * 100, 2)
             if total_enrollments > 0
             else 0.0
         )
 
-        # Per-course statistics
-        courses_data = db.query(Course).filter(Course.is_published == True).all()  # noqa: E712
+        courses_data = db.query(Course.id, Course.title, Course.slug).filter(
+            Course.is_published == True  # noqa: E712
+        )
 
         courses = []
         for course in courses_data:
-            enrollments = db.query(Enrollment).filter(Enrollment.course_id == course.id).count()
-            active = (
-                db.query(Enrollment)
-                .filter(
-                    Enrollment.course_id == course.id,
-                    Enrollment.last_accessed_at >= week_ago,
-                )
-                .count()
-            )
-            completed = (
-                db.query(Enrollment)
-                .filter(
-                    Enrollment.course_id == course.id,
-                    Enrollment.completed_at.isnot(None),
-                )
-                .count()
-            )
-            certs = db.query(Certificate).filter(Certificate.course_id == course.id).count()
-
-            # Calculate average progress
-            progress_data = (
-                db.query(func.avg(LessonProgress.completion_percentage))
-                .join(
-                    Enrollment,
-                    (Enrollment.user_id == LessonProgress.user_id)
-                    & (Enrollment.course_id == course.id),
-                )
-                .scalar()
-            )
-            avg_progress = round(progress_data or 0, 2)
-
+            enrollments, active, completed = enrollment_counts.get(course.id, (0, 0, 0))
             courses.append(
                 CourseProgressStats(
                     id=str(course.id),
@@ -137,8 +130,8 @@ class EducationService:
                     total_enrollments=enrollments,
                     active_learners=active,
                     completed_count=completed,
-                    average_progress=avg_progress,
-                    certificates_issued=certs,
+                    average_progress=round(average_progress.get(course.id) or 0, 2),
+                    certificates_issued=certificate_counts.get(course.id, 0),
                 )
             )
 
@@ -152,68 +145,94 @@ class EducationService:
         )
 
     @staticmethod
-    def get_completions(db: Session, limit: int = 50) -> CompletionsListResponse:
+    def get_completions(
+        db: Session, limit: int = 50, cursor: str | None = None, with_count: bool = True
+    ) -> CompletionsListResponse:
         """Get all course completions (most recent first).
 
         Args:
             db: Database session.
             limit: Maximum number of completions to return.
+            cursor: Cursor of the page to return, from a previous response.
+            with_count: Whether to compute the total; when False it is None.
 
         Returns:
             CompletionsListResponse with total count and completion details.
         """
-        total = db.query(Enrollment).filter(Enrollment.completed_at.isnot(None)).count()
+        total = (
+            db.query(func.count(Enrollment.id)).filter(Enrollment.completed_at.isnot(None)).scalar()
+            if with_count
+            else None
+        )
 
-        enrollments = (
-            db.query(Enrollment)
+        query = (
+            db.query(Enrollment.id, Enrollment.completed_at, User.email, User.name, Course.title)
+            .outerjoin(User, User.id == Enrollment.user_id)
+            .outerjoin(Course, Course.id == Enrollment.course_id)
             .filter(Enrollment.completed_at.isnot(None))
-            .order_by(Enrollment.completed_at.desc())
-            .limit(limit)
-            .all()
+        )
+        rows, next_cursor = paginate_keyset(
+            query, Enrollment.completed_at, Enrollment.id, cursor, limit
         )
 
-        completions = []
-        for e in enrollments:
-            user = db.query(User).filter(User.id == e.user_id).first()
-            course = db.query(Course).filter(Course.id == e.course_id).first()
-            completions.append(
-                CompletionDetail(
-                    user_email=user.email if user else "",
-                    user_name=user.name if user else None,
-                    course_title=course.title if course else "",
-                    completed_at=e.completed_at,
-                )
+        completions = [
+            CompletionDetail.model_construct(
+                user_email=row.email or "",
+                user_name=row.name,
+                course_title=row.title or "",
+                completed_at=row.completed_at,
             )
+            for row in rows
+        ]
 
-        return CompletionsListResponse(total=total, completions=completions)
+        return CompletionsListResponse(
+            total=total, completions=completions, next_cursor=next_cursor
+        )
 
     @staticmethod
-    def get_certificates(db: Session, limit: int = 50) -> CertificatesListResponse:
+    def get_certificates(
+        db: Session, limit: int = 50, cursor: str | None = None, with_count: bool = True
+    ) -> CertificatesListResponse:
         """Get all issued certificates (most recent first).
 
         Args:
             db: Database session.
             limit: Maximum number of certificates to return.
+            cursor: Cursor of the page to return, from a previous response.
+            with_count: Whether to compute the total; when False it is None.
 
         Returns:
             CertificatesListResponse with total count and certificate details.
         """
-        total = db.query(Certificate).count()
-
-        certs = db.query(Certificate).order_by(Certificate.issued_at.desc()).limit(limit).all()
-
-        certificates = []
-        for c in certs:
-            user = db.query(User).filter(User.id == c.user_id).first()
-            course = db.query(Course).filter(Course.id == c.course_id).first()
-            certificates.append(
-                CertificateDetail(
-                    user_email=user.email if user else "",
-                    user_name=user.name if user else None,
-                    course_title=course.title if course else "",
-                    certificate_code=c.certificate_code,
-                    issued_at=c.issued_at,
-                )
+        total = db.query(func.count(Certificate.id)).scalar() if with_count else None
+
+        query = (
+            db.query(
+                Certificate.id,
+                Certificate.issued_at,
+                Certificate.certificate_code,
+                User.email,
+                User.name,
+                Course.title,
+            )
+            .outerjoin(User, User.id == Certificate.user_id)
+            .outerjoin(Course, Course.id == Certificate.course_id)
+        )
+        rows, next_cursor = paginate_keyset(
+            query, Certificate.issued_at, Certificate.id, cursor, limit
+        )
+
+        certificates = [
+            CertificateDetail.model_construct(
+                user_email=row.email or "",
+                user_name=row.name,
+                course_title=row.title or "",
+                certificate_code=row.certificate_code,
+                issued_at=row.issued_at,
             )
+            for row in rows
+        ]
 
-        return CertificatesListResponse(total=total, certificates=certificates)
+        return CertificatesListResponse(
+            total=total, certificates=certificates, next_cursor=next_cursor
+        )
@@ -2,8 +2,9 @@
 
 from datetime import datetime
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, func, or_
 from sqlalchemy.orm import Session
 
 from app.admin.schemas.admin_statistics import (
@@ -34,20 +35,28 @@ class OrderStatisticsService:
         Returns:
             OrdersKPI with today's orders, pending, completed, and failed counts.
         """
-        today_orders = db.query(Order).filter(Order.created_at >= today_start).count()
-        pending_orders = db.query(Order).filter(Order.status == OrderStatus.PENDING).count()
-        completed_month = (
-            db.query(Order)
+        # One pass over the orders matching any of the counters; the OR of
+        # indexed conditions keeps it a bitmap scan rather than a full scan.
+        is_completed_this_month = (Order.status == OrderStatus.COMPLETED) & (
+            Order.payment_completed_at >= month_start
+        )
+        today_orders, pending_orders, completed_month, failed_month = (
+            db.query(
+                func.count(Order.id).filter(Order.created_at >= today_start),
+                func.count(Order.id).filter(Order.status == OrderStatus.PENDING),
+                func.count(Order.id).filter(is_completed_this_month),
+                func.count(Order.id).filter(
+                    Order.status == OrderStatus.FAILED, Order.created_at >= month_start
+                ),
+            )
             .filter(
-                Order.status == OrderStatus.COMPLETED,
-                Order.payment_completed_at >= month_start,
+                or_(
+                    Order.created_at >= min(today_start, month_start),
+                    Order.status == OrderStatus.PENDING,
+                    is_completed_this_month,
+                )
             )
-            .count()
-        )
-        failed_month = (
-            db.query(Order)
-            .filter(Order.status == OrderStatus.FAILED, Order.created_at >= month_start)
-            .count()
+            .one()
         )
 
         return OrdersKPI(
@@ -77,12 +86,12 @@ class OrderStatisticsService:
         if end_date:
             query = query.filter(Order.created_at <= end_date)
 
-        total_orders = query.count()
-
-        # By status
+        # By status; every order falls in exactly one group, so the group
+        # counts add up to the total without a separate count query.
         status_counts = (
             query.with_entities(Order.status, func.count(Order.id)).group_by(Order.status).all()
         )
+        total_orders = sum(c for _, c in status_counts)
         by_status = [
             OrderStatusCount(
                 status=s.value if hasattr(s, "value") else str(s),
@@ -115,7 +124,18 @@ class OrderStatisticsService:
         ]
 
         # Recent orders
-        recent = db.query(Order).order_by(Order.created_at.desc()).limit(10).all()
+        recent = (
+            db.query(
+                Order.id,
+                Order.order_number,
+                Order.email,
+                Order.status,
+                Order.total,
+                Order.created_at,
+            )
+            .order_by(Order.created_at.desc())
+            .limit(10)
+        )
         recent_orders: list[dict[str, Any]] = [
             {
                 "id": str(o.id),
@@ -141,6 +161,7 @@ class OrderStatisticsService:
         period: str | None = "this_month",
         status: str | None = None,
         limit: int = 50,
+        with_count: bool = True,
     ) -> OrderDetailsListResponse:
         """Get detailed order list with items for the modal view.
 
@@ -149,59 +170,78 @@ class OrderStatisticsService:
             period: Time period filter.
             status: Optional status filter.
             limit: Maximum number of orders to return.
+            with_count: Whether to compute the total count and revenue; when
+                False both are None.
 
         Returns:
             OrderDetailsListResponse with orders, total count, and revenue.
         """
-        query = db.query(Order)
-        start: datetime | None = None
-        end: datetime | None = None
-
+        period_filters: list[ColumnElement[bool]] = []
         if period:
             start, end = get_period_boundaries(period)
-            query = query.filter(
-                Order.created_at >= start,
-                Order.created_at <= end,
+            period_filters = [Order.created_at >= start, Order.created_at <= end]
+        status_filters = [Order.status == status] if status else []
+        query = db.query(Order).filter(*period_filters, *status_filters)
+
+        total_count: int | None = None
+        total_revenue: int | None = None
+        if with_count:
+            # Both totals in one pass over the period's orders. The revenue
+            # counts completed orders within the same period whatever the
+            # status filter, as before.
+            total_count, total_revenue = (
+                db.query(
+                    func.count(Order.id).filter(*status_filters)
+                    if status_filters
+                    else func.count(Order.id),
+                    func.coalesce(
+                        func.sum(Order.total).filter(Order.status == OrderStatus.COMPLETED), 0
+                    ),
+                )
+                .filter(*period_filters)
+                .one()
             )
 
-        if status:
-            query = query.filter(Order.status == status)
-
-        total_count = query.count()
-
-        # Total revenue (completed only within the same filters)
-        revenue_query = db.query(func.sum(Order.total)).filter(
-            Order.status == OrderStatus.COMPLETED,
+        orders = (
+            query.with_entities(
+                Order.id,
+                Order.order_number,
+                Order.email,
+                Order.name,
+                Order.status,
+                Order.total,
+                Order.created_at,
+            )
+            .order_by(Order.created_at.desc())
+            .limit(limit)
+            .all()
         )
-        if period and start and end:
-            revenue_query = revenue_query.filter(
-                Order.created_at >= start,
-                Order.created_at <= end,
+
+        items_by_order: dict[UUID, list[OrderDetailItem]] = {}
+        if orders:
+            items = db.query(OrderItem.order_id, OrderItem.package_title, OrderItem.price).filter(
+                OrderItem.order_id.in_([order.id for order in orders])
             )
-        total_revenue = revenue_query.scalar() or 0
-
-        orders = query.order_by(Order.created_at.desc()).limit(limit).all()
-
-        order_responses = []
-        for order in orders:
-            items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
-            order_responses.append(
-                OrderDetailResponse(
-                    id=str(order.id),
-                    order_number=order.order_number,
-                    email=order.email,
-                    name=order.name,
-                    status=order.status.value
-                    if hasattr(order.status, "value")
-                    else str(order.status),
-                    total=order.total,
-                    created_at=order.created_at,
-                    items=[
-                        OrderDetailItem(package_title=item.package_title, price=item.price)
-                        for item in items
-                    ],
+            for item in items:
+                items_by_order.setdefault(item.order_id, []).append(
+                    OrderDetailItem.model_construct(
+                        package_title=item.package_title, price=item.price
+                    )
                 )
+
+        order_responses = [
+            OrderDetailResponse.model_construct(
+                id=str(order.id),
+                order_number=order.order_number,
+                email=order.email,
+                name=order.name,
+                status=order.status.value if hasattr(order.status, "value") else str(order.status),
+                total=order.total,
+                created_at=order.created_at,
+                items=items_by_order.get(order.id, []),
             )
+            for order in orders
+        ]
 
         return OrderDetailsListResponse(
             orders=order_responses,
@@ -1,6 +1,6 @@
 """Rankings statistics service."""
 
-from sqlalchemy import func
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
 from app.admin.schemas.admin_statistics import (
@@ -136,6 +136,9 @@ class RankingsService:
                 Course.slug,
                 Course.category,
                 func.count(Enrollment.id).label("enrollments"),
+                func.count(Enrollment.id)
+                .filter(Enrollment.completed_at.isnot(None))
+                .label("completions"),
             )
             .join(Enrollment, Enrollment.course_id == Course.id)
             .group_by(Course.id)
@@ -146,13 +149,8 @@ class RankingsService:
 
         courses = []
         for c in course_stats:
-            completion_count = (
-                db.query(Enrollment)
-                .filter(Enrollment.course_id == c.id, Enrollment.completed_at.isnot(None))
-                .count()
-            )
             completion_rate = (
-                round((completion_count / c.enrollments) * 100, 2) if c.enrollments > 0 else 0.0
+                round((c.completions / c.enrollments) * 100, 2) if c.enrollments > 0 else 0.0
             )
             courses.append(
                 CourseRanking(
@@ -161,7 +159,7 @@ class RankingsService:
                     slug=c.slug,
                     category=c.category,
                     enrollment_count=c.enrollments,
-                    completion_count=completion_count,
+                    completion_count=c.completions,
                     completion_rate=completion_rate,
                 )
             )
@@ -178,49 +176,39 @@ class RankingsService:
         Returns:
             SalesWindowsResponse with per-window statistics.
         """
-        windows = db.query(SalesWindow).order_by(SalesWindow.starts_at.desc()).all()
-
-        window_stats = []
-        for w in windows:
-            orders_query = db.query(Order).filter(
-                Order.status == OrderStatus.COMPLETED,
-                Order.payment_completed_at >= w.starts_at,
-                Order.payment_completed_at <= w.ends_at,
+        # One grouped query for all windows instead of three per window.
+        rows = (
+            db.query(
+                SalesWindow,
+                func.count(Order.id),
+                func.coalesce(func.sum(Order.total), 0),
+                func.count(func.distinct(Order.email)),
             )
-
-            total_orders = orders_query.count()
-            total_revenue = (
-                db.query(func.sum(Order.total))
-                .filter(
+            .outerjoin(
+                Order,
+                and_(
                     Order.status == OrderStatus.COMPLETED,
-                    Order.payment_completed_at >= w.starts_at,
-                    Order.payment_completed_at <= w.ends_at,
-                )
-                .scalar()
-                or 0
-            )
-            unique_customers = (
-                db.query(func.count(func.distinct(Order.email)))
-                .filter(
-                    Order.status == OrderStatus.COMPLETED,
-                    Order.payment_completed_at >= w.starts_at,
-                    Order.payment_completed_at <= w.ends_at,
-                )
-                .scalar()
-                or 0
+                    Order.payment_completed_at >= SalesWindow.starts_at,
+                    Order.payment_completed_at <= SalesWindow.ends_at,
+                ),
             )
+            .group_by(SalesWindow.id)
+            .order_by(SalesWindow.starts_at.desc())
+            .all()
+        )
 
-            window_stats.append(
-                SalesWindowStats(
-                    id=str(w.id),
-                    name=w.name,
-                    status=w.status,
-                    starts_at=w.starts_at,
-                    ends_at=w.ends_at,
-                    total_orders=total_orders,
-                    total_revenue=total_revenue,
-                    unique_customers=unique_customers,
-                )
+        window_stats = [
+            SalesWindowStats(
+                id=str(w.id),
+                name=w.name,
+                status=w.status,
+                starts_at=w.starts_at,
+                ends_at=w.ends_at,
+                total_orders=total_orders,
+                total_revenue=total_revenue,
+                unique_customers=unique_customers,
             )
+            for w, total_orders, total_revenue, unique_customers in rows
+        ]
 
         return SalesWindowsResponse(windows=window_stats)
@@ -1,8 +1,10 @@
 """Revenue statistics service."""
 
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
 
-from sqlalchemy import func, or_
+from sqlalchemy import BigInteger, ColumnElement, Date, Row, cast, column, func, not_, table
 from sqlalchemy.orm import Session
 
 from app.admin.schemas.admin_statistics import (
@@ -12,8 +14,38 @@ from app.admin.schemas.admin_statistics import (
     RevenueSummary,
 )
 from app.admin.services.statistics.base import calculate_change_percent, get_previous_period
+from app.core.constants import DAILY_REVENUE_REFRESH_MINUTES
 from app.packages.models.order import Order, OrderStatus
 
+# Materialized view of completed orders per UTC day, see app.packages.models.order.
+daily_revenue = table(
+    "mv_daily_revenue",
+    column("day", Date),
+    column("revenue", BigInteger),
+    column("orders_count", BigInteger),
+)
+
+
+def _paid_at() -> ColumnElement[datetime]:
+    """Time an order counts towards revenue: its payment, or its creation if unpaid."""
+    return func.coalesce(Order.payment_completed_at, Order.created_at)
+
+
+def _paid_between(start: datetime, end: datetime) -> ColumnElement[bool]:
+    # Matches the ix_orders_completed_paid_at expression index.
+    return _paid_at().between(start, end)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """``value`` in UTC; naive datetimes are taken to be UTC already, as by the database."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
 
 class RevenueService:
     """Service for revenue-related statistics."""
@@ -32,24 +64,40 @@ class RevenueService:
         Returns:
             Tuple of (total_revenue, order_count).
         """
-        result = (
-            db.query(func.sum(Order.total), func.count(Order.id))
+        return RevenueService.get_revenue_for_periods(db, [(start, end)])[0]
+
+    @staticmethod
+    def get_revenue_for_periods(
+        db: Session, periods: Sequence[tuple[datetime, datetime]]
+    ) -> list[tuple[int, int]]:
+        """Get total revenue and order count for several periods in a single query.
+
+        Orders are matched to periods as in get_revenue_for_period; the query
+        scans the span covering all periods once and aggregates each one separately.
+
+        Args:
+            db: Database session.
+            periods: (start, end) datetimes of each period.
+
+        Returns:
+            (total_revenue, order_count) of each period, in the order of ``periods``.
+        """
+        columns: list[ColumnElement[int]] = []
+        for start, end in periods:
+            in_period = _paid_between(start, end)
+            columns += [
+                func.coalesce(func.sum(Order.total).filter(in_period), 0),
+                func.count(Order.id).filter(in_period),
+            ]
+        row = (
+            db.query(*columns)
             .filter(
                 Order.status == OrderStatus.COMPLETED,
-                or_(
-                    # Has payment_completed_at in range
-                    (Order.payment_completed_at >= start) & (Order.payment_completed_at <= end),
-                    # Or payment_completed_at is NULL but created_at is in range
-                    (Order.payment_completed_at.is_(None))
-                    & (Order.created_at >= start)
-                    & (Order.created_at <= end),
-                ),
+                _paid_between(min(start for start, _ in periods), max(end for _, end in periods)),
             )
-            .first()
+            .one()
         )
-        if result is None:
-            return 0, 0
-        return result[0] or 0, result[1] or 0
+        return [(row[i], row[i + 1]) for i in range(0, len(row), 2)]
 
     @staticmethod
     def get_statistics(
@@ -71,9 +119,13 @@ class RevenueService:
         Returns:
             RevenueStatisticsResponse with current/previous summaries and data points.
         """
-        current_revenue, current_count = RevenueService.get_revenue_for_period(
-            db, start_date, end_date
-        )
+        # The previous period is fetched in the same query as the current one.
+        periods = [(start_date, end_date)]
+        if compare_previous:
+            periods.append(get_previous_period(start_date, end_date))
+        totals = RevenueService.get_revenue_for_periods(db, periods)
+
+        current_revenue, current_count = totals[0]
         avg_order_value = current_revenue // current_count if current_count > 0 else 0
 
         current_summary = RevenueSummary(
@@ -85,10 +137,7 @@ class RevenueService:
         previous_summary = None
         change_percent = None
         if compare_previous:
-            prev_start, prev_end = get_previous_period(start_date, end_date)
-            prev_revenue, prev_count = RevenueService.get_revenue_for_period(
-                db, prev_start, prev_end
-            )
+            prev_revenue, prev_count = totals[1]
             prev_avg = prev_revenue // prev_count if prev_count > 0 else 0
             previous_summary = RevenueSummary(
                 total=prev_revenue,
@@ -112,59 +161,98 @@ class RevenueService:
         start_date: datetime,
         end_date: datetime,
         granularity: Granularity,
+        now: datetime | None = None,
     ) -> list[RevenueDataPoint]:
-        """Generate revenue data points for chart."""
-        data_points = []
+        """Generate revenue data points for chart.
+
+        Buckets are made of UTC days, like the mv_daily_revenue rows, and
+        cover exactly the orders in the period's summary. Whole days that the
+        rollup's last scheduled refresh has covered are read from it; the
+        partial first and last days and the days since that refresh are
+        summed from orders directly, so an order shows up in the chart as
+        soon as in the total.
+        """
+        start, end = _as_utc(start_date), _as_utc(end_date)
+        buckets = RevenueService._get_buckets(start.date(), end.date(), granularity)
+        if not buckets:
+            return []
+
+        # Whole days of the period, as far as the rollup can be relied on:
+        # orders paid in the last refresh interval may not be in it yet.
+        first_whole_day = start.date()
+        if start > _day_start(first_whole_day):
+            first_whole_day += timedelta(days=1)
+        after_whole_days = (end + timedelta(microseconds=1)).date()
+        refreshed_until = _as_utc(now or datetime.now(UTC)) - timedelta(
+            minutes=DAILY_REVENUE_REFRESH_MINUTES
+        )
+        rollup_start = first_whole_day
+        rollup_end = max(rollup_start, min(after_whole_days, refreshed_until.date()))
+
+        rows: list[Row[tuple[date, int, int]]] = []
+        if rollup_start < rollup_end:
+            rows += db.query(
+                daily_revenue.c.day, daily_revenue.c.revenue, daily_revenue.c.orders_count
+            ).filter(daily_revenue.c.day >= rollup_start, daily_revenue.c.day < rollup_end)
+
+        paid_day = cast(func.timezone("UTC", _paid_at()), Date)
+        rows += (
+            db.query(paid_day, func.sum(Order.total), func.count(Order.id))
+            .filter(
+                Order.status == OrderStatus.COMPLETED,
+                _paid_between(start, end),
+                not_(
+                    (_paid_at() >= _day_start(rollup_start)) & (_paid_at() < _day_start(rollup_end))
+                ),
+            )
+            .group_by(paid_day)
+        )
+
+        bucket_starts = [bucket_start for _, bucket_start, _ in buckets]
+        revenue = [0] * len(buckets)
+        orders_count = [0] * len(buckets)
+        for day, day_revenue, day_orders in rows:
+            index = bisect_right(bucket_starts, day) - 1
+            revenue[index] += day_revenue
+            orders_count[index] += day_orders
+
+        return [
+            RevenueDataPoint(date=label, revenue=revenue[i], orders_count=orders_count[i])
+            for i, (label, _, _) in enumerate(buckets)
+        ]
+
+    @staticmethod
+    def _get_buckets(
+        start: date, end: date, granularity: Granularity
+    ) -> list[tuple[str, date, date]]:
+        """Split ``start``..``end`` (inclusive) into (label, first day, end day exclusive)."""
+        buckets = []
+        last = end + timedelta(days=1)
 
         if granularity == Granularity.DAILY:
-            current = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            while current <= end_date:
+            current = start
+            while current < last:
                 next_day = current + timedelta(days=1)
-                revenue, count = RevenueService.get_revenue_for_period(db, current, next_day)
-                data_points.append(
-                    RevenueDataPoint(
-                        date=current.strftime("%Y-%m-%d"),
-                        revenue=revenue,
-                        orders_count=count,
-                    )
-                )
+                buckets.append((current.strftime("%Y-%m-%d"), current, next_day))
                 current = next_day
 
         elif granularity == Granularity.WEEKLY:
-            current = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+            current = start
             week_num = 1
-            while current <= end_date:
+            while current < last:
                 next_week = current + timedelta(days=7)
-                revenue, count = RevenueService.get_revenue_for_period(
-                    db, current, min(next_week, end_date)
-                )
-                data_points.append(
-                    RevenueDataPoint(
-                        date=f"Week {week_num}",
-                        revenue=revenue,
-                        orders_count=count,
-                    )
-                )
+                buckets.append((f"Week {week_num}", current, min(next_week, last)))
                 current = next_week
                 week_num += 1
 
         elif granularity == Granularity.MONTHLY:
-            current = start_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            while current <= end_date:
+            current = start.replace(day=1)
+            while current < last:
                 if current.month == 12:
                     next_month = current.replace(year=current.year + 1, month=1)
                 else:
                     next_month = current.replace(month=current.month + 1)
-                revenue, count = RevenueService.get_revenue_for_period(
-                    db, current, min(next_month, end_date)
-                )
-                data_points.append(
-                    RevenueDataPoint(
-                        date=current.strftime("%Y-%m"),
-                        revenue=revenue,
-                        orders_count=count,
-                    )
-                )
+                buckets.append((current.strftime("%Y-%m"), current, min(next_month, last)))
                 current = next_month
 
-        return data_points
+        return buckets
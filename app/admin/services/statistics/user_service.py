@@ -1,10 +1,12 @@
 """User statistics service."""
 
-from datetime import UTC, datetime, timedelta
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, true
+from sqlalchemy.orm import Query, Session
 
 from app.admin.schemas.admin_statistics import (
     DailyUserDetailsResponse,
@@ -14,7 +16,11 @@ from app.admin.schemas.admin_statistics import (
     UsersKPI,
     UserStatisticsResponse,
 )
-from app.admin.services.statistics.base import count_active_users
+from app.admin.services.statistics.base import (
+    PeriodContext,
+    active_users_since_query,
+    paginate_keyset,
+)
 from app.auth.models.user import User
 from app.auth.models.user_daily_activity import UserDailyActivity
 from app.courses.models.enrollment import Enrollment
@@ -38,11 +44,11 @@ class UserStatisticsService:
         Returns:
             UsersKPI with total, new, and active user counts.
         """
-        total_users = db.query(User).filter(User.is_active == True).count()  # noqa: E712
-        new_users_month = db.query(User).filter(User.created_at >= month_start).count()
-
-        active_today = count_active_users(db, today_start)
-        active_week = count_active_users(db, week_start)
+        total_users, new_users_month, active_today, active_week = (
+            UserStatisticsService._count_users_and_activity(
+                db, [month_start], [today_start.date(), week_start.date()]
+            )
+        )
 
         return UsersKPI(
             total=total_users,
@@ -62,23 +68,24 @@ class UserStatisticsService:
         Returns:
             UserStatisticsResponse with user counts and activity data points.
         """
-        now = datetime.now(UTC)
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=today_start.weekday())
-        month_start = today_start.replace(day=1)
+        ctx = PeriodContext.current()
+        now, today_start = ctx.now, ctx.today_start
+        week_start, month_start = ctx.week_start, ctx.month_start
         period_start = today_start - timedelta(days=days)
 
-        total_users = db.query(User).filter(User.is_active == True).count()  # noqa: E712
-
-        # Active users counts
-        active_today = count_active_users(db, today_start)
-        active_week = count_active_users(db, week_start)
-        active_month = count_active_users(db, month_start)
-
-        # New users counts
-        new_today = db.query(User).filter(User.created_at >= today_start).count()
-        new_week = db.query(User).filter(User.created_at >= week_start).count()
-        new_month = db.query(User).filter(User.created_at >= month_start).count()
+        (
+            total_users,
+            new_today,
+            new_week,
+            new_month,
+            active_today,
+            active_week,
+            active_month,
+        ) = UserStatisticsService._count_users_and_activity(
+            db,
+            [today_start, week_start, month_start],
+            [today_start.date(), week_start.date(), month_start.date()],
+        )
 
         # DAU/MAU ratio
         dau_mau = round(active_today / active_month, 4) if active_month > 0 else 0.0
@@ -134,17 +141,45 @@ class UserStatisticsService:
             activity_data_points=data_points,
         )
 
+    @staticmethod
+    def _count_users_and_activity(
+        db: Session, created_since: Sequence[datetime], active_since: Sequence[date]
+    ) -> list[int]:
+        """Count users and distinct active users in a single statement.
+
+        Users are counted in one scan with a FILTER per start and the activity
+        log in another; the two one-row aggregates are cross-joined so both
+        come back in one round trip.
+
+        Returns:
+            The number of active users, the number of users created since
+            each of ``created_since``, then the number of users active since
+            each of ``active_since``, in argument order.
+        """
+        users = db.query(
+            func.count(User.id).filter(User.is_active == True),  # noqa: E712
+            *(func.count(User.id).filter(User.created_at >= start) for start in created_since),
+        ).subquery()
+        active = active_users_since_query(db, *active_since).subquery()
+        return list(db.query(users, active).select_from(users).join(active, true()).one())
+
     @staticmethod
     def get_daily_details(
-        db: Session, date: str, user_type: str, limit: int = 50
+        db: Session, date: str, user_type: str, limit: int = 50, cursor: str | None = None
     ) -> DailyUserDetailsResponse:
         """Get list of active or new users for a specific day.
 
+        Both lists are ordered by registration time, most recent first. The
+        keyset has to be immutable: today's last activity changes on every
+        request, so a user seen again between two pages would move across the
+        cursor and be skipped or listed twice.
+
         Args:
             db: Database session.
             date: Date string in YYYY-MM-DD format.
             user_type: Either 'active' or 'new'.
             limit: Maximum number of users to return.
+            cursor: Cursor of the page to return, from a previous response.
 
         Returns:
             DailyUserDetailsResponse with user list and totals.
@@ -155,94 +190,102 @@ class UserStatisticsService:
 
         users_list: list[UserDetail] = []
         total = 0
+        next_cursor = None
+        # Typed loosely: the first page adds a window total column to the query.
+        query: Query[Any]
 
         if user_type == "active":
             target_day = target_date.date()
 
-            activities = (
-                db.query(UserDailyActivity)
-                .filter(UserDailyActivity.date == target_day)
-                .limit(limit)
-                .all()
-            )
-            user_ids = [a.user_id for a in activities]
-            users_map = (
-                {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
-                if user_ids
-                else {}
-            )
-
-            for activity in activities:
-                user = users_map.get(activity.user_id)
-                if user:
-                    users_list.append(
-                        UserDetail(
-                            id=str(user.id),
-                            email=user.email,
-                            full_name=user.name,
-                            created_at=user.created_at,
-                            last_activity=activity.last_seen_at,
-                        )
-                    )
-
-            total = (
-                db.query(func.count(UserDailyActivity.id))
+            query = (
+                db.query(
+                    User.id, User.email, User.name, User.created_at, UserDailyActivity.last_seen_at
+                )
+                .select_from(UserDailyActivity)
+                .join(User, User.id == UserDailyActivity.user_id)
                 .filter(UserDailyActivity.date == target_day)
-                .scalar()
-                or 0
             )
+            # The first page carries the total as count(*) OVER (); later
+            # pages are narrowed by the cursor, so they count separately.
+            if cursor is None:
+                query = query.add_columns(func.count().over().label("total"))
+            rows, next_cursor = paginate_keyset(query, User.created_at, User.id, cursor, limit)
+            users_list = [
+                UserDetail.model_construct(
+                    id=str(row.id),
+                    email=row.email,
+                    full_name=row.name,
+                    created_at=row.created_at,
+                    last_activity=row.last_seen_at,
+                )
+                for row in rows
+            ]
+
+            if cursor is None:
+                total = rows[0].total if rows else 0
+            else:
+                total = (
+                    db.query(func.count(UserDailyActivity.id))
+                    .filter(UserDailyActivity.date == target_day)
+                    .scalar()
+                    or 0
+                )
 
         elif user_type == "new":
-            users = (
-                db.query(User)
-                .filter(
-                    User.created_at >= day_start,
-                    User.created_at < day_end,
-                )
-                .order_by(User.created_at.desc())
-                .limit(limit)
-                .all()
+            query = db.query(User.id, User.email, User.name, User.created_at).filter(
+                User.created_at >= day_start,
+                User.created_at < day_end,
             )
-
-            for user in users:
-                last_activity = (
-                    db.query(func.max(Enrollment.last_accessed_at))
-                    .filter(Enrollment.user_id == user.id)
-                    .scalar()
+            count_query = query.with_entities(func.count(User.id))
+            if cursor is None:
+                query = query.add_columns(func.count().over().label("total"))
+            users, next_cursor = paginate_keyset(query, User.created_at, User.id, cursor, limit)
+
+            last_access_map: dict[UUID, datetime] = {}
+            if users:
+                rows = (
+                    db.query(Enrollment.user_id, func.max(Enrollment.last_accessed_at))
+                    .filter(Enrollment.user_id.in_([user.id for user in users]))
+                    .group_by(Enrollment.user_id)
+                    .all()
                 )
-                users_list.append(
-                    UserDetail(
-                        id=str(user.id),
-                        email=user.email,
-                        full_name=user.name,
-                        created_at=user.created_at,
-                        last_activity=last_activity,
-                    )
+                last_access_map = {r[0]: r[1] for r in rows}
+
+            users_list = [
+                UserDetail.model_construct(
+                    id=str(user.id),
+                    email=user.email,
+                    full_name=user.name,
+                    created_at=user.created_at,
+                    last_activity=last_access_map.get(user.id),
                 )
+                for user in users
+            ]
 
-            total = (
-                db.query(User)
-                .filter(
-                    User.created_at >= day_start,
-                    User.created_at < day_end,
-                )
-                .count()
-            )
+            if cursor is None:
+                total = users[0].total if users else 0
+            else:
+                total = count_query.scalar()
 
         return DailyUserDetailsResponse(
             date=date,
             type=user_type,
             total=total,
             users=users_list,
+            next_cursor=next_cursor,
         )
 
     @staticmethod
-    def get_monthly_new_users(db: Session, limit: int = 50) -> MonthlyUsersResponse:
+    def get_monthly_new_users(
+        db: Session, limit: int = 50, cursor: str | None = None, with_count: bool = True
+    ) -> MonthlyUsersResponse:
         """Get new users registered in the current month.
 
         Args:
             db: Database session.
             limit: Maximum number of users to return.
+            cursor: Cursor of the page to return, from a previous response.
+            with_count: Whether to compute the total; when False it is None.
 
         Returns:
             MonthlyUsersResponse with total count and user list.
@@ -250,15 +293,16 @@ class UserStatisticsService:
         now = datetime.now(UTC)
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        total = db.query(User).filter(User.created_at >= month_start).count()
+        total = (
+            db.query(func.count(User.id)).filter(User.created_at >= month_start).scalar()
+            if with_count
+            else None
+        )
 
-        users = (
-            db.query(User)
-            .filter(User.created_at >= month_start)
-            .order_by(User.created_at.desc())
-            .limit(limit)
-            .all()
+        query = db.query(User.id, User.email, User.name, User.created_at).filter(
+            User.created_at >= month_start
         )
+        users, next_cursor = paginate_keyset(query, User.created_at, User.id, cursor, limit)
 
         user_ids = [u.id for u in users]
         last_activity_map: dict[UUID, datetime] = {}
@@ -275,7 +319,7 @@ class UserStatisticsService:
             last_activity_map = {r[0]: r[1] for r in rows}
 
         users_list = [
-            UserDetail(
+            UserDetail.model_construct(
                 id=str(user.id),
                 email=user.email,
                 full_name=user.name,
@@ -285,4 +329,4 @@ class UserStatisticsService:
             for user in users
         ]
 
-        return MonthlyUsersResponse(total=total, users=users_list)
+        return MonthlyUsersResponse(total=total, users=users_list, next_cursor=next_cursor)
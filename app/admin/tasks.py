@@ -0,0 +1,35 @@
+"""Celery tasks for admin statistics."""
+
+import logging
+
+from sqlalchemy import text
+
+from app.admin.cache_invalidation import STATISTICS_CHANNEL
+from app.core.celery_app import celery_app
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def refresh_daily_revenue_task() -> None:
+    """Refresh the mv_daily_revenue rollup behind the revenue charts.
+
+    CONCURRENTLY keeps the view readable while it is rebuilt. The
+    notification is delivered on commit, once the new contents are visible,
+    and makes the API drop revenue responses cached from the old ones.
+    """
+    db = SessionLocal()
+    try:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_revenue"))
+        db.execute(
+            text("SELECT pg_notify(:channel, 'mv_daily_revenue')"),
+            {"channel": STATISTICS_CHANNEL},
+        )
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Refreshing mv_daily_revenue failed: %s", exc)
+        raise
+    finally:
+        db.close()
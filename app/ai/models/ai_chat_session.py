@@ -1,10 +1,11 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import JSON, String, UniqueConstraint
+from sqlalchemy import JSON, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.ai.schemas.ai_generation import EntityType
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
@@ -12,15 +13,15 @@ class AiChatSession(Base):
     __tablename__ = "ai_chat_sessions"
     __table_args__ = (UniqueConstraint("entity_type", "entity_id", name="uq_ai_chat_entity"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     entity_type: Mapped[EntityType] = mapped_column(String(10), nullable=False)
     entity_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
     messages: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
     pending_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     pending_response: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
     )
@@ -1,15 +1,17 @@
 import uuid
 from datetime import UTC, datetime
 
+from sqlalchemy import func
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
 class BrandGuidelines(Base):
     __tablename__ = "brand_guidelines"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(unique=True, default="default")
 
     tone: Mapped[str] = mapped_column(default="")
@@ -24,9 +26,9 @@ class BrandGuidelines(Base):
     company_description: Mapped[str] = mapped_column(default="")
     additional_instructions: Mapped[str] = mapped_column(default="")
 
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
     )
 
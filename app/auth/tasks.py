@@ -0,0 +1,46 @@
+"""Celery tasks for auth housekeeping."""
+
+import logging
+from datetime import date
+
+from sqlalchemy import text
+
+from app.core.celery_app import celery_app
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def create_activity_partitions_task(years_ahead: int = 1) -> list[str]:
+    """Create yearly user_daily_activity partitions up to ``years_ahead`` years out.
+
+    Runs well before the new year so the next partition exists before any row
+    for it arrives; rows already in the default partition would block it.
+
+    Returns:
+        Names of the partitions that were checked or created
+    """
+    today = date.today()
+    names = []
+    db = SessionLocal()
+    try:
+        for year in range(today.year, today.year + years_ahead + 1):
+            name = f"user_daily_activity_y{year}"
+            db.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF user_daily_activity "
+                    f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+                )
+            )
+            names.append(name)
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.exception(f"Creating user_daily_activity partitions failed: {exc}")
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"user_daily_activity partitions present: {', '.join(names)}")
+    return names
@@ -1,9 +1,10 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
@@ -14,7 +15,7 @@ class ThreadReply(Base):
         Index("ix_thread_replies_author", "author_id"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     thread_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("community_threads.id", ondelete="CASCADE")
     )
@@ -22,8 +23,12 @@ class ThreadReply(Base):
     content: Mapped[str] = mapped_column(Text)
     is_solution: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
-    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, default=None)
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(UTC), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
 
     thread = relationship("CommunityThread", back_populates="replies")
     author = relationship("User", lazy="joined")
@@ -2,7 +2,18 @@ import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -26,24 +37,47 @@ class CommunityThread(Base):
     __table_args__ = (
         Index("ix_community_threads_category_created", "category", "created_at"),
         Index("ix_community_threads_author", "author_id"),
-        Index("ix_community_threads_status", "status"),
-        Index("ix_community_threads_pinned", "is_pinned"),
+        # Default listing order: pinned first, then most recently updated.
+        Index("ix_community_threads_pinned_updated", "is_pinned", "updated_at"),
+        Index(
+            "ix_community_threads_open",
+            "created_at",
+            postgresql_where=text("status = 'open'"),
+        ),
         Index("ix_community_threads_course", "course_id"),
+        Index("ix_community_threads_module", "module_id"),
+        Index("ix_community_threads_lesson", "lesson_id"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     author_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text)
-    status: Mapped[str] = mapped_column(String(20), default=ThreadStatus.OPEN.value)
-    category: Mapped[str] = mapped_column(String(20), default=ThreadCategory.POMOC.value)
+    status: Mapped[str] = mapped_column(
+        Enum(
+            ThreadStatus,
+            name="thread_status",
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        default=ThreadStatus.OPEN.value,
+    )
+    category: Mapped[str] = mapped_column(
+        Enum(
+            ThreadCategory,
+            name="thread_category",
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        default=ThreadCategory.POMOC.value,
+    )
     is_pinned: Mapped[bool] = mapped_column(Boolean, default=False)
     reply_count: Mapped[int] = mapped_column(Integer, default=0)
     view_count: Mapped[int] = mapped_column(Integer, default=0)
     resolved_by_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"), nullable=True, default=None
     )
-    resolved_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, default=None)
+    resolved_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
 
     course_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("courses.id", ondelete="SET NULL"), nullable=True, default=None
@@ -55,9 +89,12 @@ class CommunityThread(Base):
         ForeignKey("lessons.id", ondelete="SET NULL"), nullable=True, default=None
     )
 
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(UTC), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
     )
 
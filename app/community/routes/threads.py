@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_user
 from app.auth.models.user import User
+from app.community.models.thread import ThreadCategory, ThreadStatus
 from app.community.schemas.public_profile import PublicProfileResponse
 from app.community.schemas.thread import (
     ReplyCreate,
@@ -64,8 +65,8 @@ def get_thread_counts(
 
 @router.get("/threads", response_model=ThreadListResponse)
 def get_threads(
-    category: str | None = None,
-    status: str | None = None,
+    category: ThreadCategory | None = None,
+    status: ThreadStatus | None = None,
     search: str | None = None,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
@@ -155,7 +155,7 @@ class AdminThreadService:
             .group_by(CommunityThread.category)
             .all()
         )
-        category_counts = {str(category): int(count) for category, count in rows}
+        category_counts = {category.value: int(count) for category, count in rows}
 
         top_authors_rows = (
             self.db.query(
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from app.auth.models.user import User
 from app.community.models.reply import ThreadReply
-from app.community.models.thread import CommunityThread, ThreadStatus
+from app.community.models.thread import CommunityThread, ThreadCategory, ThreadStatus
 from app.community.models.thread_tag import ThreadTag, ThreadTagAssociation
 from app.community.schemas.thread import (
     AdminStatsResponse,
@@ -83,12 +83,12 @@ class ThreadService:
             .group_by(CommunityThread.category)
             .all()
         )
-        return {str(category): int(count) for category, count in rows}
+        return {category.value: int(count) for category, count in rows}
 
     def get_all_threads(
         self,
-        category: str | None = None,
-        status_filter: str | None = None,
+        category: ThreadCategory | None = None,
+        status_filter: ThreadStatus | None = None,
         search: str | None = None,
         page: int = 1,
         limit: int = 20,
@@ -0,0 +1,109 @@
+"""Redis-backed caching for expensive, read-only responses.
+
+Values are also kept in process memory for LOCAL_CACHE_TTL_SECONDS, so
+bursts of identical requests to one worker do not each go to Redis.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from starlette.concurrency import run_in_threadpool
+
+from app.core import redis as redis_module
+from app.core.constants import LOCAL_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+CACHE_KEY_PREFIX = "cache"
+
+# key -> (time.monotonic() deadline, value); expired entries are dropped on access
+_local_cache: dict[str, tuple[float, BaseModel]] = {}
+
+
+def cache_key(namespace: str, *parts: object) -> str:
+    """Build a cache key such as ``cache:rankings:10`` from a namespace and arguments."""
+    return ":".join([CACHE_KEY_PREFIX, namespace, *(str(part) for part in parts)])
+
+
+async def get_or_set_model(
+    key: str,
+    model: type[ModelT],
+    ttl_seconds: int,
+    compute: Callable[[], ModelT],
+) -> ModelT:
+    """Return the cached ``model`` stored under ``key``, computing and storing it on a miss.
+
+    The cache is an optimisation only: when Redis is not initialized or a
+    Redis call fails, the value is computed as if it were a miss. ``compute``
+    runs in the threadpool, so blocking database calls in it do not stall
+    the event loop.
+    """
+    local = _local_cache.get(key)
+    if local is not None:
+        deadline, local_value = local
+        if deadline > time.monotonic() and isinstance(local_value, model):
+            return local_value
+        _local_cache.pop(key, None)
+
+    client = redis_module.redis_client
+    if client is not None:
+        try:
+            cached = await client.get(key)
+        except RedisError as exc:
+            logger.warning("Cache read failed for %s: %s", key, exc)
+            cached = None
+        if cached is not None:
+            value = model.model_validate_json(cached)
+            _set_local(key, value, ttl_seconds)
+            return value
+
+    value = await run_in_threadpool(compute)
+    _set_local(key, value, ttl_seconds)
+
+    if client is not None:
+        try:
+            await client.setex(key, ttl_seconds, value.model_dump_json())
+        except RedisError as exc:
+            logger.warning("Cache write failed for %s: %s", key, exc)
+    return value
+
+
+def clear_local_cache() -> None:
+    """Drop every in-process copy, e.g. between tests sharing one process."""
+    _local_cache.clear()
+
+
+def _set_local(key: str, value: BaseModel, ttl_seconds: int) -> None:
+    now = time.monotonic()
+    for expired in [k for k, (deadline, _) in _local_cache.items() if deadline <= now]:
+        del _local_cache[expired]
+    _local_cache[key] = (now + min(LOCAL_CACHE_TTL_SECONDS, ttl_seconds), value)
+
+
+async def invalidate_namespace(namespace: str) -> None:
+    """Delete every value cached under ``namespace``, whatever its key parts.
+
+    Failures are logged and ignored; the entries then expire with their TTL.
+    Only this process's in-memory copies are dropped; other workers drop
+    theirs when they handle the same invalidation, or after
+    LOCAL_CACHE_TTL_SECONDS.
+    """
+    prefix = cache_key(namespace, "")
+    for key in [k for k in _local_cache if k == cache_key(namespace) or k.startswith(prefix)]:
+        del _local_cache[key]
+
+    client = redis_module.redis_client
+    if client is None:
+        return
+    try:
+        keys = [cache_key(namespace)]
+        keys += [key async for key in client.scan_iter(match=cache_key(namespace, "*"))]
+        await client.delete(*keys)
+    except RedisError as exc:
+        logger.warning("Cache invalidation failed for %s: %s", namespace, exc)
@@ -5,6 +5,7 @@ from celery.schedules import crontab
 
 import app.db.base  # noqa: F401 — register all models so relationships resolve
 from app.core.config import settings
+from app.core.constants import DAILY_REVENUE_REFRESH_MINUTES
 
 _uses_tls = settings.REDIS_URL.startswith("rediss://")
 
@@ -27,6 +28,14 @@ celery_app.conf.update(
             "schedule": crontab(hour=3, minute=0),  # Daily at 3:00 AM Warsaw time
             "kwargs": {"dry_run": False},
         },
+        "create-activity-partitions-monthly": {
+            "task": "app.auth.tasks.create_activity_partitions_task",
+            "schedule": crontab(day_of_month=1, hour=4, minute=0),
+        },
+        "refresh-daily-revenue": {
+            "task": "app.admin.tasks.refresh_daily_revenue_task",
+            "schedule": crontab(minute=f"*/{DAILY_REVENUE_REFRESH_MINUTES}"),
+        },
     },
 )
 
@@ -36,4 +45,6 @@ if _uses_tls:
         redis_backend_use_ssl={"ssl_cert_reqs": ssl.CERT_NONE},
     )
 
-celery_app.autodiscover_tasks(["app.ai", "app.notifications", "app.storage"])
+celery_app.autodiscover_tasks(
+    ["app.admin", "app.ai", "app.auth", "app.notifications", "app.storage"]
+)
@@ -95,3 +95,23 @@ DEFAULT_CACHE_TTL_SECONDS: int = 300  # 5 minutes
 
 # Unread count cache TTL
 UNREAD_COUNT_CACHE_TTL_SECONDS: int = 60  # 1 minute
+
+# How long cached values are also kept in each worker's memory
+LOCAL_CACHE_TTL_SECONDS: int = 2
+
+# Admin statistics cache TTLs (global aggregates, shared by all admins)
+DASHBOARD_STATS_CACHE_TTL_SECONDS: int = 60  # 1 minute
+RANKINGS_STATS_CACHE_TTL_SECONDS: int = 300  # 5 minutes
+SALES_WINDOWS_STATS_CACHE_TTL_SECONDS: int = 300  # 5 minutes
+EDUCATION_STATS_CACHE_TTL_SECONDS: int = 600  # 10 minutes
+REVENUE_STATS_CACHE_TTL_SECONDS: int = 60  # 1 minute
+USER_STATS_CACHE_TTL_SECONDS: int = 60  # 1 minute
+
+# How long admins' browsers may reuse a statistics response without revalidating
+STATISTICS_HTTP_MAX_AGE_SECONDS: int = 30
+
+# Delay before reconnecting the statistics cache invalidation listener
+STATISTICS_LISTENER_RECONNECT_SECONDS: int = 5
+
+# How often refresh_daily_revenue_task rebuilds the mv_daily_revenue rollup
+DAILY_REVENUE_REFRESH_MINUTES: int = 10
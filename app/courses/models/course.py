@@ -18,7 +18,7 @@ class LessonStatus(str, enum.Enum):
 class Course(Base):
     __tablename__ = "courses"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     slug: Mapped[str] = mapped_column(unique=True, index=True)
     title: Mapped[str] = mapped_column()
     description: Mapped[str] = mapped_column()
@@ -53,7 +53,7 @@ class Course(Base):
 class Module(Base):
     __tablename__ = "modules"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     course_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("courses.id", ondelete="CASCADE"), index=True
     )
@@ -76,7 +76,7 @@ class Module(Base):
 class Lesson(Base):
     __tablename__ = "lessons"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     module_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("modules.id", ondelete="CASCADE"), index=True
     )
@@ -18,7 +18,6 @@ from app.courses.models.course import Course, Lesson, Module
 from app.courses.models.enrollment import Enrollment
 from app.integrations.models.integration import Integration
 from app.integrations.models.integration_proposal import IntegrationProposal
-from app.integrations.models.integration_type import IntegrationType
 from app.integrations.models.lesson_integration import LessonIntegration
 from app.integrations.models.process_integration import ProcessIntegration
 from app.messaging.models.conversation import Conversation
@@ -61,7 +60,6 @@ __all__ = [
     "Message",
     "Integration",
     "IntegrationProposal",
-    "IntegrationType",
     "LessonIntegration",
     "ProcessIntegration",
 ]
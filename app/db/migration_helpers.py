@@ -0,0 +1,285 @@
+"""Helpers shared by Alembic migrations in alembic/versions."""
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+
+import sqlalchemy as sa
+
+from alembic import op
+
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def run_with_lock_timeout(
+    operation: Callable[[], object],
+    lock_timeout: str = "2s",
+    statement_timeout: str = "30s",
+    attempts: int = 3,
+    backoff_seconds: float = 1.0,
+) -> None:
+    """Run locking DDL with bounded lock waits, retrying when the lock is busy.
+
+    Each attempt runs in a savepoint with ``SET LOCAL lock_timeout`` and
+    ``statement_timeout``, so an ALTER queued behind a long-running query gives
+    up quickly instead of blocking every other statement on the table. Failed
+    attempts are rolled back to the savepoint and retried with exponential
+    backoff; the last failure is re-raised.
+    """
+    conn = op.get_bind()
+    for attempt in range(1, attempts + 1):
+        try:
+            with conn.begin_nested():
+                conn.execute(sa.text(f"SET LOCAL lock_timeout = '{lock_timeout}'"))
+                conn.execute(sa.text(f"SET LOCAL statement_timeout = '{statement_timeout}'"))
+                operation()
+                conn.execute(sa.text("SET LOCAL lock_timeout = DEFAULT"))
+                conn.execute(sa.text("SET LOCAL statement_timeout = DEFAULT"))
+            return
+        except sa.exc.OperationalError as exc:
+            if attempt == attempts or getattr(exc.orig, "pgcode", None) != LOCK_NOT_AVAILABLE:
+                raise
+            time.sleep(backoff_seconds * 2 ** (attempt - 1))
+
+
+def commit_transaction() -> None:
+    """Commit the migration's work so far and continue in a new transaction.
+
+    Locks taken by earlier statements are released, so a migration that
+    rewrites several tables holds each table's lock only for its own ALTER.
+    An empty autocommit block does this: it commits the surrounding
+    transaction and begins a new one on exit.
+    """
+    with op.get_context().autocommit_block():
+        pass
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    include: Sequence[str] | None = None,
+    where: str | None = None,
+    using: str | None = None,
+    with_params: dict[str, object] | None = None,
+    if_not_exists: bool = False,
+) -> None:
+    """Build an index without blocking writes to an existing table.
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so the statement
+    is executed in an autocommit block; everything issued before it in the
+    migration is committed first. ``include`` adds non-key payload columns for
+    index-only scans, ``where`` makes it a partial index, ``using`` selects the
+    access method and ``with_params`` sets its storage parameters.
+    ``if_not_exists`` skips an index some databases already have under that name.
+    """
+    index = ConcurrentIndex(
+        index_name, table_name, columns, unique, include, where, using, with_params, if_not_exists
+    )
+    with op.get_context().autocommit_block():
+        op.execute(index.create_sql())
+
+
+@dataclass(frozen=True)
+class ConcurrentIndex:
+    """An index for ``create_indexes_concurrently``; fields as in ``create_index_concurrently``."""
+
+    index_name: str
+    table_name: str
+    columns: Sequence[str]
+    unique: bool = False
+    include: Sequence[str] | None = None
+    where: str | None = None
+    using: str | None = None
+    with_params: dict[str, object] | None = None
+    if_not_exists: bool = False
+
+    def create_sql(self, concurrently: bool = True, only: bool = False) -> str:
+        unique_sql = "UNIQUE " if self.unique else ""
+        concurrently_sql = " CONCURRENTLY" if concurrently else ""
+        if_not_exists_sql = " IF NOT EXISTS" if self.if_not_exists else ""
+        only_sql = "ONLY " if only else ""
+        using_sql = f" USING {self.using}" if self.using else ""
+        column_sql = ", ".join(self.columns)
+        include_sql = f" INCLUDE ({', '.join(self.include)})" if self.include else ""
+        with_sql = ""
+        if self.with_params:
+            params = ", ".join(f"{k} = {v}" for k, v in self.with_params.items())
+            with_sql = f" WITH ({params})"
+        where_sql = f" WHERE {self.where}" if self.where else ""
+        return (
+            f"CREATE {unique_sql}INDEX{concurrently_sql}{if_not_exists_sql} {self.index_name} "
+            f"ON {only_sql}{self.table_name}{using_sql} ({column_sql})"
+            f"{include_sql}{with_sql}{where_sql}"
+        )
+
+
+def create_indexes_concurrently(indexes: Sequence[ConcurrentIndex], max_workers: int = 4) -> None:
+    """Build several indexes concurrently, on up to ``max_workers`` extra connections.
+
+    Concurrent builds on one table wait for each other's lock, so indexes are
+    grouped by table: each group is built in order on its own connection and
+    the groups run in parallel. Pending work in the migration is committed
+    first so the other connections can see it, and the call returns once every
+    build has finished, re-raising the first failure. When rendering SQL
+    (``--sql``) the statements are emitted one after another.
+    """
+    context = op.get_context()
+    if context.as_sql:
+        for index in indexes:
+            with context.autocommit_block():
+                op.execute(index.create_sql())
+        return
+
+    by_table: dict[str, list[ConcurrentIndex]] = {}
+    for index in indexes:
+        by_table.setdefault(index.table_name, []).append(index)
+    engine = op.get_bind().engine
+
+    def build(group: list[ConcurrentIndex]) -> None:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for index in group:
+                conn.execute(sa.text(index.create_sql()))
+
+    with context.autocommit_block(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for future in [executor.submit(build, group) for group in by_table.values()]:
+            future.result()
+
+
+def create_partitioned_index_concurrently(index: ConcurrentIndex) -> None:
+    """Build an index on a partitioned table without blocking writes.
+
+    CREATE INDEX CONCURRENTLY is not supported on a partitioned table, so the
+    index is created ON ONLY the parent, where it starts out invalid, then
+    built concurrently on each partition and attached; the parent index turns
+    valid once every partition has one. Partitions created later get the
+    index automatically. When rendering SQL (``--sql``) the partitions cannot
+    be listed, so a plain CREATE INDEX on the parent is emitted instead.
+    """
+    context = op.get_context()
+    if context.as_sql:
+        op.execute(index.create_sql(concurrently=False))
+        return
+
+    partitions = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = CAST(:table_name AS regclass) ORDER BY 1"
+            ),
+            {"table_name": index.table_name},
+        )
+        .scalars()
+        .all()
+    )
+    op.execute(index.create_sql(concurrently=False, only=True))
+    for partition in partitions:
+        suffix = partition.removeprefix(f"{index.table_name}_")
+        partition_index = replace(
+            index, index_name=f"{index.index_name}_{suffix}", table_name=partition
+        )
+        with context.autocommit_block():
+            op.execute(partition_index.create_sql())
+        op.execute(f"ALTER INDEX {index.index_name} ATTACH PARTITION {partition_index.index_name}")
+
+
+def add_foreign_key_not_valid(
+    constraint_name: str,
+    table_name: str,
+    column: str,
+    referred_table: str,
+    referred_column: str = "id",
+    ondelete: str | None = None,
+) -> None:
+    """Add a foreign key without scanning the table under an exclusive lock.
+
+    The constraint is added NOT VALID, which only needs a brief lock, and is
+    validated afterwards in an autocommit block; VALIDATE CONSTRAINT scans the
+    table while holding a lock that still allows reads and writes.
+    """
+    ondelete_sql = f" ON DELETE {ondelete}" if ondelete else ""
+    run_with_lock_timeout(
+        lambda: op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint_name} "
+            f"FOREIGN KEY ({column}) REFERENCES {referred_table} ({referred_column})"
+            f"{ondelete_sql} NOT VALID"
+        )
+    )
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {constraint_name}")
+
+
+def drop_index_concurrently(index_name: str) -> None:
+    """Drop an index without blocking reads and writes on its table."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def vacuum_analyze(table_name: str) -> None:
+    """Reclaim dead tuples and refresh planner statistics after a bulk rewrite.
+
+    VACUUM cannot run inside a transaction block, so it is executed in an
+    autocommit block like the concurrent index helpers.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(f"VACUUM (ANALYZE) {table_name}")
+
+
+def batched_update(
+    table_name: str,
+    set_sql: str,
+    where_sql: str | None = None,
+    key_column: str = "id",
+    batch_size: int = 10000,
+) -> int:
+    """Run ``UPDATE table_name SET set_sql`` in separately committed batches.
+
+    Keys of the matching rows are numbered once into an indexed temp table, and
+    each batch then selects a ``row_number`` range from it, so the cost of a
+    batch does not grow with its position the way OFFSET/LIMIT paging does.
+    Every batch has the same shape, so the UPDATE is prepared once and run
+    with a generic plan instead of being parsed and planned per batch.
+
+    Returns:
+        Number of updated rows
+    """
+    where = f" WHERE {where_sql}" if where_sql else ""
+    updated = 0
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        conn.execute(sa.text("DROP TABLE IF EXISTS _batched_update_keys"))
+        conn.execute(
+            sa.text(
+                f"CREATE TEMP TABLE _batched_update_keys AS "
+                f"SELECT {key_column} AS key, row_number() OVER (ORDER BY {key_column}) AS rn "
+                f"FROM {table_name}{where}"
+            )
+        )
+        conn.execute(sa.text("CREATE INDEX ON _batched_update_keys (rn)"))
+        conn.execute(sa.text("ANALYZE _batched_update_keys"))
+        total = conn.execute(sa.text("SELECT count(*) FROM _batched_update_keys")).scalar_one()
+
+        conn.execute(sa.text("SET plan_cache_mode = force_generic_plan"))
+        conn.execute(
+            sa.text(
+                f"PREPARE _batched_update_stmt(bigint, bigint) AS "
+                f"UPDATE {table_name} SET {set_sql} WHERE {key_column} IN "
+                f"(SELECT key FROM _batched_update_keys WHERE rn BETWEEN $1 AND $2)"
+            )
+        )
+        try:
+            for lo in range(1, total + 1, batch_size):
+                result = conn.execute(
+                    sa.text("EXECUTE _batched_update_stmt(:lo, :hi)"),
+                    {"lo": lo, "hi": lo + batch_size - 1},
+                )
+                updated += result.rowcount
+        finally:
+            conn.execute(sa.text("DEALLOCATE _batched_update_stmt"))
+            conn.execute(sa.text("RESET plan_cache_mode"))
+
+        conn.execute(sa.text("DROP TABLE _batched_update_keys"))
+    return updated
@@ -1,6 +1,7 @@
 from collections.abc import Generator
+from datetime import datetime
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -11,11 +12,14 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Timestamps are stored as timestamptz; keep date()/date_trunc() and naive
+    # parameters interpreted in UTC regardless of the server's TimeZone.
+    connect_args={"options": "-c timezone=utc"},
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+Base = declarative_base(type_annotation_map={datetime: DateTime(timezone=True)})
 
 
 def get_db() -> Generator[Session, None, None]:
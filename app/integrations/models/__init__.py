@@ -1,12 +1,10 @@
 from app.integrations.models.integration import Integration
 from app.integrations.models.integration_proposal import IntegrationProposal
-from app.integrations.models.integration_type import IntegrationType
 from app.integrations.models.lesson_integration import LessonIntegration
 from app.integrations.models.process_integration import ProcessIntegration
 
 __all__ = [
     "Integration",
-    "IntegrationType",
     "LessonIntegration",
     "ProcessIntegration",
     "IntegrationProposal",
@@ -1,16 +1,18 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
 class Integration(Base):
     __tablename__ = "integrations"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     slug: Mapped[str] = mapped_column(unique=True, index=True)
     name: Mapped[str] = mapped_column()
     icon: Mapped[str] = mapped_column()
@@ -20,21 +22,20 @@ class Integration(Base):
     auth_guide: Mapped[str | None] = mapped_column(Text, default=None)
     official_docs_url: Mapped[str | None] = mapped_column(default=None)
     video_tutorial_url: Mapped[str | None] = mapped_column(default=None)
+    # Auth/connection types: "API", "OAuth 2.0", "MCP"
+    types: Mapped[list[str]] = mapped_column(ARRAY(String(50)), default=list, server_default="{}")
     is_published: Mapped[bool] = mapped_column(default=False, index=True)
     sort_order: Mapped[int] = mapped_column(default=0)
     created_by_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"), default=None
     )
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
     )
 
     # Relationships
-    integration_types: Mapped[list["IntegrationType"]] = relationship(
-        "IntegrationType", back_populates="integration", cascade="all, delete-orphan"
-    )
     lesson_integrations: Mapped[list["LessonIntegration"]] = relationship(
         "LessonIntegration", back_populates="integration", cascade="all, delete-orphan"
     )
@@ -47,6 +48,5 @@ class Integration(Base):
 
 
 # Import for type hints (avoid circular imports)
-from app.integrations.models.integration_type import IntegrationType  # noqa: E402
 from app.integrations.models.lesson_integration import LessonIntegration  # noqa: E402
 from app.integrations.models.process_integration import ProcessIntegration  # noqa: E402
@@ -1,27 +1,50 @@
+import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import Enum, ForeignKey, Index, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
+class ProposalStatus(str, enum.Enum):
+    PENDING = "pending"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+
+
 class IntegrationProposal(Base):
     __tablename__ = "integration_proposals"
+    __table_args__ = (
+        # Admin review queue: only pending proposals are listed by status.
+        Index(
+            "ix_integration_proposals_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column()
     category: Mapped[str | None] = mapped_column(default=None)
     description: Mapped[str] = mapped_column(Text)
     official_docs_url: Mapped[str | None] = mapped_column(default=None)
     submitted_by_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
-    # Status: pending, approved, rejected
-    status: Mapped[str] = mapped_column(default="pending", index=True)
+    status: Mapped[str] = mapped_column(
+        Enum(
+            ProposalStatus,
+            name="proposal_status",
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        default=ProposalStatus.PENDING.value,
+        server_default=ProposalStatus.PENDING.value,
+    )
     admin_notes: Mapped[str | None] = mapped_column(Text, default=None)
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
     )
 
@@ -1,12 +1,13 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_user, require_admin
 from app.auth.models.user import User
 from app.db.session import get_db
 from app.integrations.schemas import ProposalCreate, ProposalResponse, ProposalUpdate
+from app.integrations.schemas.proposal import ProposalStatusValue
 from app.integrations.services import IntegrationService
 
 router = APIRouter()
@@ -49,12 +50,13 @@ def get_my_proposals(
 
 @router.get("/admin/integration-proposals", response_model=list[ProposalResponse])
 def list_all_proposals(
+    status_filter: ProposalStatusValue | None = Query(None, alias="status"),
     _admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ) -> list[ProposalResponse]:
-    """List all proposals - Admin only."""
+    """List all proposals, optionally only those with the given status - Admin only."""
     service = IntegrationService(db)
-    return service.get_all_proposals()
+    return service.get_all_proposals(status_filter=status_filter)
 
 
 @router.patch("/admin/integration-proposals/{proposal_id}", response_model=ProposalResponse)
@@ -9,7 +9,6 @@ from app.courses.models.course import Lesson, Module
 from app.integrations.models import (
     Integration,
     IntegrationProposal,
-    IntegrationType,
     LessonIntegration,
     ProcessIntegration,
 )
@@ -48,9 +47,7 @@ class IntegrationService:
         usage_counts = self._get_usage_counts()
 
         query = (
-            self.db.query(Integration)
-            .options(joinedload(Integration.integration_types))
-            .filter(Integration.is_published == True)  # noqa: E712
+            self.db.query(Integration).filter(Integration.is_published == True)  # noqa: E712
         )
 
         if category:
@@ -74,7 +71,6 @@ class IntegrationService:
         query = (
             self.db.query(Integration)
             .options(
-                joinedload(Integration.integration_types),
                 joinedload(Integration.lesson_integrations)
                 .joinedload(LessonIntegration.lesson)
                 .joinedload(Lesson.module)
@@ -119,10 +115,7 @@ class IntegrationService:
         usage_counts = self._get_usage_counts()
 
         integrations = (
-            self.db.query(Integration)
-            .options(joinedload(Integration.integration_types))
-            .order_by(Integration.sort_order, Integration.name)
-            .all()
+            self.db.query(Integration).order_by(Integration.sort_order, Integration.name).all()
         )
         return [self._to_response(i, usage_counts.get(i.id, 0)) for i in integrations]
 
@@ -130,7 +123,6 @@ class IntegrationService:
         integration = (
             self.db.query(Integration)
             .options(
-                joinedload(Integration.integration_types),
                 joinedload(Integration.lesson_integrations)
                 .joinedload(LessonIntegration.lesson)
                 .joinedload(Lesson.module)
@@ -168,15 +160,10 @@ class IntegrationService:
             video_tutorial_url=str(data.video_tutorial_url) if data.video_tutorial_url else None,
             is_published=data.is_published,
             sort_order=data.sort_order,
+            types=list(data.integration_types),
             created_by_id=created_by.id,
         )
         self.db.add(integration)
-        self.db.flush()
-
-        # Add integration types
-        for type_name in data.integration_types:
-            self.db.add(IntegrationType(integration_id=integration.id, type_name=type_name))
-
         self.db.commit()
         self.db.refresh(integration)
 
@@ -185,12 +172,7 @@ class IntegrationService:
     def update_integration(
         self, integration_id: UUID, data: IntegrationUpdate
     ) -> IntegrationResponse:
-        integration = (
-            self.db.query(Integration)
-            .options(joinedload(Integration.integration_types))
-            .filter(Integration.id == integration_id)
-            .first()
-        )
+        integration = self.db.query(Integration).filter(Integration.id == integration_id).first()
 
         if not integration:
             raise HTTPException(
@@ -229,16 +211,8 @@ class IntegrationService:
         if data.sort_order is not None:
             integration.sort_order = data.sort_order
 
-        # Update integration types if provided
         if data.integration_types is not None:
-            # Remove existing types
-            self.db.query(IntegrationType).filter(
-                IntegrationType.integration_id == integration_id
-            ).delete()
-
-            # Add new types
-            for type_name in data.integration_types:
-                self.db.add(IntegrationType(integration_id=integration.id, type_name=type_name))
+            integration.types = list(data.integration_types)
 
         self.db.commit()
         self.db.refresh(integration)
@@ -273,9 +247,7 @@ class IntegrationService:
 
         lesson_integrations = (
             self.db.query(LessonIntegration)
-            .options(
-                joinedload(LessonIntegration.integration).joinedload(Integration.integration_types)
-            )
+            .options(joinedload(LessonIntegration.integration))
             .filter(LessonIntegration.lesson_id == lesson_id)
             .order_by(LessonIntegration.sort_order)
             .all()
@@ -310,10 +282,7 @@ class IntegrationService:
 
         # Verify integration exists
         integration = (
-            self.db.query(Integration)
-            .options(joinedload(Integration.integration_types))
-            .filter(Integration.id == data.integration_id)
-            .first()
+            self.db.query(Integration).filter(Integration.id == data.integration_id).first()
         )
         if not integration:
             raise HTTPException(
@@ -388,9 +357,7 @@ class IntegrationService:
 
         process_integrations = (
             self.db.query(ProcessIntegration)
-            .options(
-                joinedload(ProcessIntegration.integration).joinedload(Integration.integration_types)
-            )
+            .options(joinedload(ProcessIntegration.integration))
             .filter(ProcessIntegration.process_id == process_id)
             .order_by(ProcessIntegration.sort_order)
             .all()
@@ -425,10 +392,7 @@ class IntegrationService:
 
         # Verify integration exists
         integration = (
-            self.db.query(Integration)
-            .options(joinedload(Integration.integration_types))
-            .filter(Integration.id == data.integration_id)
-            .first()
+            self.db.query(Integration).filter(Integration.id == data.integration_id).first()
         )
         if not integration:
             raise HTTPException(
@@ -516,13 +480,14 @@ class IntegrationService:
 
         return [self._proposal_to_response(p, user.name) for p in proposals]
 
-    def get_all_proposals(self) -> list[ProposalResponse]:
-        proposals = (
-            self.db.query(IntegrationProposal)
-            .options(joinedload(IntegrationProposal.submitted_by))
-            .order_by(IntegrationProposal.created_at.desc())
-            .all()
+    def get_all_proposals(self, status_filter: str | None = None) -> list[ProposalResponse]:
+        query = self.db.query(IntegrationProposal).options(
+            joinedload(IntegrationProposal.submitted_by)
         )
+        if status_filter:
+            query = query.filter(IntegrationProposal.status == status_filter)
+
+        proposals = query.order_by(IntegrationProposal.created_at.desc()).all()
 
         return [
             self._proposal_to_response(p, p.submitted_by.name if p.submitted_by else "Unknown")
@@ -607,7 +572,7 @@ class IntegrationService:
             video_tutorial_url=integration.video_tutorial_url,
             is_published=integration.is_published,
             sort_order=integration.sort_order,
-            integration_types=[t.type_name for t in integration.integration_types],
+            integration_types=list(integration.types),
             usage_count=usage_count,
             created_at=integration.created_at,
             updated_at=integration.updated_at,
@@ -643,7 +608,7 @@ class IntegrationService:
             video_tutorial_url=integration.video_tutorial_url,
             is_published=integration.is_published,
             sort_order=integration.sort_order,
-            integration_types=[t.type_name for t in integration.integration_types],
+            integration_types=list(integration.types),
             usage_count=usage_count,
             used_in_lessons=used_in_lessons,
             created_at=integration.created_at,
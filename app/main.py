@@ -1,19 +1,29 @@
+import asyncio
+import contextlib
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 import structlog
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from redis.asyncio import Redis
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text
+from sqlalchemy.orm import Session
 
+from alembic.config import Config as AlembicConfig
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from app.admin.cache_invalidation import listen_for_statistics_changes
 from app.admin.routes import admin_statistics
 from app.ai.routes import brand_guidelines as brand_guidelines_routes
 from app.ai.routes import sales_page_ai
+from app.auth.dependencies import require_admin
+from app.auth.models.user import User
 from app.auth.routes import admin, auth, password
 from app.auth.routes import settings as settings_routes
 from app.community.routes import admin_threads as admin_community_routes
@@ -41,7 +51,7 @@ from app.courses.routes import (
     sales_page,
     webhooks,
 )
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, get_db
 from app.integrations.routes import (
     admin_router as integrations_admin_router,
 )
@@ -87,8 +97,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.error("redis_connection_failed", error=str(e))
 
+    statistics_listener = asyncio.create_task(listen_for_statistics_changes())
+
     yield
 
+    statistics_listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await statistics_listener
+
     logger.info("closing_redis")
     if redis_module.redis_client:
         await redis_module.redis_client.close()
@@ -269,3 +285,41 @@ async def health_check_detailed() -> dict[str, str]:
     overall = "healthy" if all_healthy else "degraded"
 
     return {"status": overall, "redis": redis_status, "database": db_status}
+
+
+def _load_migration_history() -> list[str]:
+    """Revision ids of the migration scripts, from head down to the first one."""
+    project_root = Path(__file__).resolve().parent.parent
+    alembic_config = AlembicConfig(str(project_root / "alembic.ini"))
+    alembic_config.set_main_option("script_location", str(project_root / "alembic"))
+    script = ScriptDirectory.from_config(alembic_config)
+    return [revision.revision for revision in script.walk_revisions()]
+
+
+# The revision scripts only change with a deploy, so they are read once at
+# import; each request only reads alembic_version.
+MIGRATION_HISTORY = _load_migration_history()
+
+
+@app.get("/health/migrations")
+def health_check_migrations(
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin),
+) -> dict[str, str | list[str] | None]:
+    """Report the database revision and any migrations not yet applied.
+
+    Reading the database revision blocks, so this is a plain ``def`` and
+    runs in the threadpool.
+    """
+    head = MIGRATION_HISTORY[0]
+    current = MigrationContext.configure(db.connection()).get_current_revision()
+
+    pending = (
+        MIGRATION_HISTORY[: MIGRATION_HISTORY.index(current)] if current else MIGRATION_HISTORY[:]
+    )
+    return {
+        "status": "pending" if pending else "up_to_date",
+        "current": current,
+        "head": head,
+        "pending": pending,
+    }
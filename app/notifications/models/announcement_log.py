@@ -1,16 +1,25 @@
+import enum
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import Enum, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
+class AnnouncementStatus(str, enum.Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class AnnouncementLog(Base):
     __tablename__ = "announcement_logs"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     subject: Mapped[str] = mapped_column(String(255))
     body_html: Mapped[str] = mapped_column(Text)
     body_text: Mapped[str] = mapped_column(Text)
@@ -19,6 +28,13 @@ class AnnouncementLog(Base):
     sent_count: Mapped[int] = mapped_column(Integer, default=0)
     skipped_count: Mapped[int] = mapped_column(Integer, default=0)
     failed_count: Mapped[int] = mapped_column(Integer, default=0)
-    status: Mapped[str] = mapped_column(String(20), default="pending")
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    status: Mapped[str] = mapped_column(
+        Enum(
+            AnnouncementStatus,
+            name="announcement_status",
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        default=AnnouncementStatus.PENDING.value,
+    )
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     completed_at: Mapped[datetime | None] = mapped_column(default=None)
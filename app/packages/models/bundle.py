@@ -2,9 +2,10 @@
 
 import uuid
 
-from sqlalchemy import ForeignKey, Index, UniqueConstraint
+from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.uuid_utils import uuid7
 from app.db.session import Base
 
 
@@ -12,15 +13,10 @@ class BundleCourseItem(Base):
     """Link table: Bundle → Course."""
 
     __tablename__ = "bundle_course_items"
-    __table_args__ = (
-        UniqueConstraint("bundle_id", "course_id", name="uq_bundle_course"),
-        Index("ix_bundle_course_items_bundle_course", "bundle_id", "course_id"),
-    )
+    __table_args__ = (UniqueConstraint("bundle_id", "course_id", name="uq_bundle_course"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
-    bundle_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("packages.id", ondelete="CASCADE"), index=True
-    )
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    bundle_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("packages.id", ondelete="CASCADE"))
     course_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("courses.id", ondelete="CASCADE"), index=True
     )
@@ -11,7 +11,7 @@ from app.db.session import Base
 class Package(Base):
     __tablename__ = "packages"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     slug: Mapped[str] = mapped_column(unique=True, index=True)
     title: Mapped[str] = mapped_column()
     description: Mapped[str] = mapped_column()
@@ -72,7 +72,7 @@ class PackageProcess(Base):
 
     __tablename__ = "package_processes"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     package_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("packages.id", ondelete="CASCADE"), index=True
     )
@@ -99,7 +99,7 @@ class PackageBundleItem(Base):
         Index("ix_bundle_items_bundle_child", "bundle_id", "child_package_id"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     bundle_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("packages.id", ondelete="CASCADE"), index=True
     )  # Bundle package
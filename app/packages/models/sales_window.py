@@ -5,7 +5,7 @@ import uuid
 from datetime import UTC, datetime
 
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Index, text
+from sqlalchemy import Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -41,7 +41,7 @@ class SalesWindow(Base):
 
     __tablename__ = "sales_windows"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(index=True)
     status: Mapped[str] = mapped_column(
         SQLEnum(
@@ -51,12 +51,11 @@ class SalesWindow(Base):
             values_callable=lambda x: [e.value for e in x],
         ),
         default="upcoming",
-        index=True,
     )
 
     # Time range
     starts_at: Mapped[datetime] = mapped_column(index=True)
-    ends_at: Mapped[datetime] = mapped_column(index=True)
+    ends_at: Mapped[datetime] = mapped_column()
 
     # Configuration (stored as JSONB)
     landing_page_config: Mapped[dict] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
@@ -66,9 +65,12 @@ class SalesWindow(Base):
     bundle_ids: Mapped[list] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
 
     # Audit fields
-    created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC), index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(UTC), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(UTC),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(UTC),
     )
     created_by: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
@@ -19,7 +19,7 @@ from sqlalchemy.orm import Session
 import app.db.base  # noqa: F401
 
 from app.db.session import get_db
-from app.integrations.models import Integration, IntegrationType
+from app.integrations.models import Integration
 
 
 INTEGRATIONS_DATA = [
@@ -744,13 +744,8 @@ def seed_integrations(db: Session) -> None:
         integration_types = data.pop("integration_types", [])
 
         # Create integration
-        integration = Integration(**data)
+        integration = Integration(**data, types=integration_types)
         db.add(integration)
-        db.flush()
-
-        # Add integration types
-        for type_name in integration_types:
-            db.add(IntegrationType(integration_id=integration.id, type_name=type_name))
 
         print(f"✅ Created: {data['slug']} ({data['name']})")
         created_count += 1
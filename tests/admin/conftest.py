@@ -0,0 +1,136 @@
+"""
+Seeded datasets shared by the admin statistics tests.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.courses.models import Certificate, Course, Enrollment, Lesson, LessonProgress, Module
+from app.packages.models.order import OrderStatus
+from tests.utils.factories import create_course_factory, create_order_factory, create_user_factory
+
+
+def first_lesson(db: Session, course: Course) -> Lesson:
+    """Get the only lesson of a course created by ``create_course_factory``."""
+    return db.query(Lesson).join(Lesson.module).filter(Module.course_id == course.id).one()
+
+
+@pytest.fixture
+def seeded_orders(db_session: Session) -> None:
+    """Orders around early March 2025, rolled up into mv_daily_revenue.
+
+    Completed orders count towards revenue when paid, or when created if
+    unpaid. Between 2025-03-01 and 2025-03-04 they bring 17500 grosz from
+    three orders, one on each of the 1st, 2nd and 4th; the four days before
+    bring 4000, and 2025-02-20 another 7000.
+    """
+    completed = OrderStatus.COMPLETED
+    create_order_factory(
+        db_session,
+        completed,
+        10000,
+        datetime(2025, 3, 1, 9, tzinfo=UTC),
+        datetime(2025, 3, 1, 10, tzinfo=UTC),
+    )
+    create_order_factory(db_session, completed, 5000, datetime(2025, 3, 2, 12, tzinfo=UTC))
+    create_order_factory(
+        db_session,
+        completed,
+        2500,
+        datetime(2025, 2, 20, tzinfo=UTC),
+        datetime(2025, 3, 4, 18, tzinfo=UTC),
+    )
+    create_order_factory(
+        db_session,
+        completed,
+        4000,
+        datetime(2025, 2, 27, 8, tzinfo=UTC),
+        datetime(2025, 2, 27, 9, tzinfo=UTC),
+    )
+    create_order_factory(
+        db_session,
+        completed,
+        7000,
+        datetime(2025, 2, 20, tzinfo=UTC),
+        datetime(2025, 2, 20, 12, tzinfo=UTC),
+    )
+    create_order_factory(db_session, OrderStatus.PENDING, 99999, datetime(2025, 3, 2, tzinfo=UTC))
+    create_order_factory(db_session, OrderStatus.PENDING, 1500, datetime(2025, 1, 1, tzinfo=UTC))
+    create_order_factory(db_session, OrderStatus.FAILED, 3000, datetime(2025, 3, 4, tzinfo=UTC))
+    create_order_factory(db_session, OrderStatus.FAILED, 3000, datetime(2025, 2, 10, tzinfo=UTC))
+
+    # As refresh_daily_revenue_task does.
+    db_session.execute(text("REFRESH MATERIALIZED VIEW mv_daily_revenue"))
+
+
+@pytest.fixture
+def seeded_education(db_session: Session) -> None:
+    """Two published courses and a draft, with learners around March 2025.
+
+    Of the four enrollments two start in March and two are completed, one of
+    them in March. Each completed course has a certificate, one issued in
+    March.
+    """
+    now = datetime.now(UTC)
+    first = create_course_factory(db_session, "stats-first-course")
+    second = create_course_factory(db_session, "stats-second-course")
+    draft = create_course_factory(db_session, "stats-draft-course", is_published=False)
+    alice, bob, carol = (create_user_factory(db_session) for _ in range(3))
+
+    db_session.add_all(
+        [
+            Enrollment(
+                user_id=alice.id,
+                course_id=first.id,
+                enrolled_at=datetime(2025, 2, 10, tzinfo=UTC),
+                completed_at=datetime(2025, 3, 5, tzinfo=UTC),
+                last_accessed_at=now - timedelta(days=1),
+            ),
+            Enrollment(
+                user_id=bob.id,
+                course_id=first.id,
+                enrolled_at=datetime(2025, 3, 1, tzinfo=UTC),
+                last_accessed_at=now - timedelta(days=10),
+            ),
+            Enrollment(
+                user_id=alice.id,
+                course_id=second.id,
+                enrolled_at=datetime(2025, 1, 10, tzinfo=UTC),
+                completed_at=datetime(2025, 2, 28, 23, 59, 59, tzinfo=UTC),
+            ),
+            Enrollment(
+                user_id=carol.id,
+                course_id=draft.id,
+                enrolled_at=datetime(2025, 3, 7, tzinfo=UTC),
+                last_accessed_at=now - timedelta(days=2),
+            ),
+            Certificate(
+                user_id=alice.id,
+                course_id=first.id,
+                certificate_code="STATS-CERT-001",
+                issued_at=datetime(2025, 3, 6, tzinfo=UTC),
+            ),
+            Certificate(
+                user_id=alice.id,
+                course_id=second.id,
+                certificate_code="STATS-CERT-002",
+                issued_at=datetime(2025, 2, 28, tzinfo=UTC),
+            ),
+            # Progress is averaged over the lessons of each course's learners;
+            # alice, enrolled in both courses, has none recorded.
+            LessonProgress(
+                user_id=bob.id,
+                lesson_id=first_lesson(db_session, first).id,
+                completion_percentage=40,
+            ),
+            LessonProgress(
+                user_id=carol.id,
+                lesson_id=first_lesson(db_session, draft).id,
+                completion_percentage=60,
+            ),
+        ]
+    )
+    db_session.flush()
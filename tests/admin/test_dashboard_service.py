@@ -0,0 +1,79 @@
+"""
+Tests for DashboardService - the dashboard summary.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.admin.services.statistics import DashboardService
+from app.admin.services.statistics.base import PeriodContext
+
+# A Tuesday evening; the week started on Monday the 3rd.
+CONTEXT = PeriodContext.at(datetime(2025, 3, 4, 20, tzinfo=UTC))
+
+
+class TestDashboardSummary:
+    @pytest.mark.usefixtures("seeded_orders", "seeded_education")
+    def test_summarises_seeded_data(self, db_session: Session):
+        summary = DashboardService.get_summary(db_session, context=CONTEXT)
+
+        assert summary.revenue.today == 2500
+        assert summary.revenue.this_week == 2500
+        assert summary.revenue.this_month == 17500
+        # Against 19000 from Monday 24th to Sunday 2nd and 11000 in February.
+        assert summary.revenue.change_percent_week == -86.84
+        assert summary.revenue.change_percent_month == 59.09
+
+        assert summary.orders.today == 1
+        assert summary.orders.pending == 2
+        assert summary.orders.completed_this_month == 2
+        assert summary.orders.failed_this_month == 1
+
+        # The learners registered now, after the summary's month started.
+        assert summary.users.total == 3
+        assert summary.users.new_this_month == 3
+        assert summary.users.active_today == 0
+
+        assert summary.education.total_enrollments == 4
+        assert summary.education.enrollments_this_month == 2
+        assert summary.education.completions_this_month == 1
+        assert summary.education.certificates_this_month == 1
+
+        assert summary.top_packages == []
+        assert summary.top_courses[0].slug == "stats-first-course"
+        assert {(c.slug, c.count) for c in summary.top_courses} == {
+            ("stats-first-course", 2),
+            ("stats-second-course", 1),
+            ("stats-draft-course", 1),
+        }
+
+    def test_returns_zeros_without_data(self, db_session: Session):
+        summary = DashboardService.get_summary(db_session, context=CONTEXT)
+
+        assert summary.revenue.this_month == 0
+        assert summary.revenue.change_percent_month == 0.0
+        assert summary.orders.today == 0
+        assert summary.users.total == 0
+        assert summary.education.total_enrollments == 0
+        assert summary.top_packages == []
+        assert summary.top_courses == []
+
+    def test_runs_kpi_groups_in_sessions_from_the_factory(
+        self, db_session: Session, test_session_local
+    ):
+        opened = []
+
+        def session_factory() -> Session:
+            session = test_session_local()
+            opened.append(session)
+            return session
+
+        summary = DashboardService.get_summary(
+            db_session, session_factory=session_factory, context=CONTEXT
+        )
+
+        assert len(opened) == 6
+        assert summary.orders.today == 0
+        assert summary.top_courses == []
@@ -0,0 +1,72 @@
+"""
+Tests for EducationService - education KPIs and per-course statistics.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.admin.services.statistics import EducationService
+
+MONTH_START = datetime(2025, 3, 1, tzinfo=UTC)
+
+
+class TestEducationKpis:
+    @pytest.mark.usefixtures("seeded_education")
+    def test_counts_seeded_enrollments(self, db_session: Session):
+        kpis = EducationService.get_kpis(db_session, MONTH_START)
+
+        assert kpis.total_enrollments == 4
+        assert kpis.enrollments_this_month == 2
+        assert kpis.completions_this_month == 1
+        assert kpis.certificates_this_month == 1
+        assert kpis.average_completion_rate == 50.0
+
+    def test_returns_zeros_without_enrollments(self, db_session: Session):
+        kpis = EducationService.get_kpis(db_session, MONTH_START)
+
+        assert kpis.total_enrollments == 0
+        assert kpis.enrollments_this_month == 0
+        assert kpis.completions_this_month == 0
+        assert kpis.certificates_this_month == 0
+        assert kpis.average_completion_rate == 0.0
+
+
+class TestEducationStatistics:
+    @pytest.mark.usefixtures("seeded_education")
+    def test_aggregates_seeded_courses(self, db_session: Session):
+        stats = EducationService.get_statistics(db_session)
+
+        # Totals cover every course; the breakdown lists published ones only.
+        assert stats.total_enrollments == 4
+        assert stats.active_learners == 2
+        assert stats.total_completions == 2
+        assert stats.total_certificates == 2
+        assert stats.average_completion_rate == 50.0
+        courses = {course.slug: course for course in stats.courses}
+        assert set(courses) == {"stats-first-course", "stats-second-course"}
+
+        first = courses["stats-first-course"]
+        assert first.total_enrollments == 2
+        assert first.active_learners == 1
+        assert first.completed_count == 1
+        assert first.certificates_issued == 1
+        assert first.average_progress == 40.0
+
+        second = courses["stats-second-course"]
+        assert second.total_enrollments == 1
+        assert second.active_learners == 0
+        assert second.completed_count == 1
+        assert second.certificates_issued == 1
+        assert second.average_progress == 0
+
+    def test_returns_zeros_without_courses(self, db_session: Session):
+        stats = EducationService.get_statistics(db_session)
+
+        assert stats.total_enrollments == 0
+        assert stats.active_learners == 0
+        assert stats.total_completions == 0
+        assert stats.total_certificates == 0
+        assert stats.average_completion_rate == 0.0
+        assert stats.courses == []
@@ -0,0 +1,73 @@
+"""
+Tests for OrderStatisticsService - order KPIs and status breakdowns.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.admin.services.statistics import OrderStatisticsService
+
+TODAY_START = datetime(2025, 3, 4, tzinfo=UTC)
+MONTH_START = datetime(2025, 3, 1, tzinfo=UTC)
+
+
+class TestOrderKpis:
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_counts_seeded_orders(self, db_session: Session):
+        kpis = OrderStatisticsService.get_kpis(db_session, TODAY_START, MONTH_START)
+
+        # The failed order created exactly at midnight counts for today.
+        assert kpis.today == 1
+        assert kpis.pending == 2
+        # Completions count by payment time; the unpaid one is left out.
+        assert kpis.completed_this_month == 2
+        assert kpis.failed_this_month == 1
+
+    def test_returns_zeros_without_orders(self, db_session: Session):
+        kpis = OrderStatisticsService.get_kpis(db_session, TODAY_START, MONTH_START)
+
+        assert kpis.today == 0
+        assert kpis.pending == 0
+        assert kpis.completed_this_month == 0
+        assert kpis.failed_this_month == 0
+
+
+class TestOrderStatistics:
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_breaks_orders_down_by_status(self, db_session: Session):
+        stats = OrderStatisticsService.get_statistics(db_session)
+
+        assert stats.total_orders == 9
+        assert {s.status: s.count for s in stats.by_status} == {
+            "pending": 2,
+            "completed": 5,
+            "failed": 2,
+        }
+        assert [(p.provider, p.count, p.revenue) for p in stats.by_provider] == [
+            ("stripe", 5, 28500)
+        ]
+        assert len(stats.recent_orders) == 9
+
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_filters_by_creation_time_inclusively(self, db_session: Session):
+        stats = OrderStatisticsService.get_statistics(
+            db_session, datetime(2025, 3, 2, tzinfo=UTC), datetime(2025, 3, 4, tzinfo=UTC)
+        )
+
+        # Orders created exactly at either end are included.
+        assert stats.total_orders == 3
+        assert {s.status: s.count for s in stats.by_status} == {
+            "pending": 1,
+            "completed": 1,
+            "failed": 1,
+        }
+
+    def test_returns_empty_breakdowns_without_orders(self, db_session: Session):
+        stats = OrderStatisticsService.get_statistics(db_session)
+
+        assert stats.total_orders == 0
+        assert stats.by_status == []
+        assert stats.by_provider == []
+        assert stats.recent_orders == []
@@ -0,0 +1,145 @@
+"""
+Tests for RevenueService - revenue summaries and chart points.
+"""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.admin.schemas.admin_statistics import Granularity
+from app.admin.services.statistics import RevenueService
+from tests.utils.factories import create_order_factory
+
+PERIOD_START = datetime(2025, 3, 1, tzinfo=UTC)
+PERIOD_END = datetime(2025, 3, 4, 23, 59, 59, 999999, tzinfo=UTC)
+
+
+class TestRevenueStatistics:
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_summarises_completed_orders_in_period(self, db_session: Session):
+        stats = RevenueService.get_statistics(db_session, PERIOD_START, PERIOD_END)
+
+        assert stats.current_period.total == 17500
+        assert stats.current_period.orders_count == 3
+        assert stats.current_period.average_order_value == 5833
+        assert stats.previous_period is not None
+        assert stats.previous_period.total == 4000
+        assert stats.previous_period.orders_count == 1
+        assert stats.change_percent == 337.5
+
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_daily_points_cover_every_day(self, db_session: Session):
+        stats = RevenueService.get_statistics(db_session, PERIOD_START, PERIOD_END)
+
+        assert [(p.date, p.revenue, p.orders_count) for p in stats.data_points] == [
+            ("2025-03-01", 10000, 1),
+            ("2025-03-02", 5000, 1),
+            ("2025-03-03", 0, 0),
+            ("2025-03-04", 2500, 1),
+        ]
+
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_weekly_and_monthly_points(self, db_session: Session):
+        start = datetime(2025, 2, 20, tzinfo=UTC)
+
+        weekly = RevenueService.get_statistics(
+            db_session, start, PERIOD_END, Granularity.WEEKLY, compare_previous=False
+        )
+        monthly = RevenueService.get_statistics(
+            db_session, start, PERIOD_END, Granularity.MONTHLY, compare_previous=False
+        )
+
+        assert weekly.previous_period is None
+        assert weekly.change_percent is None
+        assert weekly.current_period.total == 28500
+        assert [(p.date, p.revenue, p.orders_count) for p in weekly.data_points] == [
+            ("Week 1", 7000, 1),
+            ("Week 2", 21500, 4),
+        ]
+        assert [(p.date, p.revenue, p.orders_count) for p in monthly.data_points] == [
+            ("2025-02", 11000, 2),
+            ("2025-03", 17500, 3),
+        ]
+
+    def test_period_includes_both_boundaries(self, db_session: Session):
+        one_microsecond = timedelta(microseconds=1)
+        for total, paid_at in [
+            (1000, PERIOD_START),
+            (2000, PERIOD_END),
+            (4000, PERIOD_START - one_microsecond),
+            (8000, PERIOD_END + one_microsecond),
+        ]:
+            create_order_factory(db_session, total=total, payment_completed_at=paid_at)
+
+        revenue = RevenueService.get_revenue_for_period(db_session, PERIOD_START, PERIOD_END)
+
+        assert revenue == (3000, 2)
+
+    def test_returns_zeros_for_an_empty_period(self, db_session: Session):
+        db_session.execute(text("REFRESH MATERIALIZED VIEW mv_daily_revenue"))
+
+        stats = RevenueService.get_statistics(db_session, PERIOD_START, PERIOD_END)
+
+        assert stats.current_period.total == 0
+        assert stats.current_period.orders_count == 0
+        assert stats.current_period.average_order_value == 0
+        assert stats.previous_period is not None
+        assert stats.previous_period.total == 0
+        assert stats.change_percent == 0.0
+        assert len(stats.data_points) == 4
+        assert all(p.revenue == 0 and p.orders_count == 0 for p in stats.data_points)
+
+
+def chart(stats) -> list[tuple[str, int, int]]:
+    return [(p.date, p.revenue, p.orders_count) for p in stats.data_points]
+
+
+class TestRevenueChartMatchesSummary:
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_partial_first_day_counts_only_orders_in_the_period(self, db_session: Session):
+        stats = RevenueService.get_statistics(
+            db_session, datetime(2025, 3, 1, 10, 30, tzinfo=UTC), PERIOD_END
+        )
+
+        assert stats.current_period.total == 7500
+        assert chart(stats) == [
+            ("2025-03-01", 0, 0),
+            ("2025-03-02", 5000, 1),
+            ("2025-03-03", 0, 0),
+            ("2025-03-04", 2500, 1),
+        ]
+
+    @pytest.mark.usefixtures("seeded_orders")
+    def test_buckets_are_utc_days_for_offset_boundaries(self, db_session: Session):
+        warsaw_winter = timezone(timedelta(hours=1))
+
+        # 2025-03-01 23:00 to 2025-03-04 22:59:59.999999 UTC.
+        stats = RevenueService.get_statistics(
+            db_session,
+            datetime(2025, 3, 2, tzinfo=warsaw_winter),
+            datetime(2025, 3, 4, 23, 59, 59, 999999, tzinfo=warsaw_winter),
+        )
+
+        assert stats.current_period.total == 7500
+        assert chart(stats) == [
+            ("2025-03-01", 0, 0),
+            ("2025-03-02", 5000, 1),
+            ("2025-03-03", 0, 0),
+            ("2025-03-04", 2500, 1),
+        ]
+
+    def test_includes_orders_paid_since_the_last_refresh(self, db_session: Session):
+        now = datetime.now(UTC)
+        two_days_ago = (now - timedelta(days=2)).replace(hour=12, minute=0, second=0, microsecond=0)
+        create_order_factory(db_session, total=3000, payment_completed_at=two_days_ago)
+        db_session.execute(text("REFRESH MATERIALIZED VIEW mv_daily_revenue"))
+        create_order_factory(db_session, total=5000, payment_completed_at=now)
+
+        stats = RevenueService.get_statistics(
+            db_session, two_days_ago.replace(hour=0), now, compare_previous=False
+        )
+
+        assert stats.current_period.total == 8000
+        assert [p.revenue for p in stats.data_points] == [3000, 0, 5000]
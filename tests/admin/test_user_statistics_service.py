@@ -0,0 +1,129 @@
+"""
+Tests for UserStatisticsService - user KPIs and daily user lists.
+"""
+
+from datetime import UTC, date, datetime
+
+from sqlalchemy.orm import Session
+
+from app.admin.services.statistics import UserStatisticsService
+from app.auth.models.user import User
+from app.auth.models.user_daily_activity import UserDailyActivity
+from tests.utils.factories import create_user_factory
+
+DAY = date(2025, 3, 10)
+
+# A Wednesday; the week starts on Monday the 10th.
+TODAY_START = datetime(2025, 3, 12, tzinfo=UTC)
+WEEK_START = datetime(2025, 3, 10, tzinfo=UTC)
+MONTH_START = datetime(2025, 3, 1, tzinfo=UTC)
+
+
+def record_activity(db: Session, user: User, day: date, last_seen_at: datetime) -> None:
+    """Record that ``user`` was active on ``day``, last at ``last_seen_at``."""
+    db.add(UserDailyActivity(user_id=user.id, date=day, last_seen_at=last_seen_at))
+    db.flush()
+
+
+class TestUserKpis:
+    def test_counts_seeded_users_and_activity(self, db_session: Session):
+        before_month = create_user_factory(db_session, created_at=datetime(2025, 2, 20, tzinfo=UTC))
+        at_month_start = create_user_factory(db_session, created_at=MONTH_START)
+        before_midnight = create_user_factory(
+            db_session, created_at=datetime(2025, 2, 28, 23, 59, 59, tzinfo=UTC)
+        )
+        create_user_factory(
+            db_session, is_active=False, created_at=datetime(2025, 3, 11, tzinfo=UTC)
+        )
+
+        record_activity(db_session, before_month, date(2025, 3, 11), TODAY_START)
+        record_activity(db_session, before_month, date(2025, 3, 12), TODAY_START)
+        record_activity(db_session, at_month_start, date(2025, 3, 10), WEEK_START)
+        record_activity(db_session, before_midnight, date(2025, 3, 9), WEEK_START)
+
+        kpis = UserStatisticsService.get_kpis(db_session, TODAY_START, WEEK_START, MONTH_START)
+
+        # The total counts active accounts; new users are counted whatever their state.
+        assert kpis.total == 3
+        assert kpis.new_this_month == 2
+        assert kpis.active_today == 1
+        assert kpis.active_this_week == 2
+
+    def test_returns_zeros_without_users(self, db_session: Session):
+        kpis = UserStatisticsService.get_kpis(db_session, TODAY_START, WEEK_START, MONTH_START)
+
+        assert kpis.total == 0
+        assert kpis.new_this_month == 0
+        assert kpis.active_today == 0
+        assert kpis.active_this_week == 0
+
+
+class TestDailyDetails:
+    def test_lists_users_active_on_the_day(self, db_session: Session):
+        active = create_user_factory(db_session, created_at=datetime(2025, 1, 5, tzinfo=UTC))
+        other_day = create_user_factory(db_session, created_at=datetime(2025, 1, 6, tzinfo=UTC))
+        last_seen = datetime(2025, 3, 10, 17, 30, tzinfo=UTC)
+        record_activity(db_session, active, DAY, last_seen)
+        record_activity(db_session, other_day, date(2025, 3, 11), last_seen)
+
+        details = UserStatisticsService.get_daily_details(db_session, "2025-03-10", "active")
+
+        assert details.total == 1
+        assert [u.id for u in details.users] == [str(active.id)]
+        assert details.users[0].last_activity == last_seen
+        assert details.next_cursor is None
+
+    def test_lists_users_registered_on_the_day(self, db_session: Session):
+        at_midnight = create_user_factory(db_session, created_at=datetime(2025, 3, 10, tzinfo=UTC))
+        late = create_user_factory(
+            db_session, created_at=datetime(2025, 3, 10, 23, 59, 59, tzinfo=UTC)
+        )
+        create_user_factory(db_session, created_at=datetime(2025, 3, 9, 23, 59, 59, tzinfo=UTC))
+        create_user_factory(db_session, created_at=datetime(2025, 3, 11, tzinfo=UTC))
+
+        details = UserStatisticsService.get_daily_details(db_session, "2025-03-10", "new")
+
+        assert details.total == 2
+        assert [u.id for u in details.users] == [str(late.id), str(at_midnight.id)]
+        assert all(u.last_activity is None for u in details.users)
+
+    def test_returns_empty_page_for_a_day_without_users(self, db_session: Session):
+        create_user_factory(db_session, created_at=datetime(2025, 3, 9, tzinfo=UTC))
+
+        for user_type in ("active", "new"):
+            details = UserStatisticsService.get_daily_details(db_session, "2025-03-10", user_type)
+
+            assert details.total == 0
+            assert details.users == []
+            assert details.next_cursor is None
+
+
+class TestDailyDetailsPagination:
+    def test_active_pages_stay_stable_when_last_seen_changes(self, db_session: Session):
+        users = [
+            create_user_factory(db_session, created_at=datetime(2025, 1, day, tzinfo=UTC))
+            for day in (1, 2, 3)
+        ]
+        for hour, user in enumerate(users, start=8):
+            record_activity(db_session, user, DAY, datetime(2025, 3, 10, hour, tzinfo=UTC))
+
+        first = UserStatisticsService.get_daily_details(db_session, "2025-03-10", "active", limit=2)
+
+        # The user left for the second page is seen again before it is fetched.
+        activity = (
+            db_session.query(UserDailyActivity)
+            .filter(UserDailyActivity.user_id == users[0].id)
+            .one()
+        )
+        activity.last_seen_at = datetime(2025, 3, 10, 23, tzinfo=UTC)
+        db_session.flush()
+
+        second = UserStatisticsService.get_daily_details(
+            db_session, "2025-03-10", "active", limit=2, cursor=first.next_cursor
+        )
+
+        assert first.total == 3
+        assert second.total == 3
+        assert [u.id for u in first.users] == [str(users[2].id), str(users[1].id)]
+        assert [u.id for u in second.users] == [str(users[0].id)]
+        assert second.next_cursor is None
@@ -19,6 +19,7 @@ from testcontainers.core.waiting_utils import wait_for_logs  # noqa: E402
 from testcontainers.redis import RedisContainer  # noqa: E402
 
 from app.core import redis as redis_module  # noqa: E402
+from app.core.cache import clear_local_cache  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.core.security import (  # noqa: E402
     create_access_token,
@@ -123,6 +124,7 @@ async def test_app(db_session, redis_client):
     app.dependency_overrides[get_db] = override_get_db
 
     redis_module.redis_client = redis_client
+    clear_local_cache()
 
     with patch(
         "app.auth.services.email_service.ConsoleEmailService.send_email",
@@ -0,0 +1,81 @@
+import pytest
+from pydantic import BaseModel
+
+from app.core import redis as redis_module
+from app.core.cache import cache_key, clear_local_cache, get_or_set_model, invalidate_namespace
+
+
+class Summary(BaseModel):
+    total: int
+
+
+@pytest.fixture(autouse=True)
+def empty_local_cache():
+    clear_local_cache()
+
+
+def test_cache_key_joins_namespace_and_parts():
+    assert cache_key("rankings", 10) == "cache:rankings:10"
+    assert cache_key("dashboard") == "cache:dashboard"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_model_computes_once(monkeypatch, redis_client):
+    monkeypatch.setattr(redis_module, "redis_client", redis_client)
+    calls = []
+
+    def compute() -> Summary:
+        calls.append(1)
+        return Summary(total=len(calls))
+
+    first = await get_or_set_model("cache:test", Summary, 60, compute)
+    second = await get_or_set_model("cache:test", Summary, 60, compute)
+
+    assert first == second == Summary(total=1)
+    assert len(calls) == 1
+    assert 0 < await redis_client.ttl("cache:test") <= 60
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_model_without_redis_computes_every_time(monkeypatch):
+    monkeypatch.setattr(redis_module, "redis_client", None)
+    calls = []
+
+    def compute() -> Summary:
+        calls.append(1)
+        return Summary(total=len(calls))
+
+    await get_or_set_model("cache:test", Summary, 60, compute)
+    clear_local_cache()
+    result = await get_or_set_model("cache:test", Summary, 60, compute)
+
+    assert result == Summary(total=2)
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_model_serves_repeats_from_memory(monkeypatch):
+    monkeypatch.setattr(redis_module, "redis_client", None)
+    calls = []
+
+    def compute() -> Summary:
+        calls.append(1)
+        return Summary(total=len(calls))
+
+    first = await get_or_set_model("cache:test", Summary, 60, compute)
+    second = await get_or_set_model("cache:test", Summary, 60, compute)
+    await invalidate_namespace("test")
+    third = await get_or_set_model("cache:test", Summary, 60, compute)
+
+    assert first is second
+    assert third == Summary(total=2)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_namespace_deletes_only_that_namespace(monkeypatch, redis_client):
+    monkeypatch.setattr(redis_module, "redis_client", redis_client)
+    for key in ("cache:rankings", "cache:rankings:5", "cache:rankings:10", "cache:dashboard"):
+        await redis_client.set(key, "{}")
+
+    await invalidate_namespace("rankings")
+
+    assert await redis_client.keys("cache:*") == ["cache:dashboard"]
@@ -0,0 +1,54 @@
+import json
+from datetime import UTC, datetime
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.responses import PydanticJSONResponse, conditional_json_response
+
+
+class Summary(BaseModel):
+    total: int
+
+
+def test_pydantic_json_response_matches_json_response():
+    content = {"name": "Zażółć", "total": 12, "items": [{"at": "2026-01-01T00:00:00Z"}]}
+
+    body = PydanticJSONResponse(content).body
+
+    assert body == JSONResponse(content).body
+    assert json.loads(body) == content
+
+
+def test_pydantic_json_response_encodes_datetimes():
+    body = PydanticJSONResponse({"at": datetime(2026, 1, 1, tzinfo=UTC)}).body
+
+    assert json.loads(body) == {"at": "2026-01-01T00:00:00Z"}
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_conditional_json_response_sets_etag_and_cache_control():
+    response = conditional_json_response(_request(), Summary(total=1), max_age=30)
+
+    assert response.status_code == 200
+    assert json.loads(response.body) == {"total": 1}
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, max-age=30"
+
+
+def test_conditional_json_response_returns_304_for_matching_etag():
+    etag = conditional_json_response(_request(), Summary(total=1), 30).headers["etag"]
+
+    matching = conditional_json_response(
+        _request({"If-None-Match": f'"other", W/{etag}'}), Summary(total=1), 30
+    )
+    changed = conditional_json_response(_request({"If-None-Match": etag}), Summary(total=2), 30)
+
+    assert matching.status_code == 304
+    assert matching.body == b""
+    assert changed.status_code == 200
@@ -0,0 +1,26 @@
+import time
+
+from app.core.uuid_utils import uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_time_ordered():
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first < second
+
+
+def test_uuid7_embeds_millisecond_timestamp():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after
@@ -0,0 +1,154 @@
+"""
+Tests for the Alembic migration helpers - generated SQL and batched updates.
+"""
+
+import io
+
+import pytest
+from sqlalchemy import text
+
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from app.db.migration_helpers import (
+    ConcurrentIndex,
+    batched_update,
+    create_index_concurrently,
+    create_indexes_concurrently,
+)
+
+TABLE = "_migration_helper_rows"
+
+
+@pytest.fixture
+def offline_sql():
+    """Run helpers as ``alembic upgrade --sql`` does and return the emitted script."""
+    buffer = io.StringIO()
+    context = MigrationContext.configure(
+        dialect_name="postgresql", opts={"as_sql": True, "output_buffer": buffer}
+    )
+    with Operations.context(context):
+        yield buffer
+
+
+@pytest.fixture
+def migration_connection(test_engine):
+    """A migration context on a committed scratch table of 25 rows, 10 of them 'old'."""
+    with test_engine.connect() as conn:
+        conn.execute(text(f"CREATE TABLE {TABLE} (id integer PRIMARY KEY, category text)"))
+        conn.execute(
+            text(
+                f"INSERT INTO {TABLE} SELECT n, CASE WHEN n % 5 < 2 THEN 'old' ELSE 'other' END "
+                f"FROM generate_series(1, 25) AS n"
+            )
+        )
+        conn.commit()
+        try:
+            with Operations.context(MigrationContext.configure(conn)):
+                yield conn
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP TABLE {TABLE}"))
+            conn.commit()
+
+
+class TestConcurrentIndexSql:
+    def test_plain_index(self):
+        index = ConcurrentIndex("ix_orders_email", "orders", ["email"])
+
+        assert index.create_sql() == "CREATE INDEX CONCURRENTLY ix_orders_email ON orders (email)"
+
+    def test_all_options(self):
+        index = ConcurrentIndex(
+            "ix_orders_paid",
+            "orders",
+            ["payment_completed_at", "id"],
+            unique=True,
+            include=["total"],
+            where="status = 'completed'",
+            using="btree",
+            with_params={"fillfactor": 90},
+            if_not_exists=True,
+        )
+
+        assert index.create_sql() == (
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_paid "
+            "ON orders USING btree (payment_completed_at, id) INCLUDE (total) "
+            "WITH (fillfactor = 90) WHERE status = 'completed'"
+        )
+
+    def test_parent_of_partitioned_table(self):
+        index = ConcurrentIndex("ix_events_day", "events", ["day"])
+
+        assert (
+            index.create_sql(concurrently=False, only=True)
+            == "CREATE INDEX ix_events_day ON ONLY events (day)"
+        )
+
+
+class TestOfflineSql:
+    def test_create_index_concurrently_runs_outside_the_transaction(self, offline_sql):
+        create_index_concurrently("ix_orders_email", "orders", ["email"], if_not_exists=True)
+
+        script = offline_sql.getvalue()
+        assert "COMMIT;" in script
+        assert (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_orders_email ON orders (email);" in script
+        )
+        assert script.index("COMMIT;") < script.index("CREATE INDEX")
+
+    def test_create_indexes_concurrently_emits_each_index_in_order(self, offline_sql):
+        create_indexes_concurrently(
+            [
+                ConcurrentIndex("ix_orders_email", "orders", ["email"]),
+                ConcurrentIndex("ix_users_name", "users", ["name"]),
+            ]
+        )
+
+        script = offline_sql.getvalue()
+        first = script.index("CREATE INDEX CONCURRENTLY ix_orders_email ON orders (email);")
+        second = script.index("CREATE INDEX CONCURRENTLY ix_users_name ON users (name);")
+        assert first < second
+
+
+class TestBatchedUpdate:
+    def test_updates_matching_rows_across_batches(self, migration_connection):
+        updated = batched_update(
+            TABLE, "category = 'new'", where_sql="category = 'old'", batch_size=4
+        )
+
+        counts = dict(
+            migration_connection.execute(
+                text(f"SELECT category, count(*) FROM {TABLE} GROUP BY category")
+            ).all()
+        )
+        assert updated == 10
+        assert counts == {"new": 10, "other": 15}
+
+    def test_updates_nothing_when_no_row_matches(self, migration_connection):
+        updated = batched_update(TABLE, "category = 'new'", where_sql="category = 'missing'")
+
+        assert updated == 0
+
+
+class TestCreateIndexesConcurrently:
+    def test_builds_every_index(self, migration_connection):
+        create_indexes_concurrently(
+            [
+                ConcurrentIndex("ix_helper_rows_category", TABLE, ["category"]),
+                ConcurrentIndex("ix_helper_rows_category_id", TABLE, ["category", "id"]),
+            ]
+        )
+
+        indexes = (
+            migration_connection.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = :table ORDER BY 1"),
+                {"table": TABLE},
+            )
+            .scalars()
+            .all()
+        )
+        assert indexes == [
+            f"{TABLE}_pkey",
+            "ix_helper_rows_category",
+            "ix_helper_rows_category_id",
+        ]
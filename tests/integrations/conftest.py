@@ -12,7 +12,6 @@ from app.courses.models.course import Course, Lesson, Module
 from app.integrations.models import (
     Integration,
     IntegrationProposal,
-    IntegrationType,
     LessonIntegration,
 )
 
@@ -45,24 +44,12 @@ def create_integration(
         video_tutorial_url=video_tutorial_url,
         is_published=is_published,
         sort_order=sort_order,
+        types=integration_types or [],
         created_by_id=created_by_id,
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
     db_session.add(integration)
-    db_session.flush()
-
-    # Add integration types
-    if integration_types:
-        for type_name in integration_types:
-            db_session.add(
-                IntegrationType(
-                    id=uuid.uuid4(),
-                    integration_id=integration.id,
-                    type_name=type_name,
-                )
-            )
-
     db_session.commit()
     db_session.refresh(integration)
     return integration
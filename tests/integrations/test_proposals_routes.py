@@ -5,6 +5,8 @@ Tests for integration proposals routes.
 import pytest
 from httpx import AsyncClient
 
+from tests.integrations.conftest import create_integration_proposal
+
 
 class TestSubmitProposal:
     """Tests for POST /api/v1/integration-proposals"""
@@ -198,6 +200,30 @@ class TestAdminListProposals:
         assert proposal["name"] == test_proposal.name
         assert "submitted_by_name" in proposal
 
+    @pytest.mark.asyncio
+    async def test_admin_list_filtered_by_status(
+        self,
+        test_client: AsyncClient,
+        test_admin_token,
+        test_proposal,
+        db_session,
+        test_user,
+    ):
+        """Test admin can list only proposals with a given status."""
+        rejected = create_integration_proposal(
+            db_session, submitted_by_id=test_user.id, status="rejected"
+        )
+
+        response = await test_client.get(
+            "/api/v1/admin/integration-proposals?status=pending",
+            cookies={"access_token": test_admin_token},
+        )
+
+        assert response.status_code == 200
+        ids = {p["id"] for p in response.json()}
+        assert str(test_proposal.id) in ids
+        assert str(rejected.id) not in ids
+
     @pytest.mark.asyncio
     async def test_admin_list_requires_admin(
         self,
@@ -0,0 +1,85 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from alembic.config import Config as AlembicConfig
+from alembic.script import ScriptDirectory
+from tests.utils.helpers import set_access_token_cookie
+
+
+@pytest.fixture
+def alembic_script():
+    project_root = Path(__file__).resolve().parent.parent
+    config = AlembicConfig(str(project_root / "alembic.ini"))
+    config.set_main_option("script_location", str(project_root / "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+def stamp(db_session, revision):
+    db_session.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+    db_session.execute(
+        text("INSERT INTO alembic_version (version_num) VALUES (:revision)"),
+        {"revision": revision},
+    )
+
+
+class TestMigrationsHealthEndpoint:
+    @pytest.mark.asyncio
+    async def test_should_report_up_to_date_when_at_head(
+        self, test_client, test_admin_token, db_session, alembic_script
+    ):
+        head = alembic_script.get_current_head()
+        stamp(db_session, head)
+        set_access_token_cookie(test_client, test_admin_token)
+
+        response = await test_client.get("/health/migrations")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "up_to_date",
+            "current": head,
+            "head": head,
+            "pending": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_list_pending_revisions_when_behind(
+        self, test_client, test_admin_token, db_session, alembic_script
+    ):
+        head_revision = alembic_script.get_revision("head")
+        previous = alembic_script.get_revision(head_revision.down_revision)
+        stamp(db_session, previous.down_revision)
+        set_access_token_cookie(test_client, test_admin_token)
+
+        response = await test_client.get("/health/migrations")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "pending",
+            "current": previous.down_revision,
+            "head": head_revision.revision,
+            "pending": [head_revision.revision, previous.revision],
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_not_read_revision_scripts_per_request(
+        self, test_client, test_admin_token, db_session, alembic_script
+    ):
+        stamp(db_session, alembic_script.get_current_head())
+        set_access_token_cookie(test_client, test_admin_token)
+
+        with patch("app.main.ScriptDirectory.from_config") as from_config:
+            response = await test_client.get("/health/migrations")
+
+        assert response.status_code == 200
+        from_config.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_return_403_when_not_admin(self, test_client, test_user_token):
+        set_access_token_cookie(test_client, test_user_token)
+
+        response = await test_client.get("/health/migrations")
+
+        assert response.status_code == 403
@@ -6,6 +6,8 @@ from sqlalchemy.orm import Session
 
 from app.auth.models.user import User
 from app.core.security import get_password_hash
+from app.courses.models import Course, Lesson, Module
+from app.packages.models.order import Order, OrderStatus, PaymentProvider
 
 fake = Faker()
 
@@ -17,7 +19,9 @@ def create_user_factory(
     name: str | None = None,
     role: str = "paid",
     is_active: bool = True,
+    created_at: datetime | None = None,
 ) -> User:
+    created_at = created_at or datetime.utcnow()
     user = User(
         id=uuid.uuid4(),
         email=email or fake.email(),
@@ -25,8 +29,8 @@ def create_user_factory(
         name=name or fake.name(),
         role=role,
         is_active=is_active,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=created_at,
+        updated_at=created_at,
     )
 
     db_session.add(user)
@@ -34,3 +38,73 @@ def create_user_factory(
     db_session.refresh(user)
 
     return user
+
+
+def create_order_factory(
+    db_session: Session,
+    status: OrderStatus = OrderStatus.COMPLETED,
+    total: int = 9900,
+    created_at: datetime | None = None,
+    payment_completed_at: datetime | None = None,
+) -> Order:
+    created_at = created_at or datetime.utcnow()
+    order = Order(
+        id=uuid.uuid4(),
+        order_number=f"ORD-TEST-{uuid.uuid4().hex[:8].upper()}",
+        email=fake.email(),
+        name=fake.name(),
+        status=status,
+        subtotal=total,
+        total=total,
+        currency="PLN",
+        payment_provider=PaymentProvider.STRIPE,
+        payment_completed_at=payment_completed_at,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+    db_session.add(order)
+    db_session.commit()
+    db_session.refresh(order)
+
+    return order
+
+
+def create_course_factory(
+    db_session: Session,
+    slug: str | None = None,
+    is_published: bool = True,
+) -> Course:
+    """Create a course with one module holding one lesson."""
+    slug = slug or f"test-course-{uuid.uuid4().hex[:8]}"
+    course = Course(
+        slug=slug,
+        title=slug.replace("-", " ").title(),
+        description=fake.sentence(),
+        difficulty="beginner",
+        estimated_hours=5,
+        is_published=is_published,
+        is_featured=False,
+        category="test",
+        sort_order=0,
+    )
+    db_session.add(course)
+    db_session.flush()
+
+    module = Module(course_id=course.id, title="Module 1", sort_order=0)
+    db_session.add(module)
+    db_session.flush()
+
+    db_session.add(
+        Lesson(
+            module_id=module.id,
+            title="Lesson 1",
+            mux_playback_id=f"mux_{slug}",
+            duration_seconds=600,
+            sort_order=0,
+        )
+    )
+    db_session.commit()
+    db_session.refresh(course)
+
+    return course